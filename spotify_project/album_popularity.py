@@ -0,0 +1,106 @@
+# album_popularity.py — 아티스트 앨범 인기도 엔진
+# 앨범마다 album_tracks + tracks를 따로 부르던 방식 대신,
+#   1) artist_albums 페이지네이션 (종료 조건 보장)
+#   2) sp.albums 20개 단위 → 앨범에 포함된 트랙 목록을 한 번에
+#   3) sp.tracks 50개 단위 → 트랙 popularity 일괄 조회 (스레드 풀)
+# 로 호출 수를 (앨범 수/20 + 트랙 수/50) 수준으로 줄이고, 집계는 groupby 한 번으로 계산한다.
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+ALBUM_GROUPS = "album,single,compilation"
+PAGE = 50          # artist_albums / tracks 최대 배치
+ALBUM_BATCH = 20   # sp.albums 최대 배치
+WORKERS = 4
+
+ALBUM_COLS = ["Artist Name", "Album Name", "Album Type", "Release Date", "Album Popularity",
+              "Mean Popularity", "Weighted Popularity", "Tracks"]
+
+
+def batched(xs, n):
+    for i in range(0, len(xs), n):
+        yield xs[i:i+n]
+
+
+def fetch_artist_albums(sp, artist_id: str, groups: str = ALBUM_GROUPS) -> list[dict]:
+    """아티스트의 모든 앨범(simplified) 목록. 빈 페이지/마지막 페이지/next 없음 중 하나면 종료."""
+    albums, offset = [], 0
+    while True:
+        res = sp.artist_albums(artist_id, include_groups=groups, limit=PAGE, offset=offset)
+        items = res.get("items", [])
+        albums.extend(items)
+        offset += len(items)
+        if not items or len(items) < PAGE or not res.get("next"):
+            break
+    return list({a["id"]: a for a in albums if a.get("id")}.values())
+
+
+def _album_tracks(sp, album: dict) -> list[dict]:
+    """full album 객체에 포함된 트랙 목록 (50곡 초과 앨범은 next로 이어서)."""
+    page = album.get("tracks") or {}
+    items = list(page.get("items") or [])
+    while page.get("next"):
+        page = sp.next(page) or {}
+        items.extend(page.get("items") or [])
+    return items
+
+
+def hydrate_tracks(sp, albums: list[dict]) -> pd.DataFrame:
+    """앨범 목록 → 트랙 단위 프레임 (album_id, track_id, disc/track_number, popularity)."""
+    album_ids = [a["id"] for a in albums]
+    rows = []
+    for chunk in batched(album_ids, ALBUM_BATCH):
+        for alb in sp.albums(chunk).get("albums") or []:
+            if not alb:
+                continue
+            for t in _album_tracks(sp, alb):
+                if t.get("id"):
+                    rows.append((alb["id"], t["id"], t.get("disc_number") or 1, t.get("track_number") or 1))
+    tracks = pd.DataFrame(rows, columns=["album_id", "track_id", "disc_number", "track_number"])
+    if tracks.empty:
+        return tracks.assign(popularity=pd.Series(dtype=float))
+
+    ids = tracks["track_id"].drop_duplicates().tolist()
+    with ThreadPoolExecutor(max_workers=WORKERS) as ex:
+        pages = ex.map(lambda c: sp.tracks(c).get("tracks") or [], list(batched(ids, PAGE)))
+        pop = {t["id"]: t.get("popularity") for page in pages for t in page if t}
+    tracks["popularity"] = tracks["track_id"].map(pop).astype(float)
+    return tracks
+
+
+def aggregate_albums(albums: list[dict], tracks: pd.DataFrame, artist_name: str) -> pd.DataFrame:
+    """앨범별 max / mean / 트랙 순번 가중 평균 / 첫 곡 인기도를 한 번의 groupby로 계산."""
+    meta = pd.DataFrame({
+        "album_id": [a["id"] for a in albums],
+        "Album Name": [a.get("name") for a in albums],
+        "Album Type": [a.get("album_type") for a in albums],
+        "Release Date": [a.get("release_date") for a in albums],
+    })
+    t = tracks.dropna(subset=["popularity"]).sort_values(["album_id", "disc_number", "track_number"])
+    # 앞 번호 트랙(타이틀/리드곡)에 더 큰 가중치: w = 1 / track_number
+    t = t.assign(w=1.0 / t["track_number"].clip(lower=1))
+    t = t.assign(wp=t["w"] * t["popularity"])
+    g = t.groupby("album_id")
+    agg = pd.DataFrame({
+        "max_pop": g["popularity"].max(),
+        "first_pop": g["popularity"].first(),
+        "Mean Popularity": g["popularity"].mean().round(1),
+        "Weighted Popularity": (g["wp"].sum() / g["w"].sum()).round(1),
+        "Tracks": g.size(),
+    })
+    df = meta.merge(agg, left_on="album_id", right_index=True, how="inner")
+    # 싱글은 첫 트랙, 정규/모음집은 가장 인기 높은 곡의 popularity (기존 정의 유지)
+    df["Album Popularity"] = np.where(df["Album Type"].eq("single"), df["first_pop"], df["max_pop"]).astype(int)
+    df["Artist Name"] = artist_name
+    df = df.drop_duplicates(subset=["Album Name"])
+    return df.sort_values("Release Date").reset_index(drop=True)[ALBUM_COLS]
+
+
+def album_popularity(sp, artist_id: str, artist_name: str) -> pd.DataFrame:
+    albums = fetch_artist_albums(sp, artist_id)
+    if not albums:
+        return pd.DataFrame(columns=ALBUM_COLS)
+    return aggregate_albums(albums, hydrate_tracks(sp, albums), artist_name)
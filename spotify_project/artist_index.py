@@ -0,0 +1,197 @@
+# artist_index.py — 아티스트 이름 → ID 로컬 해석 인덱스
+# 매 요청마다 sp.search(type="artist")를 부르는 대신,
+#   1) 정규화 이름 정확 일치
+#   2) 별칭 테이블 ("아이유" → "IU", "방탄소년단" → "BTS" ...)
+# 로 로컬에서 먼저 찾고, 못 찾을 때만 API를 호출한다 (찾은 결과는 입력 이름으로 기록 → 같은 오타는 다음부터 로컬).
+#   3) 트라이그램 후보 + 편집거리(오타 허용)는 정답으로 쓰지 않는다 — "IVY"→IVE, "NCT 123"→NCT 127처럼
+#      서로 다른 아티스트가 가까운 이름을 갖기 때문. API가 아무것도 못 찾았을 때의 대체값으로만 쓰고,
+#      그때도 충분히 긴 이름(FUZZY_MIN_LEN)이면서 최선 후보가 하나뿐일 때만.
+# 시드: 수집기(spotify_collector.py)의 ARTISTS, 큐레이션 CSV의 artist/artist_id, 이전 검색 결과(result_store).
+from __future__ import annotations
+
+import ast
+import os
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Optional
+
+import pandas as pd
+
+import result_store
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+COLLECTOR_PATH = os.path.join(BASE_DIR, "spotify_collector.py")
+CURATED_PATH = os.path.join(BASE_DIR, "data", "kpop_2010_2025_curated.csv")
+
+STORE_NS = "artist_resolve"
+FUZZY_MIN_LEN = 5      # 이보다 짧은 이름은 편집거리 1도 다른 아티스트 (TX/TXT, EXIT/EXID)
+
+# 한글/영문 표기, 약칭 → 대표 이름 (대표 이름은 인덱스나 API 검색어로 사용)
+ALIASES = {
+    "아이유": "IU", "이지은": "IU",
+    "방탄소년단": "BTS", "방탄": "BTS", "Bangtan Boys": "BTS",
+    "블랙핑크": "BLACKPINK", "블핑": "BLACKPINK",
+    "빅뱅": "BIGBANG", "Big Bang": "BIGBANG",
+    "뉴진스": "NewJeans", "세븐틴": "SEVENTEEN", "트와이스": "TWICE",
+    "엔시티": "NCT", "엑소": "EXO", "아이브": "IVE", "르세라핌": "LE SSERAFIM",
+    "스트레이키즈": "Stray Kids", "스키즈": "Stray Kids", "에이티즈": "ATEEZ",
+    "투모로우바이투게더": "TXT", "투바투": "TXT", "엔하이픈": "ENHYPEN", "있지": "ITZY",
+    "에스파": "aespa", "레드벨벳": "Red Velvet", "여자아이들": "(G)I-DLE", "아이들": "(G)I-DLE",
+    "트레저": "TREASURE", "프로미스나인": "fromis_9", "스테이씨": "STAYC", "아일릿": "ILLIT",
+    "보이넥스트도어": "BOYNEXTDOOR", "제로베이스원": "ZEROBASEONE", "키스오브라이프": "KISS OF LIFE",
+    "라이즈": "RIIZE", "샤이니": "SHINee", "소녀시대": "Girls' Generation", "SNSD": "Girls' Generation",
+    "슈퍼주니어": "Super Junior", "몬스타엑스": "MONSTA X", "마마무": "MAMAMOO",
+    "선미": "Sunmi", "태양": "TAEYANG", "태민": "TAEMIN", "제니": "JENNIE", "지수": "JISOO",
+    "로제": "ROSÉ", "리사": "LISA", "정국": "Jung Kook", "지민": "Jimin", "슈가": "SUGA",
+    "제이홉": "j-hope", "뷔": "V", "찰리푸스": "Charlie Puth",
+}
+
+
+def normalize(name: str) -> str:
+    """NFKC + casefold + 공백/구두점 제거. 'Stray Kids' == 'straykids', '(G)I-DLE' == 'gidle'."""
+    s = unicodedata.normalize("NFKC", str(name)).casefold()
+    return re.sub(r"[\W_]+", "", s)
+
+
+def trigrams(key: str) -> set[str]:
+    k = f"  {key} "
+    return {k[i:i+3] for i in range(len(k) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein 거리. limit을 넘으면 조기 종료(limit+1 반환)."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+
+class ArtistIndex:
+    def __init__(self):
+        self.by_key: dict[str, dict] = {}                 # 정규화 이름 → {"id", "name"}
+        self.postings: dict[str, set[str]] = defaultdict(set)
+        self.aliases = {normalize(k): v for k, v in ALIASES.items()}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, artist_id: str, display: Optional[str] = None) -> None:
+        key = normalize(name)
+        if not key or not artist_id:
+            return
+        with self._lock:
+            self.by_key[key] = {"id": artist_id, "name": display or name}
+            for g in trigrams(key):
+                self.postings[g].add(key)
+
+    def fuzzy(self, key: str) -> Optional[dict]:
+        """트라이그램 후보 중 편집거리가 가장 작은 이름 (허용 거리: 길이의 1/4, 최소 1).
+        짧은 이름이거나 최선 후보가 둘 이상이면 None — 추정값이므로 정확 일치로 다루지 않는다."""
+        if len(key) < FUZZY_MIN_LEN:
+            return None
+        grams = trigrams(key)
+        counts: dict[str, int] = defaultdict(int)
+        for g in grams:
+            for cand in self.postings.get(g, ()):
+                counts[cand] += 1
+        limit = max(1, len(key) // 4)
+        best, best_d, tied = None, limit + 1, False
+        for cand, c in counts.items():
+            if c / len(grams | trigrams(cand)) < 0.2:   # Jaccard 하한으로 후보 가지치기
+                continue
+            d = edit_distance(key, cand, limit)
+            if d < best_d:
+                best, best_d, tied = cand, d, False
+            elif best is not None and d == best_d and self.by_key[cand]["id"] != self.by_key[best]["id"]:
+                tied = True
+        return self.by_key[best] if best is not None and not tied else None
+
+    def lookup(self, name: str) -> Optional[dict]:
+        """정확 일치/별칭만 (편집거리 추정은 suggest)."""
+        key = normalize(name)
+        if not key:
+            return None
+        hit = self.by_key.get(key)
+        if hit is None and key in self.aliases:
+            hit = self.by_key.get(normalize(self.aliases[key]))
+        return hit
+
+    def suggest(self, name: str) -> Optional[dict]:
+        key = normalize(name)
+        return self.fuzzy(key) if key else None
+
+    def canonical(self, name: str) -> str:
+        """API 검색어 — 별칭이면 대표 이름, 아니면 입력 그대로."""
+        return self.aliases.get(normalize(name), name)
+
+
+# ===================== 시드 =====================
+def roster_from_collector(path: str = COLLECTOR_PATH) -> dict:
+    """수집기 스크립트는 import 시 수집을 실행하므로, ARTISTS 리터럴만 AST로 읽는다."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError):
+        return {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "ARTISTS" for t in node.targets):
+            return ast.literal_eval(node.value)
+    return {}
+
+
+def build_index() -> ArtistIndex:
+    idx = ArtistIndex()
+    for name, aid in roster_from_collector().items():
+        idx.add(name, aid)
+    if os.path.exists(CURATED_PATH):
+        seed = pd.read_csv(CURATED_PATH, usecols=["artist", "artist_id"]).drop_duplicates()
+        for name, aid in seed.itertuples(index=False):
+            idx.add(name, aid)
+    for key in result_store.keys(STORE_NS):
+        hit = result_store.get(STORE_NS, key)
+        if hit and hit[0].get("id"):
+            idx.add(key, hit[0]["id"], hit[0].get("name"))
+            idx.add(hit[0].get("name") or key, hit[0]["id"])
+    return idx
+
+
+_index: Optional[ArtistIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> ArtistIndex:
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = build_index()
+    return _index
+
+
+def resolve(name: str, sp) -> Optional[dict]:
+    """아티스트 이름 → {"id", "name"} (로컬 정확 일치/별칭 우선, 미스일 때만 sp.search).
+
+    API로 찾은 결과는 입력 이름/정식 이름 둘 다 인덱스와 result_store에 기록한다.
+    API도 못 찾으면 편집거리 추정(suggest)을 대체값으로 돌려주되 기록하지는 않는다.
+    """
+    idx = get_index()
+    hit = idx.lookup(name)
+    if hit is not None:
+        return hit
+    res = sp.search(q=idx.canonical(name), type="artist", limit=1)
+    items = res.get("artists", {}).get("items", [])
+    if not items:
+        return idx.suggest(name)
+    artist = items[0]
+    hit = {"id": artist["id"], "name": artist.get("name") or name}
+    idx.add(name, hit["id"], hit["name"])
+    idx.add(hit["name"], hit["id"])
+    result_store.put(STORE_NS, normalize(name), hit)
+    return hit
@@ -0,0 +1,260 @@
+# async_spotify.py — asyncio 기반 Spotify Web API 클라이언트 (httpx)
+# spotipy는 블로킹이라 동시성이 스레드 수만큼으로 묶인다. 여기서는 같은 Web API 엔드포인트를
+# httpx.AsyncClient로 직접 호출해 한 프로세스에서 수백 개 요청을 동시에 띄운다.
+#   - 속도 제한은 스레드 쪽과 같은 버킷(rate_limit.shared)을 나눠 쓴다 — 동시 요청 수는 max_in_flight로 따로 제한
+#   - 429면 Retry-After만큼 버킷 전체를 멈추고 재시도, 5xx/연결 오류는 지수 백오프 재시도, 401이면 토큰 재발급
+#   - 호출마다 metrics.observe()로 엔드포인트별 지연/상태/바이트 기록 (spotipy 경로와 같은 지표)
+#   - 페이지네이션은 async 제너레이터: 첫 페이지의 total로 나머지 페이지를 한꺼번에 띄우고 offset 순서대로 내보낸다
+#
+#   async with AsyncSpotify.from_env() as api:
+#       async for album in api.artist_albums(artist_id, include_groups="album,single"):
+#           ...
+#
+# httpx는 선택 의존성이다 (pip install httpx). 기본 경로는 여전히 spotipy이고, 이 모듈은 명시적으로 켤 때만 쓴다:
+# 환경변수 SPOTIFY_ASYNC=1 (페이지 00) 또는 python spotify_collector.py --async. httpx가 없으면 켜도 spotipy 경로.
+# ⚠️ httpx는 이 저장소의 의존성에 포함되어 있지 않고, 이 모듈은 가짜 httpx 전송(응답 고정)으로
+#    spotipy 경로와 결과가 같은지만 확인했다 — 실제 Spotify API/httpx로는 검증하지 않았다.
+from __future__ import annotations
+
+import asyncio
+import base64
+import os
+import threading
+import time
+from typing import AsyncIterator, Iterable, Optional
+
+import metrics
+import rate_limit
+
+API = "https://api.spotify.com/v1"
+TOKEN_URL = "https://accounts.spotify.com/api/token"
+MAX_IN_FLIGHT = int(os.getenv("SPOTIFY_ASYNC_IN_FLIGHT", "256"))
+MAX_RETRIES = 4
+SEARCH_MAX_OFFSET = 1000      # search API offset 한도
+TRACKS_BATCH = 50             # /tracks 최대 ID 수
+ALBUMS_BATCH = 20             # /albums 최대 ID 수
+
+
+def available() -> bool:
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def enabled() -> bool:
+    """SPOTIFY_ASYNC=1이고 httpx가 있을 때만 True (검증 전까지는 opt-in)."""
+    return os.getenv("SPOTIFY_ASYNC", "").lower() in ("1", "true", "yes") and available()
+
+
+def _batched(xs: list, n: int):
+    for i in range(0, len(xs), n):
+        yield xs[i:i+n]
+
+
+class SpotifyHTTPError(RuntimeError):
+    """spotipy.SpotifyException처럼 http_status/headers를 가진다 (rate_limit, metrics와 같은 방식으로 다룸)."""
+
+    def __init__(self, http_status: int, msg: str, headers=None):
+        super().__init__(f"http status: {http_status}, {msg}")
+        self.http_status = http_status
+        self.headers = headers or {}
+
+
+class AsyncSpotify:
+    def __init__(self, client_id: str, client_secret: str, max_in_flight: int = MAX_IN_FLIGHT,
+                 limiter: Optional[rate_limit.RateLimiter] = None, timeout: float = 10.0):
+        try:
+            import httpx
+        except ImportError as e:
+            raise RuntimeError("async_spotify는 httpx가 필요합니다: pip install httpx") from e
+        self._httpx = httpx
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._limiter = limiter or rate_limit.shared
+        self._max_in_flight = max_in_flight
+        self._timeout = timeout
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._http = None
+        self._token: Optional[str] = None
+        self._token_exp = 0.0
+        self._token_lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def from_env(cls, id_var: str = "SPOTIPY_CLIENT_ID", secret_var: str = "SPOTIPY_CLIENT_SECRET", **kw):
+        from dotenv import load_dotenv
+        load_dotenv()
+        cid, csc = os.getenv(id_var), os.getenv(secret_var)
+        if not cid or not csc:
+            raise RuntimeError(f"환경변수 누락: {id_var} / {secret_var}")
+        return cls(cid, csc, **kw)
+
+    # ── 수명 ──
+    async def __aenter__(self) -> "AsyncSpotify":
+        # 세마포어/락은 사용하는 이벤트 루프 안에서 만든다
+        self._sem = asyncio.Semaphore(self._max_in_flight)
+        self._token_lock = asyncio.Lock()
+        self._http = self._httpx.AsyncClient(
+            timeout=self._timeout,
+            limits=self._httpx.Limits(max_connections=self._max_in_flight,
+                                      max_keepalive_connections=min(self._max_in_flight, 64)),
+        )
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._http.aclose()
+        self._http = None
+
+    # ── 토큰 (client credentials) ──
+    async def _access_token(self, force: bool = False) -> str:
+        async with self._token_lock:
+            if force or self._token is None or time.time() >= self._token_exp - 60:
+                basic = base64.b64encode(f"{self._client_id}:{self._client_secret}".encode()).decode()
+                t0 = time.perf_counter()
+                r = await self._http.request("POST", TOKEN_URL, data={"grant_type": "client_credentials"},
+                                             headers={"Authorization": f"Basic {basic}"})
+                metrics.observe("token", "POST", str(r.status_code), time.perf_counter() - t0, len(r.content or b""))
+                if r.status_code != 200:
+                    raise SpotifyHTTPError(r.status_code, "token request failed", r.headers)
+                body = r.json()
+                self._token = body["access_token"]
+                self._token_exp = time.time() + float(body.get("expires_in", 3600))
+            return self._token
+
+    # ── 요청 ──
+    async def get(self, path: str, params: Optional[dict] = None) -> dict:
+        """GET /v1{path}. 속도 제한 + 동시 요청 제한 + 재시도."""
+        url = path if path.startswith("http") else API + path
+        endpoint = metrics.endpoint_of(url)
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        retried = []
+        refreshed = False
+        r = None
+        for attempt in range(MAX_RETRIES + 1):
+            await self._limiter.acquire_async()
+            token = await self._access_token()
+            async with self._sem:
+                t0 = time.perf_counter()
+                try:
+                    r = await self._http.request("GET", url, params=params,
+                                                 headers={"Authorization": f"Bearer {token}"})
+                    failed = None
+                except self._httpx.TransportError as e:
+                    metrics.observe(endpoint, "GET", type(e).__name__, time.perf_counter() - t0)
+                    if attempt == MAX_RETRIES:
+                        raise
+                    failed = e
+            if failed is not None:   # 백오프는 세마포어 밖에서 — 실패한 요청이 동시 요청 자리를 잡고 있지 않도록
+                retried.append("error")
+                await asyncio.sleep(min(2 ** attempt * 0.5, 8))
+                continue
+            status = r.status_code
+            metrics.observe(endpoint, "GET", str(status), time.perf_counter() - t0, len(r.content or b""),
+                            tuple(retried) if status < 400 else ())
+            if status < 400:
+                return r.json() if r.content else {}
+            if status == 401 and not refreshed:   # 토큰 만료/폐기 → 한 번만 재발급
+                refreshed = True
+                await self._access_token(force=True)
+                continue
+            if attempt < MAX_RETRIES and (status == 429 or status >= 500):
+                retried.append(status)
+                if status == 429:
+                    try:
+                        wait = float(r.headers.get("Retry-After", rate_limit.DEFAULT_RETRY_AFTER))
+                    except (TypeError, ValueError):
+                        wait = rate_limit.DEFAULT_RETRY_AFTER
+                    self._limiter.pause(wait)   # 같은 버킷을 쓰는 스레드 호출자도 함께 멈춘다
+                else:
+                    await asyncio.sleep(min(2 ** attempt * 0.5, 8))
+                continue
+            raise SpotifyHTTPError(status, f"{url}: {r.text[:200]}", r.headers)
+        # 마지막 시도가 401 재발급/재시도로 끝난 경우 — 실제 마지막 상태로 보고
+        raise SpotifyHTTPError(r.status_code, f"{url}: retries exhausted", r.headers)
+
+    # ── 페이지네이션 ──
+    async def _paginate(self, path: str, params: dict, limit: int, key: Optional[str] = None,
+                        max_items: Optional[int] = None, max_offset: Optional[int] = None) -> AsyncIterator[dict]:
+        """offset 페이지네이션. 첫 페이지로 total을 알면 나머지를 동시에 요청하고 offset 순서대로 내보낸다."""
+        first = await self.get(path, {**params, "limit": limit, "offset": 0})
+        page = first[key] if key else first
+        items = page.get("items") or []
+        total = page.get("total") or 0
+        cap = min(x for x in (total, max_items, max_offset) if x is not None)
+        for it in items[:cap]:
+            yield it
+        offsets = list(range(limit, cap, limit))
+        if not offsets:
+            return
+        tasks = [asyncio.create_task(self.get(path, {**params, "limit": min(limit, cap - off), "offset": off}))
+                 for off in offsets]
+        try:
+            for t in tasks:
+                res = await t
+                for it in ((res[key] if key else res).get("items") or []):
+                    yield it
+        finally:
+            for t in tasks:   # 소비자가 중간에 멈추면 남은 요청 취소
+                t.cancel()
+
+    def artist_albums(self, artist_id: str, include_groups: str = "album,single",
+                      market: Optional[str] = None) -> AsyncIterator[dict]:
+        return self._paginate(f"/artists/{artist_id}/albums",
+                              {"include_groups": include_groups, "market": market}, limit=50)
+
+    def album_tracks(self, album_id: str, market: Optional[str] = None) -> AsyncIterator[dict]:
+        return self._paginate(f"/albums/{album_id}/tracks", {"market": market}, limit=50)
+
+    def search(self, q: str, type: str = "track", market: Optional[str] = None,
+               max_items: Optional[int] = None) -> AsyncIterator[dict]:
+        return self._paginate("/search", {"q": q, "type": type, "market": market}, limit=50,
+                              key=f"{type}s", max_items=max_items, max_offset=SEARCH_MAX_OFFSET)
+
+    async def _batched_objects(self, path: str, key: str, ids: Iterable[str], batch: int,
+                               market: Optional[str]) -> AsyncIterator[dict]:
+        ids = list(dict.fromkeys(i for i in ids if i))
+        tasks = [asyncio.create_task(self.get(path, {"ids": ",".join(chunk), "market": market}))
+                 for chunk in _batched(ids, batch)]
+        try:
+            for fut in asyncio.as_completed(tasks):   # 배치 순서와 무관하게 도착한 것부터
+                for obj in (await fut).get(key) or []:
+                    if obj:
+                        yield obj
+        finally:
+            for t in tasks:
+                t.cancel()
+
+    def tracks(self, track_ids: Iterable[str], market: Optional[str] = None) -> AsyncIterator[dict]:
+        """트랙 full 객체 — 50개 배치를 모두 동시에 요청, 도착 순서대로."""
+        return self._batched_objects("/tracks", "tracks", track_ids, TRACKS_BATCH, market)
+
+    def albums(self, album_ids: Iterable[str], market: Optional[str] = None) -> AsyncIterator[dict]:
+        return self._batched_objects("/albums", "albums", album_ids, ALBUMS_BATCH, market)
+
+
+# ===================== 동기 코드에서 호출 =====================
+async def collect(agen: AsyncIterator) -> list:
+    return [x async for x in agen]
+
+
+def run_sync(coro):
+    """동기 코드(Streamlit 스크립트 등)에서 코루틴 실행. 이미 루프가 도는 스레드면 별도 스레드에서 돌린다."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    out: dict = {}
+
+    def _target():
+        try:
+            out["value"] = asyncio.run(coro)
+        except BaseException as e:
+            out["error"] = e
+
+    t = threading.Thread(target=_target, name="async-spotify")
+    t.start()
+    t.join()
+    if "error" in out:
+        raise out["error"]
+    return out["value"]
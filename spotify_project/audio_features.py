@@ -0,0 +1,132 @@
+# audio_features.py — 오디오 특성 수집 (배치 이분 탐색 + 네거티브 캐시 + 영구 저장)
+# 기존 fetch_audio_features_safe는 배치 호출이 한 번 실패하면 곡마다 단건 호출(+sleep)로 떨어져
+# 잘못된 ID 하나 때문에 100곡 배치가 100번의 순차 요청이 됐다. 여기서는
+#   1) 이미 받은 특성은 result_store(ns="audio_features")에서 읽는다 — 곡당 한 번만 요청
+#   2) 400(잘못된 ID)으로 실패한 배치만 반으로 나눠 다시 시도 → 나쁜 ID k개를 O(k log n) 호출로 격리
+#   3) 특성이 없는(null)/잘못된(400) ID와, 엔드포인트 자체의 거부(401/403 — 폐지/권한 없음)는 네거티브 캐시에
+#      기록해 TTL 동안 다시 묻지 않는다
+#   4) 429(재시도 후에도)/5xx/타임아웃/연결 오류는 ID 탓이 아니므로 나누지도 기록하지도 않고 이번 수집을 멈춘다
+#      — 다음 호출에서 다시 시도. 호출은 rate_limit.shared.call을 거쳐 429면 Retry-After만큼 기다린다.
+from __future__ import annotations
+
+import threading
+from typing import Dict, List
+
+import metrics
+import rate_limit
+import result_store
+
+STORE_NS = "audio_features"            # track_id → 특성 dict (만료 없음)
+MISS_NS = "audio_features_miss"        # track_id → 실패 사유
+ENDPOINT_NS = "endpoint_status"        # 엔드포인트 → 실패 사유
+MISS_TTL = 7 * 24 * 3600               # 특성 없음/잘못된 ID: 1주 뒤 재시도
+ENDPOINT_TTL = 3600                    # 엔드포인트 거부: 1시간 뒤 재시도
+ENDPOINT = "audio_features"
+BATCH = 100                            # audio-features API 최대 ID 수
+ENDPOINT_STATUSES = {401, 403}         # ID와 무관하게 엔드포인트 전체가 막힌 경우
+BAD_ID_STATUS = 400                    # 배치 안에 잘못된 ID가 있는 경우 (이때만 이분 탐색)
+WAIT_TIMEOUT = 120                     # 다른 세션이 받고 있는 ID를 기다리는 최대 시간(초)
+
+FEATURE_KEYS = [
+    "id", "danceability", "energy", "valence", "tempo", "acousticness",
+    "instrumentalness", "liveness", "speechiness", "key", "mode", "time_signature", "duration_ms",
+]
+
+_lock = threading.Lock()                 # _inflight 장부용 (네트워크 호출 중에는 잡지 않는다)
+_inflight: dict[str, threading.Event] = {}   # 지금 다른 호출이 받고 있는 track_id → 끝나면 set
+stats = {"calls": 0, "stored": 0, "fetched": 0, "missed": 0}
+
+
+class EndpointUnavailable(RuntimeError):
+    pass
+
+
+class TemporaryFailure(RuntimeError):
+    """429/5xx/전송 오류 — ID와 무관한 일시적 실패."""
+
+
+def _slim(f: dict) -> dict:
+    return {k: f.get(k) for k in FEATURE_KEYS}
+
+
+def endpoint_down() -> bool:
+    return result_store.get(ENDPOINT_NS, ENDPOINT, max_age=ENDPOINT_TTL) is not None
+
+
+def _fetch_batch(sp, ids: List[str], found: dict, missed: dict):
+    """ids를 한 번에 요청하고, 400이면 반으로 나눠 재귀.
+    엔드포인트 거부는 EndpointUnavailable, 그 밖의 실패는 TemporaryFailure로 올린다."""
+    stats["calls"] += 1
+    try:
+        res = rate_limit.shared.call(sp.audio_features, ids) or []
+    except Exception as e:
+        status = getattr(e, "http_status", None)
+        if status in ENDPOINT_STATUSES:
+            raise EndpointUnavailable(f"{status}: {e}") from e
+        if status != BAD_ID_STATUS:
+            raise TemporaryFailure(f"{status or type(e).__name__}: {e}") from e
+        if len(ids) == 1:
+            missed[ids[0]] = f"error {status}"
+            return
+        mid = len(ids) // 2
+        _fetch_batch(sp, ids[:mid], found, missed)
+        _fetch_batch(sp, ids[mid:], found, missed)
+        return
+    for tid, f in zip(ids, res):
+        if f and f.get("id"):
+            found[tid] = _slim(f)
+        else:
+            missed[tid] = "null"   # API가 null을 돌려준 ID (특성 없음)
+
+
+def fetch(sp, track_ids: List[str], batch_size: int = BATCH) -> Dict[str, dict]:
+    """track_id → 특성 dict. 저장된 것은 그대로, 새 ID만 API로. 엔드포인트가 막혀 있으면 저장분만 반환."""
+    ids = list(dict.fromkeys(t for t in track_ids if t))
+    feats = result_store.get_many(STORE_NS, ids)
+    stats["stored"] += len(feats)
+    todo = [t for t in ids if t not in feats]
+    if todo:
+        known_bad = result_store.get_many(MISS_NS, todo, max_age=MISS_TTL)
+        todo = [t for t in todo if t not in known_bad]
+    metrics.cache_event(STORE_NS, True, len(ids) - len(todo))   # 저장된 특성 + 네거티브 캐시
+    metrics.cache_event(STORE_NS, False, len(todo))
+    if not todo or endpoint_down():
+        return feats
+
+    # 같은 ID를 여러 세션이 동시에 요청하지 않도록 (워밍업과 페이지가 겹칠 때):
+    # 아무도 받고 있지 않은 ID만 맡고, 나머지는 맡은 호출이 끝나길 기다렸다가 저장소에서 읽는다
+    done = threading.Event()
+    with _lock:
+        theirs = [t for t in todo if t in _inflight]
+        mine = [t for t in todo if t not in _inflight]
+        waits = {_inflight[t] for t in theirs}
+        for t in mine:
+            _inflight[t] = done
+
+    found: dict = {}
+    missed: dict = {}
+    try:
+        for i in range(0, len(mine), batch_size):
+            _fetch_batch(sp, mine[i:i+batch_size], found, missed)
+    except EndpointUnavailable as e:
+        result_store.put(ENDPOINT_NS, ENDPOINT, str(e))
+    except TemporaryFailure:
+        pass   # 받은 만큼만 저장하고 나머지는 다음 호출에서 다시 (네거티브 캐시에 남기지 않음)
+    finally:
+        if found:
+            result_store.put_many(STORE_NS, found)
+        if missed:
+            result_store.put_many(MISS_NS, missed)
+        with _lock:
+            for t in mine:
+                _inflight.pop(t, None)
+        done.set()
+
+    stats["fetched"] += len(found)
+    stats["missed"] += len(missed)
+    feats.update(found)
+    if theirs:
+        for ev in waits:
+            ev.wait(WAIT_TIMEOUT)
+        feats.update(result_store.get_many(STORE_NS, theirs))
+    return feats
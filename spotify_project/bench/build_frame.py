@@ -0,0 +1,146 @@
+# bench/build_frame.py — 트랙 프레임 구성: dict 행 + merge + concat (이전) vs 열 버퍼 빌더 (columnar.py)
+# 합성 Spotify 트랙 JSON(아티스트 × 곡, 오디오 특성 포함)으로 두 경로를 돌려 시간/최대 메모리(tracemalloc)를 비교한다.
+#
+# 실행 (spotify_project/에서):
+#   python bench/build_frame.py                  # 기본: 아티스트 10 × 곡 200
+#   python bench/build_frame.py -a 50 -t 1000    # 5만 행
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import columnar  # noqa: E402
+import markets  # noqa: E402
+
+FEATURE_COLS = [
+    "danceability", "energy", "valence", "tempo", "acousticness",
+    "instrumentalness", "liveness", "speechiness", "key", "mode", "time_signature",
+]
+MARKETS = list(markets.MARKETS)
+
+
+def synth(n_artists: int, n_tracks: int, seed: int = 0):
+    """[(아티스트, 트랙 JSON 목록, 특성 dict)] — API 응답과 같은 모양."""
+    rng = np.random.default_rng(seed)
+    out = []
+    for a in range(n_artists):
+        name = f"Artist{a}"
+        items, feats = [], {}
+        for t in range(n_tracks):
+            tid = f"{a:03d}{t:06d}"
+            items.append({
+                "id": tid, "name": f"track {t}", "popularity": int(rng.integers(0, 100)),
+                "duration_ms": int(rng.integers(120000, 300000)), "explicit": bool(rng.random() < .2),
+                "preview_url": None,
+                "artists": [{"name": name}] + ([{"name": "Feat"}] if t % 7 == 0 else []),
+                "album": {"name": f"album {t % 20}", "id": f"al{a}-{t % 20}", "release_date": f"{2010 + t % 15}-03-01",
+                          "release_date_precision": "day", "total_tracks": 12, "album_type": "album"},
+                "available_markets": MARKETS[: int(rng.integers(0, 180))],
+            })
+            feats[tid] = {c: float(rng.random()) for c in FEATURE_COLS} | {"id": tid, "duration_ms": 1}
+        out.append((name, items, feats))
+    return out
+
+
+# ── 이전 경로 (utils.build_meta_df / merge_features + 페이지의 concat) ──
+def legacy_build_meta_df(meta_items):
+    rows = []
+    for t in meta_items:
+        if not t:
+            continue
+        album = t.get("album", {}) or {}
+        rows.append({
+            "track_id": t.get("id"),
+            "artist": ", ".join(a["name"] for a in (t.get("artists") or [])),
+            "track_name": t.get("name"),
+            "popularity": t.get("popularity"),
+            "duration_ms": t.get("duration_ms"),
+            "explicit": t.get("explicit"),
+            "preview_url": t.get("preview_url"),
+            "album_name": album.get("name"),
+            "album_id": album.get("id"),
+            "album_release_date": album.get("release_date"),
+            "album_release_date_precision": album.get("release_date_precision"),
+            "album_total_tracks": album.get("total_tracks"),
+            "album_type": album.get("album_type"),
+            "available_markets_len": len(t.get("available_markets") or []),
+        })
+    df = pd.DataFrame(rows).drop_duplicates(subset=["track_id"])
+    df["release_year"] = pd.to_datetime(df["album_release_date"], errors="coerce").dt.year
+    df["duration_min"] = (df["duration_ms"] / 60000).round(2)
+    return df
+
+
+def legacy_merge_features(df_meta, feat_map):
+    feat_rows = []
+    for tid, f in feat_map.items():
+        row = {"track_id": tid}
+        for c in FEATURE_COLS:
+            row[c] = f.get(c)
+        feat_rows.append(row)
+    return df_meta.merge(pd.DataFrame(feat_rows), on="track_id", how="left")
+
+
+def legacy(data):
+    frames = []
+    for name, items, feats in data:
+        df = legacy_merge_features(legacy_build_meta_df(items), feats)
+        df["main_artist"] = name
+        frames.append(df)
+    return pd.concat(frames, ignore_index=True)
+
+
+def columnar_path(data):
+    b = columnar.TrackColumns(FEATURE_COLS)
+    for name, items, feats in data:
+        b.add_items(items, feats, main_artist=name)
+    return b.build()
+
+
+def measure(fn, data, repeat: int):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(data)
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    out = fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times) * 1000, peak / 2**20, out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-a", "--artists", type=int, default=10)
+    ap.add_argument("-t", "--tracks", type=int, default=200)
+    ap.add_argument("-r", "--repeat", type=int, default=5)
+    args = ap.parse_args(argv)
+
+    data = synth(args.artists, args.tracks)
+    print(f"{args.artists} artists × {args.tracks} tracks = {args.artists * args.tracks:,} rows")
+    print(f"{'path':10s} {'ms (median)':>12s} {'peak MiB':>9s}")
+    res = {}
+    for label, fn in [("legacy", legacy), ("columnar", columnar_path)]:
+        ms, mib, out = measure(fn, data, args.repeat)
+        res[label] = out
+        print(f"{label:10s} {ms:12.1f} {mib:9.1f}")
+
+    # 결과가 같은지 확인 (컬럼 순서/값) — 비트셋 컬럼은 이전 경로에 없으므로 제외
+    a, b = res["legacy"], res["columnar"].drop(columns=list(markets.COLS))
+    pd.testing.assert_frame_equal(a[b.columns], b, check_dtype=False)
+    print("results match")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# bench/import_time.py — 페이지별 import 시간 프로파일 (python -X importtime)
+# 페이지 스크립트는 import 시 UI 코드까지 실행되므로, 최상위 import 문만 AST로 뽑아
+# 새 인터프리터에서 -X importtime으로 실행하고 모듈별 누적 시간을 집계한다.
+#
+# 실행 (spotify_project/에서):
+#   python bench/import_time.py            # 전체 페이지 요약 + 예산 초과 시 종료 코드 1
+#   python bench/import_time.py 03 -n 15   # 03 페이지의 무거운 모듈 상위 15개
+from __future__ import annotations
+
+import argparse
+import ast
+import glob
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 페이지 import 예산 (ms, 중앙값 기준). streamlit 자체 import는 모든 페이지 공통이라 제외하고 본다.
+BUDGET_MS = {
+    "main": 100,
+    "00": 50,
+    "01": 150,
+    "02": 150,
+    "03": 50,
+    "04": 50,
+    "05": 150,
+}
+BASELINE = ["streamlit", "pandas"]   # 앱 실행 시 이미 로드되어 있는 모듈
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def page_files() -> dict[str, str]:
+    out = {"main": os.path.join(BASE_DIR, "home.py")}   # 홈 화면 (main.py는 페이지 목록만)
+    for p in sorted(glob.glob(os.path.join(BASE_DIR, "views", "*.py"))):
+        out[os.path.basename(p)[:2]] = p
+    return out
+
+
+def top_level_imports(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    nodes = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(n) for n in nodes)
+
+
+def run_importtime(code: str) -> list[tuple[str, int, int, int]]:
+    """(모듈, self_us, cumulative_us, depth) 목록."""
+    pre = "".join(f"import {m}\n" for m in BASELINE)
+    prog = f"import sys; sys.path.insert(0, {BASE_DIR!r})\n{pre}import sys as _s; _s.stderr.write('--MARK--\\n')\n{code}\n"
+    res = subprocess.run([sys.executable, "-X", "importtime", "-c", prog],
+                         cwd=BASE_DIR, capture_output=True, text=True)
+    if res.returncode != 0:
+        raise RuntimeError(res.stderr.strip().splitlines()[-1])
+    err = res.stderr.split("--MARK--\n", 1)[-1]
+    rows = []
+    for line in err.splitlines():
+        m = _LINE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2))
+    return rows
+
+
+def profile(path: str, repeat: int = 3) -> tuple[float, list[tuple[str, int]]]:
+    """(총 import ms 중앙값, 최상위 모듈별 누적 us — 마지막 실행 기준)."""
+    code = top_level_imports(path)
+    totals, tops = [], []
+    for _ in range(repeat):
+        rows = run_importtime(code)
+        tops = [(name, cum) for name, _, cum, depth in rows if depth == 0]
+        totals.append(sum(c for _, c in tops) / 1000)
+    return statistics.median(totals), sorted(tops, key=lambda t: -t[1])
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("pages", nargs="*", help="페이지 번호(00~06) 또는 main")
+    ap.add_argument("-n", "--top", type=int, default=5, help="무거운 모듈 표시 개수")
+    ap.add_argument("-r", "--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    files = page_files()
+    keys = args.pages or list(files)
+    over = []
+    print(f"{'page':6s} {'import ms':>10s} {'budget':>7s}  heaviest")
+    for k in keys:
+        total, tops = profile(files[k], args.repeat)
+        budget = BUDGET_MS.get(k)
+        flag = " ⚠" if budget and total > budget else ""
+        heavy = ", ".join(f"{n} {c/1000:.0f}ms" for n, c in tops[:args.top])
+        print(f"{k:6s} {total:10.1f} {budget or '-':>7}{flag}  {heavy}")
+        if flag:
+            over.append(k)
+    if over:
+        print(f"예산 초과: {', '.join(over)}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
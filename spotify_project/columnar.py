@@ -0,0 +1,165 @@
+# columnar.py — API JSON → 트랙 DataFrame 열 단위 빌더
+# 기존 경로는 곡마다 dict 행을 만들고(build_meta_df) → DataFrame → 특성 merge(merge_features)
+# → 페이지에서 아티스트별 컬럼 추가 + pd.concat 으로, 한 번 불러올 때 프레임 전체를 여러 번 복사했다.
+# 여기서는 API 필드를 타입별 열 버퍼(숫자는 array('d'))에 바로 이어 붙이고,
+#   - track_id 중복은 추가 시점에 set으로 거르고
+#   - 오디오 특성은 track_id로 찾아 같은 행에 바로 채우고 (merge 없음)
+#   - 아티스트 라벨 같은 상수 컬럼은 (값, 행 수) 구간으로만 기록하고
+#   - available_markets는 국가 코드 목록 대신 비트셋(uint64 × 3, markets.py)으로 담아
+# build()에서 최종 프레임을 한 번만 만든다. 숫자 버퍼는 np.frombuffer로 복사 없이 넘긴다.
+#
+# 벤치마크: python bench/build_frame.py
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+import markets
+
+# (컬럼, 종류) — 순서가 곧 결과 프레임의 컬럼 순서 (utils.BASIC_COLS와 같은 순서)
+META_SPEC = [
+    ("track_id", "str"),
+    ("artist", "str"),
+    ("track_name", "str"),
+    ("popularity", "int"),
+    ("duration_ms", "int"),
+    ("explicit", "obj"),
+    ("preview_url", "str"),
+    ("album_name", "str"),
+    ("album_id", "str"),
+    ("album_release_date", "str"),
+    ("album_release_date_precision", "str"),
+    ("album_total_tracks", "int"),
+    ("album_type", "str"),
+    ("available_markets_len", "int"),
+]
+NUMERIC = {"int", "float"}
+NAN = math.nan
+
+
+def _num(v) -> float:
+    return NAN if v is None else float(v)
+
+
+class TrackColumns:
+    """트랙 메타(+오디오 특성, 상수 컬럼)를 열 버퍼에 쌓아 build()로 프레임 하나를 만든다.
+
+    add_items(): Spotify 트랙 JSON 목록, add_rows(): utils.meta_row 형식 dict(저장소에서 읽은 행).
+    중복 제거는 add_* 호출 단위 (같은 곡이 다른 아티스트 라벨로 들어오는 것은 허용).
+    build()는 버퍼를 넘겨주고 비우므로 빌더당 한 번만 호출한다.
+    """
+
+    def __init__(self, feature_cols: Optional[list[str]] = None):
+        self.feature_cols = list(feature_cols or [])
+        self.n = 0
+        self._cols = {name: (array("d") if kind in NUMERIC else []) for name, kind in META_SPEC}
+        self._feats = {c: array("d") for c in self.feature_cols}
+        self._markets = array("Q")   # 행마다 markets.WORDS개
+        self._any_feature = False
+        self._const: dict[str, list[tuple[object, int]]] = {}
+
+    # ── 추가 ──
+    def _append_features(self, tid, features):
+        f = features.get(tid) if features else None
+        if f:
+            self._any_feature = True
+            for c, buf in self._feats.items():
+                buf.append(_num(f.get(c)))
+        else:
+            for buf in self._feats.values():
+                buf.append(NAN)
+
+    def _append_const(self, start: int, const: dict):
+        added = self.n - start
+        for name in set(self._const) | set(const):
+            segs = self._const.setdefault(name, [(None, start)] if start else [])
+            if added:
+                segs.append((const.get(name), added))
+
+    def add_items(self, items: Iterable[dict], features: Optional[dict] = None, **const) -> int:
+        """Spotify 트랙 객체를 바로 열 버퍼로. 추가된 행 수 반환."""
+        c = self._cols
+        seen = set()
+        start = self.n
+        for t in items:
+            if not t:
+                continue
+            tid = t.get("id")
+            if tid in seen:
+                continue
+            seen.add(tid)
+            album = t.get("album") or {}
+            c["track_id"].append(tid)
+            c["artist"].append(", ".join(a["name"] for a in (t.get("artists") or [])))
+            c["track_name"].append(t.get("name"))
+            c["popularity"].append(_num(t.get("popularity")))
+            c["duration_ms"].append(_num(t.get("duration_ms")))
+            c["explicit"].append(t.get("explicit"))
+            c["preview_url"].append(t.get("preview_url"))
+            c["album_name"].append(album.get("name"))
+            c["album_id"].append(album.get("id"))
+            c["album_release_date"].append(album.get("release_date"))
+            c["album_release_date_precision"].append(album.get("release_date_precision"))
+            c["album_total_tracks"].append(_num(album.get("total_tracks")))
+            c["album_type"].append(album.get("album_type"))
+            c["available_markets_len"].append(float(len(t.get("available_markets") or [])))
+            self._markets.extend(markets.words(t.get("available_markets")))
+            self._append_features(tid, features)
+            self.n += 1
+        self._append_const(start, const)
+        return self.n - start
+
+    def add_rows(self, rows: Iterable[dict], features: Optional[dict] = None, **const) -> int:
+        """meta_row 형식 dict 목록 (search_store에 저장된 행)."""
+        seen = set()
+        start = self.n
+        for r in rows:
+            tid = r.get("track_id")
+            if tid in seen:
+                continue
+            seen.add(tid)
+            for name, kind in META_SPEC:
+                v = r.get(name)
+                self._cols[name].append(_num(v) if kind in NUMERIC else v)
+            self._markets.extend(markets.from_hex(r.get("available_markets_bits")))
+            self._append_features(tid, features)
+            self.n += 1
+        self._append_const(start, const)
+        return self.n - start
+
+    # ── 최종 프레임 ──
+    def build(self) -> pd.DataFrame:
+        if self.n == 0:
+            return pd.DataFrame()
+        # 버퍼는 변환하는 즉시 놓아서 (버퍼 + 프레임)이 한꺼번에 메모리에 있지 않도록 한다
+        cols, feats, consts, mk = self._cols, self._feats, self._const, self._markets
+        self._cols = self._feats = self._const = self._markets = None
+        data = {}
+        for name, kind in META_SPEC:
+            buf = cols.pop(name)
+            if kind in NUMERIC:
+                arr = np.frombuffer(buf, dtype=np.float64)
+                # 빈 값이 없으면 기존 경로(pd.DataFrame(rows))처럼 int64
+                data[name] = arr.astype(np.int64) if kind == "int" and not np.isnan(arr).any() else arr
+            else:
+                data[name] = pd.array(buf)
+            del buf
+        df = pd.DataFrame(data, copy=False)
+        del data
+
+        # 파생 컬럼 (build_meta_df와 동일)
+        df["release_year"] = pd.to_datetime(df["album_release_date"], errors="coerce").dt.year
+        df["duration_min"] = (df["duration_ms"] / 60000).round(2)
+        if self._any_feature:   # 특성을 하나도 못 받았으면 merge_features처럼 컬럼을 붙이지 않는다
+            for c in list(feats):
+                df[c] = np.frombuffer(feats.pop(c), dtype=np.float64)
+        for name, segs in consts.items():
+            df[name] = pd.array([v for v, k in segs for _ in range(k)])
+        bits = np.frombuffer(mk, dtype=np.uint64).reshape(-1, markets.WORDS)
+        for i, name in enumerate(markets.COLS):
+            df[name] = bits[:, i]
+        return df
@@ -0,0 +1,81 @@
+# curated.py — 큐레이션 데이터셋(data/kpop_2010_2025_curated.csv) 공유 로더
+# 파생 컬럼(duration_sec, role, artists_primary, name_normalized)은 적재 시 한 번만 계산하고,
+# 페이지에서는 아티스트별 슬라이스를 (데이터셋 토큰, 아티스트) 단위로 공유해 쓰기만 한다.
+# 역할(primary/featuring/other)은 트랙 크레딧(artists_all)이 있어야 나눌 수 있다. 현재 data/ CSV는
+# 크레딧 컬럼 없이 수집된 것이라 role은 전부 "unknown" — spotify_collector.py로 다시 수집하면 채워진다.
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+
+import registry
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CURATED_PATH = os.path.join(BASE_DIR, "data", "kpop_2010_2025_curated.csv")
+
+# 분석에 쓰는 컬럼만 읽는다 (isrc, song_age_years 등은 제외)
+PROJECTION = [
+    "artist", "artist_id", "artists_all", "album_id", "album_name", "album_type",
+    "track_id", "track_name", "release_date", "release_year", "popularity",
+    "duration_ms", "duration_sec", "explicit", "disc_number", "track_number", "role",
+]
+
+ROLE_UNKNOWN = "unknown"   # 크레딧 정보가 없어 역할을 알 수 없는 트랙
+
+
+def track_role(artist: pd.Series, artists_all: pd.Series) -> np.ndarray:
+    """수집 대상 아티스트 기준 역할: 첫 번째 크레딧이면 primary, 크레딧에 있으면 featuring, 없으면 other."""
+    credits = artists_all.fillna("").astype(str).str.lower().str.split(r"\s*,\s*", regex=True)
+    me = artist.fillna("").astype(str).str.lower()
+    first = credits.str[0].fillna("")
+    listed = [m in c for m, c in zip(me, credits)]
+    return np.where(first.eq(me), "primary", np.where(listed, "featuring", "other"))
+
+
+def ingest(df: pd.DataFrame) -> pd.DataFrame:
+    """적재 직후 한 번 — 파생 컬럼 보강 + 범주형 변환. 수집기가 이미 만든 컬럼은 그대로 쓴다."""
+    df = df.copy()
+    credits = "artists_all" in df.columns
+    if "duration_sec" not in df.columns:
+        df["duration_sec"] = pd.to_numeric(df["duration_ms"], errors="coerce") / 1000.0
+    if "role" not in df.columns:
+        # 크레딧이 없으면 artist 자신을 크레딧으로 간주해 모두 primary로 만들지 않는다
+        df["role"] = track_role(df["artist"], df["artists_all"]) if credits else ROLE_UNKNOWN
+    if "release_year" not in df.columns:
+        df["release_year"] = pd.to_datetime(df["release_date"], errors="coerce").dt.year
+    df["explicit"] = df["explicit"].astype(str).str.lower().isin(["true", "1"])
+    if credits:
+        df["artists_primary"] = df["artists_all"].fillna("").astype(str).str.split(",").str[0].str.strip()
+    else:
+        df["artists_primary"] = df["artist"].astype(str)
+    df["name_normalized"] = (df["track_name"].fillna("").astype(str)
+                             .str.replace(r"\s+", " ", regex=True).str.strip().str.lower())
+    df["album_name"] = df["album_name"].fillna("Unknown Album")
+    df["artist"] = df["artist"].astype("category")
+    return df
+
+
+def load() -> pd.DataFrame:
+    """프로젝션 컬럼만 읽어 ingest한 공유 프레임 (파일 토큰당 한 번)."""
+    header = pd.read_csv(CURATED_PATH, nrows=0, encoding="utf-8-sig").columns
+    usecols = tuple(c for c in PROJECTION if c in header)
+    raw = registry.load_csv(CURATED_PATH, usecols=usecols, encoding="utf-8-sig")
+    return registry.derive(raw, "ingested", ingest)
+
+
+def has_roles(df: pd.DataFrame) -> bool:
+    """역할이 두 가지 이상 구분되는지 — 아니면 역할 필터/탭은 의미가 없다."""
+    if "role" not in df.columns:
+        return False
+    return df["role"].fillna(ROLE_UNKNOWN).loc[lambda r: r != ROLE_UNKNOWN].nunique() > 1
+
+
+def artists(df: pd.DataFrame) -> list[str]:
+    return sorted(df["artist"].cat.categories.tolist())
+
+
+def for_artist(df: pd.DataFrame, artist: str) -> pd.DataFrame:
+    """아티스트 슬라이스 — (데이터셋 토큰, 아티스트)당 한 번만 잘라 세션 간 공유 (읽기 전용)."""
+    return registry.derive(df, f"artist={artist}", lambda d: d[d["artist"] == artist])
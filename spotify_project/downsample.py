@@ -0,0 +1,147 @@
+# downsample.py — 대용량 산점도/바이올린용 서버측 다운샘플링
+# 브라우저로 모든 점을 보내지 않고, 포인트 예산(point budget) 안에서 모양과 이상치를 보존한다.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+POINT_BUDGET = 5000   # 차트 하나에 보낼 기본 최대 점 수
+WEBGL_MIN = 1000      # 이 이상이면 SVG 대신 WebGL(Scattergl)로 렌더링
+
+
+def render_mode(n_points: int) -> str:
+    """px.scatter의 render_mode — 점이 많으면 Scattergl."""
+    return "webgl" if n_points >= WEBGL_MIN else "svg"
+
+
+# ===================== 라인: LTTB =====================
+def lttb(x, y, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets. x 기준 정렬된 시계열에서 n_out개 점의 인덱스를 고른다."""
+    x = np.asarray(x, dtype=float); y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    every = (n - 2) / (n_out - 2)  # 첫/끝 점을 뺀 가운데 구간을 n_out-2개 버킷으로
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        nlo, nhi = hi, min(int((i + 2) * every) + 1, n)
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()          # 다음 버킷 평균점
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
+def lttb_frame(df: pd.DataFrame, x: str, y: str, budget: int = POINT_BUDGET) -> pd.DataFrame:
+    if len(df) <= budget:
+        return df
+    d = df.sort_values(x)
+    return d.iloc[lttb(d[x].to_numpy(), d[y].to_numpy(), budget)]
+
+
+# ===================== 산점도: 밀도 격자 샘플링 =====================
+def density_sample(df: pd.DataFrame, x: str, y: str, budget: int = POINT_BUDGET,
+                   keep: Optional[Iterable] = None, bins: int = 64, seed: int = 0) -> pd.DataFrame:
+    """2D 격자 칸마다 점 수를 상한(cap)으로 잘라 샘플링.
+
+    밀집 영역은 얇게, 희소 영역(=외곽/이상치)은 그대로 남는다. keep에 준 인덱스(예: 잔차 상위 라벨)는 항상 포함.
+    """
+    if len(df) <= budget:
+        return df
+    keep_idx = pd.Index(keep if keep is not None else [])
+    xv = df[x].to_numpy(dtype=float); yv = df[y].to_numpy(dtype=float)
+    xb = np.digitize(xv, np.linspace(np.nanmin(xv), np.nanmax(xv), bins))
+    yb = np.digitize(yv, np.linspace(np.nanmin(yv), np.nanmax(yv), bins))
+    cell = xb * (bins + 2) + yb
+
+    # 칸별 상한 cap을 이분 탐색: Σ min(count, cap) ≤ budget
+    counts = np.bincount(cell)
+    counts = counts[counts > 0]
+    lo, hi = 1, int(counts.max())
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if np.minimum(counts, mid).sum() <= budget - len(keep_idx):
+            lo = mid
+        else:
+            hi = mid - 1
+    cap = lo
+
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(df))
+    rank = pd.Series(cell[order]).groupby(cell[order]).cumcount().to_numpy()
+    chosen = np.sort(order[rank < cap])
+    out_idx = df.index[chosen].union(keep_idx.intersection(df.index))
+    return df.loc[out_idx]
+
+
+# ===================== 바이올린: 미리 계산한 KDE =====================
+def binned_kde(values, grid_size: int = 256, bw: Optional[float] = None):
+    """히스토그램 + 가우시안 커널 합성곱으로 O(n) KDE. (grid, density) 반환."""
+    v = np.asarray(values, dtype=float)
+    v = v[np.isfinite(v)]
+    if len(v) < 2 or v.std() == 0:
+        return np.array([]), np.array([])
+    bw = bw or 1.06 * v.std() * len(v) ** (-1 / 5)  # Scott/Silverman 규칙
+    lo, hi = v.min() - 3 * bw, v.max() + 3 * bw
+    hist, edges = np.histogram(v, bins=grid_size, range=(lo, hi))
+    grid = (edges[:-1] + edges[1:]) / 2
+    step = grid[1] - grid[0]
+    half = int(np.ceil(4 * bw / step))
+    kx = np.arange(-half, half + 1) * step
+    kernel = np.exp(-0.5 * (kx / bw) ** 2)
+    dens = np.convolve(hist, kernel, mode="same")
+    dens = dens / (dens.sum() * step)
+    return grid, dens
+
+
+def kde_violin(df: pd.DataFrame, cat: str, val: str, order: list, budget: int = POINT_BUDGET,
+               title: str = "", labels: Optional[dict] = None) -> go.Figure:
+    """카테고리별 KDE를 서버에서 계산해 좌우 대칭 면(fill)으로 그리는 바이올린.
+
+    원시 점은 카테고리별로 예산을 나눠 샘플링하되, 각 카테고리의 최솟값/최댓값(이상치)은 항상 남긴다.
+    """
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    labels = labels or {}
+    fig = go.Figure()
+    colors = px.colors.qualitative.Plotly
+    per_cat = max(budget // max(len(order), 1), 10)
+    for i, c in enumerate(order):
+        v = df.loc[df[cat] == c, val].dropna()
+        if v.empty:
+            continue
+        color = colors[i % len(colors)]
+        grid, dens = binned_kde(v.to_numpy())
+        if len(grid):
+            w = 0.4 * dens / dens.max()
+            fig.add_trace(go.Scatter(
+                x=np.concatenate([i - w, (i + w)[::-1]]), y=np.concatenate([grid, grid[::-1]]),
+                fill="toself", mode="lines", line=dict(color=color, width=1),
+                name=str(c), legendgroup=str(c), hoverinfo="skip",
+            ))
+        q1, med, q3 = v.quantile([0.25, 0.5, 0.75])
+        fig.add_trace(go.Scatter(x=[i, i], y=[q1, q3], mode="lines", line=dict(color="#333", width=4),
+                                 legendgroup=str(c), showlegend=False, hoverinfo="skip"))
+        fig.add_trace(go.Scatter(x=[i], y=[med], mode="markers", marker=dict(color="white", size=6),
+                                 legendgroup=str(c), showlegend=False, name=f"{c} median"))
+        pts = v if len(v) <= per_cat else pd.concat([v.sample(per_cat, random_state=0), v.nsmallest(3), v.nlargest(3)])
+        jitter = np.random.default_rng(i).uniform(-0.15, 0.15, len(pts))
+        fig.add_trace(go.Scattergl(x=i + jitter, y=pts.to_numpy(), mode="markers",
+                                   marker=dict(color=color, size=3, opacity=0.5),
+                                   legendgroup=str(c), showlegend=False, name=str(c)))
+    fig.update_layout(
+        title=title,
+        xaxis=dict(tickmode="array", tickvals=list(range(len(order))), ticktext=[str(c) for c in order],
+                   title=labels.get(cat, cat)),
+        yaxis_title=labels.get(val, val),
+    )
+    return fig
@@ -0,0 +1,151 @@
+# exports.py — 다운로드 버튼용 내보내기 (클릭 시 생성 + 디스크 캐시 + 청크 단위 직렬화)
+# 기존에는 rerun마다 df.to_csv(...)로 전체 CSV를 문자열로 만들어 st.download_button에 넘겼다 — 아무도 누르지 않아도.
+# 여기서는
+#   - st.download_button(data=콜러블)로 넘겨 클릭했을 때만 만든다 (rerun에서는 콜러블 등록만)
+#   - (데이터 지문, 컬럼, 정렬, 형식) 키로 data/exports/에 파일을 남겨 같은 내보내기는 다시 직렬화하지 않는다
+#   - CSV(utf-8-sig) / gzip CSV / Parquet(pyarrow가 있을 때) 형식을 고를 수 있고
+#   - CSV는 CHUNK_ROWS 행씩 파일에 바로 써서 전체 CSV 문자열을 메모리에 만들지 않는다
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+import uuid
+from typing import Optional, Sequence
+
+import pandas as pd
+import streamlit as st
+
+import registry
+
+EXPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "exports")
+MAX_FILES = 32                 # 보관할 내보내기 파일 수 (오래 안 쓴 것부터 삭제)
+MAX_BYTES = 512 * 2**20        # 보관 총량
+CHUNK_ROWS = 50_000            # CSV 청크 / Parquet row group 크기
+
+# 형식 → (표시 이름, 확장자, MIME)
+FORMATS = {
+    "csv": ("CSV", ".csv", "text/csv"),
+    "csv.gz": ("CSV (gzip)", ".csv.gz", "application/gzip"),
+    "parquet": ("Parquet", ".parquet", "application/vnd.apache.parquet"),
+}
+
+_locks: dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+stats = {"built": 0, "hits": 0}
+
+
+def available_formats() -> list[str]:
+    fmts = ["csv", "csv.gz"]
+    try:
+        import pyarrow  # noqa: F401
+        fmts.append("parquet")
+    except ImportError:
+        pass
+    return fmts
+
+
+def export_key(df: pd.DataFrame, columns: Optional[Sequence[str]], sort, fmt: str) -> str:
+    token = registry.token_of(df)   # 등록된 프레임은 토큰, 아니면 내용 지문 (클릭 시점에만 계산)
+    raw = repr((token, tuple(columns) if columns else None, sort, fmt))
+    return hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+
+def _view(df: pd.DataFrame, columns, sort) -> pd.DataFrame:
+    view = df[list(columns)] if columns else df
+    if sort:
+        by, ascending = sort
+        view = view.sort_values(list(by), ascending=ascending)
+    return view
+
+
+# ===================== 직렬화 =====================
+def _write_csv(view: pd.DataFrame, path: str, compress: bool) -> None:
+    opener = (lambda p: gzip.open(p, "wt", encoding="utf-8-sig", newline="", compresslevel=6)) if compress \
+        else (lambda p: open(p, "w", encoding="utf-8-sig", newline=""))
+    with opener(path) as f:
+        if view.empty:
+            view.to_csv(f, index=False)
+        for i in range(0, len(view), CHUNK_ROWS):
+            view.iloc[i:i+CHUNK_ROWS].to_csv(f, index=False, header=(i == 0))
+
+
+def _write_parquet(view: pd.DataFrame, path: str) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # 청크마다 스키마를 추론하면 빈 청크의 타입이 달라질 수 있어 테이블은 한 번에 변환하고, 쓰기만 row group 단위로
+    table = pa.Table.from_pandas(view, preserve_index=False)
+    pq.write_table(table, path, row_group_size=CHUNK_ROWS, compression="zstd")
+
+
+def _prune() -> None:
+    entries = []
+    for name in os.listdir(EXPORT_DIR):
+        p = os.path.join(EXPORT_DIR, name)
+        if not name.startswith(".") and os.path.isfile(p):
+            stt = os.stat(p)
+            entries.append((stt.st_mtime, stt.st_size, p))
+    entries.sort(reverse=True)
+    total = 0
+    for i, (_, size, p) in enumerate(entries):
+        total += size
+        if i >= MAX_FILES or total > MAX_BYTES:
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+
+
+def export_path(df: pd.DataFrame, fmt: str = "csv", columns: Optional[Sequence[str]] = None, sort=None) -> str:
+    """내보내기 파일 경로 — 캐시에 있으면 그대로, 없으면 만든다. sort: (컬럼 목록, ascending)."""
+    key = export_key(df, columns, sort, fmt)
+    path = os.path.join(EXPORT_DIR, key + FORMATS[fmt][1])
+    with _locks_guard:
+        lock = _locks.setdefault(key, threading.Lock())
+    with lock:   # 같은 내보내기를 동시에 누르면 한 번만 만든다
+        if os.path.exists(path):
+            os.utime(path)   # LRU: 최근 사용 표시
+            stats["hits"] += 1
+            return path
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        view = _view(df, columns, sort)
+        tmp = os.path.join(EXPORT_DIR, f".{key}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            if fmt == "parquet":
+                _write_parquet(view, tmp)
+            else:
+                _write_csv(view, tmp, compress=(fmt == "csv.gz"))
+            os.replace(tmp, path)   # 다 쓴 파일만 보이도록
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        stats["built"] += 1
+        _prune()
+    return path
+
+
+def export_bytes(df: pd.DataFrame, fmt: str = "csv", columns: Optional[Sequence[str]] = None, sort=None) -> bytes:
+    """st.download_button 콜러블의 반환값 (Streamlit이 응답용으로 어차피 bytes로 읽는다)."""
+    with open(export_path(df, fmt, columns, sort), "rb") as f:
+        return f.read()
+
+
+# ===================== UI =====================
+def download_button(label: str, df: pd.DataFrame, file_name: str, key: str,
+                    columns: Optional[Sequence[str]] = None, sort=None, **button_kw) -> bool:
+    """형식 선택 + 지연 생성 다운로드 버튼. file_name은 확장자 없이 (형식에 따라 붙는다)."""
+    fmts = available_formats()
+    fmt = st.radio("형식", fmts, format_func=lambda f: FORMATS[f][0], horizontal=True,
+                   key=f"{key}_fmt", label_visibility="collapsed")
+    _, ext, mime = FORMATS[fmt]
+    columns = list(columns) if columns else None
+    return st.download_button(
+        label,
+        data=lambda: export_bytes(df, fmt, columns, sort),   # 클릭했을 때만 실행 (별도 스레드)
+        file_name=file_name + ext,
+        mime=mime,
+        key=key,
+        **button_kw,
+    )
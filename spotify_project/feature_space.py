@@ -0,0 +1,159 @@
+# feature_space.py — 오디오 특성 공간 (표준화 + PCA + 최근접 이웃)
+# 페이지 01의 'PCA 2D'와 '비슷한 장수곡 찾기'가 같은 공간을 쓰도록, 데이터셋 버전마다 한 번만
+#   특성 행렬(float32, C-연속) → 표준화 → 주성분 → 투영
+# 을 계산해 둔다 (페이지에서는 tab_memo로 버전별 메모).
+#
+# PCA는 특성 수(d)가 작으므로 공분산(d×d) 고유분해로 정확히 푼다. 공분산은 (n, Σx, Σxxᵀ)만 누적하면 되므로
+# partial_fit()으로 청크 단위 증분 적합이 가능하다 (수백만 행도 메모리에 한 번에 올리지 않음).
+# d가 큰 행렬은 randomized_pca()(랜덤 투영 + 거듭제곱 반복)로 상위 k개 성분만 근사한다.
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+AUDIO_COLS = [
+    "danceability", "energy", "valence", "tempo", "acousticness",
+    "instrumentalness", "liveness", "speechiness",
+]
+RANDOMIZED_MIN_DIM = 64   # 이 이상이면 공분산 고유분해 대신 randomized PCA
+CHUNK = 65536             # 투영/이웃 탐색 청크 행 수
+
+
+def feature_matrix(df: pd.DataFrame, cols: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """(X float32 C-연속, 사용한 행 마스크). 특성이 하나라도 비어 있는 행은 제외."""
+    X = np.column_stack([pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=np.float64) for c in cols])
+    mask = np.isfinite(X).all(axis=1)
+    return np.ascontiguousarray(X[mask], dtype=np.float32), mask
+
+
+def randomized_pca(Z: np.ndarray, k: int, oversample: int = 10, n_iter: int = 4, seed: int = 0):
+    """중심화된 Z(n×d)의 상위 k개 (성분 k×d, 분산 k) — Halko et al. 랜덤 SVD."""
+    rng = np.random.default_rng(seed)
+    Q = Z @ rng.standard_normal((Z.shape[1], k + oversample)).astype(Z.dtype)
+    for _ in range(n_iter):   # 거듭제곱 반복으로 스펙트럼 감쇠가 느린 경우 보정
+        Q, _ = np.linalg.qr(Z @ (Z.T @ Q))
+    Q, _ = np.linalg.qr(Q)
+    _, s, vt = np.linalg.svd(Q.T @ Z, full_matrices=False)
+    return vt[:k], (s[:k] ** 2) / max(len(Z) - 1, 1)
+
+
+class FeatureSpace:
+    """표준화 + PCA 공간.
+
+    - partial_fit(): 청크를 더해 (n, Σx, Σxxᵀ) 누적 → finalize()로 평균/표준편차/주성분 계산
+    - transform(): 표준화 좌표, project(): 주성분 좌표 (모두 float32)
+    """
+
+    def __init__(self, cols: list[str], n_components: int = 2):
+        self.cols = list(cols)
+        self.k = n_components
+        d = len(self.cols)
+        self.n = 0
+        self._sx = np.zeros(d)
+        self._sxx = np.zeros((d, d))
+        self.mean_ = self.scale_ = self.components_ = self.explained_variance_ratio_ = None
+
+    # ── 적합 ──
+    def partial_fit(self, X: np.ndarray) -> "FeatureSpace":
+        X64 = X.astype(np.float64, copy=False)
+        self.n += len(X64)
+        self._sx += X64.sum(axis=0)
+        self._sxx += X64.T @ X64
+        return self
+
+    def finalize(self) -> "FeatureSpace":
+        n = max(self.n, 1)
+        mean = self._sx / n
+        cov = (self._sxx - n * np.outer(mean, mean)) / max(self.n - 1, 1)
+        std = np.sqrt(np.clip(np.diag(cov), 0, None))
+        std[std == 0] = 1.0
+        corr = cov / np.outer(std, std)        # 표준화된 특성의 공분산 = 상관행렬
+        vals, vecs = np.linalg.eigh(corr)
+        order = np.argsort(vals)[::-1]
+        vals, vecs = vals[order], vecs[:, order]
+        self.mean_ = mean.astype(np.float32)
+        self.scale_ = std.astype(np.float32)
+        self.components_ = np.ascontiguousarray(vecs[:, :self.k].T, dtype=np.float32)
+        total = vals.clip(min=0).sum()
+        self.explained_variance_ratio_ = (vals[:self.k] / total) if total > 0 else np.zeros(self.k)
+        return self
+
+    @classmethod
+    def fit(cls, X: np.ndarray, cols: list[str], n_components: int = 2) -> "FeatureSpace":
+        fs = cls(cols, n_components)
+        if X.shape[1] >= RANDOMIZED_MIN_DIM:
+            fs.n = len(X)
+            fs.mean_ = X.mean(axis=0, dtype=np.float64).astype(np.float32)
+            fs.scale_ = X.std(axis=0, ddof=1, dtype=np.float64).astype(np.float32)
+            fs.scale_[fs.scale_ == 0] = 1.0
+            comps, var = randomized_pca(fs.transform(X), n_components)
+            fs.components_ = np.ascontiguousarray(comps, dtype=np.float32)
+            fs.explained_variance_ratio_ = var / X.shape[1]   # 표준화 후 총분산 = d
+            return fs
+        for i in range(0, len(X), CHUNK):
+            fs.partial_fit(X[i:i+CHUNK])
+        return fs.finalize()
+
+    # ── 투영 ──
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        return np.ascontiguousarray((X - self.mean_) / self.scale_, dtype=np.float32)
+
+    def project(self, X: np.ndarray) -> np.ndarray:
+        out = np.empty((len(X), self.k), dtype=np.float32)
+        for i in range(0, len(X), CHUNK):
+            out[i:i+CHUNK] = self.transform(X[i:i+CHUNK]) @ self.components_.T
+        return out
+
+
+class NeighborIndex:
+    """표준화 공간의 최근접 이웃 (유클리드). ‖a−b‖² = ‖a‖² + ‖b‖² − 2a·b 로 청크 단위 행렬곱."""
+
+    def __init__(self, Z: np.ndarray):
+        self.Z = np.ascontiguousarray(Z, dtype=np.float32)
+        self.norms = np.einsum("ij,ij->i", self.Z, self.Z)
+
+    def query(self, q: np.ndarray, k: int = 10, exclude: Optional[int] = None) -> tuple[np.ndarray, np.ndarray]:
+        """(행 인덱스, 거리) — 가까운 순. exclude는 자기 자신 행 제외용."""
+        q = np.asarray(q, dtype=np.float32)
+        d2 = np.empty(len(self.Z), dtype=np.float32)
+        for i in range(0, len(self.Z), CHUNK):
+            d2[i:i+CHUNK] = self.norms[i:i+CHUNK] - 2 * (self.Z[i:i+CHUNK] @ q)
+        d2 += q @ q
+        if exclude is not None:
+            d2[exclude] = np.inf
+        k = min(k, len(d2) - (exclude is not None))
+        if k <= 0:
+            return np.array([], dtype=int), np.array([], dtype=np.float32)
+        idx = np.argpartition(d2, k - 1)[:k]
+        idx = idx[np.argsort(d2[idx])]
+        return idx, np.sqrt(np.clip(d2[idx], 0, None))
+
+
+class AudioSpace:
+    """데이터셋 하나의 특성 공간 묶음 — 사용 행 인덱스, PCA 좌표, 이웃 인덱스."""
+
+    def __init__(self, df: pd.DataFrame, cols: Optional[list[str]] = None, n_components: int = 2):
+        cols = [c for c in (cols or AUDIO_COLS) if c in df.columns]
+        self.cols = cols
+        if len(cols) < 2:
+            self.index = df.index[:0]
+            self.space = None
+            return
+        X, mask = feature_matrix(df, cols)
+        self.index = df.index[mask]
+        self.space = FeatureSpace.fit(X, cols, n_components) if len(X) >= 2 else None
+        if self.space is not None:
+            self.coords = self.space.project(X)
+            self.nn = NeighborIndex(self.space.transform(X))
+
+    @property
+    def ok(self) -> bool:
+        return self.space is not None
+
+    def similar(self, row_label, k: int = 10) -> pd.DataFrame:
+        """row_label(원본 df 인덱스)과 가까운 곡 k개: (원본 인덱스, distance)."""
+        pos = self.index.get_loc(row_label)
+        idx, dist = self.nn.query(self.nn.Z[pos], k, exclude=pos)
+        return pd.DataFrame({"distance": dist.round(3)}, index=self.index[idx])
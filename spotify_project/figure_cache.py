@@ -0,0 +1,57 @@
+# figure_cache.py — Plotly 차트 캐시 (입력 데이터 지문 + 차트 파라미터 키)
+# 같은 데이터/같은 옵션이면 세션이 달라도 px.* 재생성 없이 직렬화해 둔 JSON에서 복원한다.
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable
+
+import pandas as pd
+
+from fingerprint import builder_id
+import profiler
+from lazy_tabs import freeze_state
+import registry
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+MAX_FIGURES = 128  # 보관할 figure JSON 개수 (LRU)
+
+_figs: "OrderedDict[tuple, str]" = OrderedDict()
+_lock = threading.Lock()
+stats = {"hit": 0, "miss": 0}
+
+
+def cached_figure(builder: Callable[..., go.Figure], df: pd.DataFrame, **params) -> go.Figure:
+    """builder(df, **params)로 만든 figure를 JSON으로 캐시.
+
+    builder는 px.scatter 같은 px 함수나, px 호출 뒤 update_layout 등을 하는 함수.
+    params는 차트 모양을 결정하는 값만 넘긴다(키에 포함됨).
+    """
+    key = (builder_id(builder), registry.token_of(df), freeze_state(params))
+    with _lock:
+        js = _figs.get(key)
+        if js is not None:
+            _figs.move_to_end(key)
+            stats["hit"] += 1
+    if js is not None:
+        import plotly.io as pio
+        return pio.from_json(js)
+
+    with profiler.section(f"figure: {getattr(builder, '__name__', 'builder')}"):
+        fig = builder(df, **params)
+    with profiler.section("figure: to_json"):
+        js = fig.to_json()
+    with _lock:
+        stats["miss"] += 1
+        _figs[key] = js
+        _figs.move_to_end(key)
+        while len(_figs) > MAX_FIGURES:
+            _figs.popitem(last=False)
+    return fig
+
+
+def clear():
+    with _lock:
+        _figs.clear()
@@ -0,0 +1,27 @@
+# fingerprint.py — DataFrame 내용 지문(fingerprint)
+# 캐시 키로 프레임 전체를 pickle/비교하는 대신, 컬럼별 벡터화 해시를 짧은 토큰으로 압축한다.
+from __future__ import annotations
+
+import hashlib
+
+import pandas as pd
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """스키마(컬럼·dtype·행 수)와 값 해시를 합친 16자리 토큰. 행 순서가 바뀌면 값이 달라진다."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(repr((tuple(map(str, df.columns)), tuple(map(str, df.dtypes)), df.shape)).encode())
+    try:
+        row_hash = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        # 리스트/딕셔너리 같은 해시 불가 값이 섞인 컬럼은 문자열로 바꿔서 해시
+        row_hash = pd.util.hash_pandas_object(df.astype(str), index=False)
+    h.update(row_hash.to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def builder_id(fn) -> str:
+    """차트 빌더 함수 식별자. 페이지 스크립트 함수는 __module__이 모두 "__main__"이라 파일 경로까지 포함."""
+    code = getattr(fn, "__code__", None)
+    where = code.co_filename if code is not None else fn.__module__
+    return f"{where}:{fn.__qualname__}"
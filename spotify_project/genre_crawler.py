@@ -0,0 +1,167 @@
+# genre_crawler.py — genre:"k-pop" 트랙 검색을 파티션으로 나눠 1,000건 한도 너머까지 수집
+# search API는 offset + limit <= 1000까지만 허용하므로 쿼리 하나로는 최대 1,000곡이다. 여기서는
+#   1) market × year:범위 로 쿼리 공간을 나누고, 첫 페이지의 total이 1,000을 넘으면
+#      연도 범위를 반으로 → 단일 연도면 tag 파티션(tag:new, tag:hipster)을 추가로 연다
+#   2) 잎 파티션의 나머지 페이지는 스레드 풀에서 동시에 받되, 모든 호출은 공유 속도 제한(rate_limit.shared)을 거친다
+#   3) 파티션끼리 겹치는 곡(여러 market, tag)은 track_id로 한 번만 남긴다
+#   4) 받은 페이지는 파티션별로 result_store에 보관 → 목표 곡 수를 늘리면 모자란 페이지만 더 받는다
+# ⚠️ 한도: year: 필터는 연 단위가 최소라, 단일 연도는 (tag 없음 + tag 2개) × 1,000 = market당 최대 YEAR_CAP곡이다
+#    (겹침 포함). 곡이 그보다 많은 연도는 나머지를 받지 못한다 — 더 필요하면 market을 추가한다. capacity() 참고.
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Optional
+
+import pandas as pd
+
+import metrics
+import rate_limit
+import result_store
+
+QUERY = 'genre:"k-pop"'
+STORE_NS = "genre_crawl"
+STORE_TTL = 24 * 3600     # 1일
+PAGE_SIZE = 50            # search API 최대 limit
+MAX_OFFSET = 1000         # search API offset 한도
+TAGS = ("tag:new", "tag:hipster")
+YEAR_CAP = MAX_OFFSET * (1 + len(TAGS))   # 단일 연도 × market 하나에서 받을 수 있는 최대 곡 수
+WORKERS = 4
+ROW_COLS = ["track_id", "track_name", "artist", "album", "release_date", "duration_min"]
+
+stats = {"pages": 0, "stored_pages": 0, "partitions": 0, "errors": 0}
+
+# 파티션: (market, 시작 연도, 끝 연도, tag 또는 None)
+
+
+def capacity(n_markets: int, years: tuple[int, int]) -> int:
+    """crawl()이 받을 수 있는 곡 수의 상한 (파티션 간 겹침 포함 — 실제 고유 곡 수는 더 적다)."""
+    return n_markets * (years[1] - years[0] + 1) * YEAR_CAP
+
+
+def query_string(part) -> str:
+    _, y0, y1, tag = part
+    q = f"{QUERY} year:{y0}" if y0 == y1 else f"{QUERY} year:{y0}-{y1}"
+    return f"{q} {tag}" if tag else q
+
+
+def _key(part) -> str:
+    market, y0, y1, tag = part
+    return f"{market or '-'}|{y0}-{y1}|{tag or '-'}"
+
+
+def _row(it: dict) -> dict:
+    return {
+        "track_id": it["id"],
+        "track_name": it.get("name"),
+        "artist": ", ".join(a["name"] for a in (it.get("artists") or [])),
+        "album": (it.get("album") or {}).get("name"),
+        "release_date": (it.get("album") or {}).get("release_date"),
+        "duration_min": (it.get("duration_ms") or 0) / 60000.0,
+    }
+
+
+def _plan(part, total: int) -> tuple[list[int], list]:
+    """첫 페이지의 total로 (받을 offset 목록, 하위 파티션 목록) 결정."""
+    market, y0, y1, tag = part
+    if total > MAX_OFFSET and y0 < y1:
+        mid = (y0 + y1) // 2
+        return [0], [(market, y0, mid, tag), (market, mid + 1, y1, tag)]
+    children = [(market, y0, y1, t) for t in TAGS] if total > MAX_OFFSET and tag is None else []
+    return list(range(0, min(total, MAX_OFFSET), PAGE_SIZE)), children
+
+
+def _fetch(sp, limiter, part, offset: int) -> tuple[int, list[dict]]:
+    res = limiter.call(sp.search, q=query_string(part), type="track",
+                       limit=PAGE_SIZE, offset=offset, market=part[0])
+    page = (res or {}).get("tracks") or {}
+    items = [it for it in (page.get("items") or []) if it and it.get("id")]
+    return int(page.get("total") or 0), [_row(it) for it in items]
+
+
+def _assemble(part, states: dict, out: dict) -> None:
+    """파티션 트리 순서(연도 → tag, 페이지 offset 순)로 행을 모은다 — 완료 순서와 무관하게 결과가 같도록."""
+    state = states.get(part)
+    if not state or state["total"] is None:
+        return
+    for off in sorted(state["pages"], key=int):
+        for r in state["pages"][off]:
+            out.setdefault(r["track_id"], r)
+    for child in _plan(part, state["total"])[1]:
+        _assemble(child, states, out)
+
+
+def crawl(sp, target: int, markets: Iterable[Optional[str]] = ("KR",), years: tuple[int, int] = (2020, 2025),
+          workers: int = WORKERS, limiter: Optional[rate_limit.RateLimiter] = None) -> pd.DataFrame:
+    """market별 genre 검색을 파티션으로 나눠 최대 target곡 (track_id 기준 중복 제거)."""
+    limiter = limiter or rate_limit.shared
+    roots = [(m, years[0], years[1], None) for m in dict.fromkeys(markets)]
+    states: dict = {}
+    ids: set = set()
+    pending: deque = deque()
+    dirty: set = set()
+    first_error: Optional[Exception] = None
+
+    def expand(part):
+        state = states[part]
+        if state["total"] is None:
+            pending.append((part, 0))
+            return
+        offsets, children = _plan(part, state["total"])
+        pending.extend((part, off) for off in offsets if str(off) not in state["pages"])
+        for child in children:
+            visit(child)
+
+    def visit(part):
+        if part in states:
+            return
+        hit = result_store.get(STORE_NS, _key(part), max_age=STORE_TTL)
+        states[part] = hit[0] if hit else {"total": None, "pages": {}}
+        stats["partitions"] += 1
+        for rows in states[part]["pages"].values():
+            stats["stored_pages"] += 1
+            metrics.cache_event(STORE_NS, True)
+            ids.update(r["track_id"] for r in rows)
+        expand(part)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for root in roots:
+                visit(root)
+            inflight = {}
+            while True:
+                # 목표를 채우면 새 페이지는 더 내보내지 않는다 (이미 나간 요청은 받아서 저장)
+                while pending and len(inflight) < workers * 2 and len(ids) < target:
+                    part, off = pending.popleft()
+                    inflight[ex.submit(_fetch, sp, limiter, part, off)] = (part, off)
+                if not inflight:
+                    break
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    part, off = inflight.pop(fut)
+                    try:
+                        total, rows = fut.result()
+                    except Exception as e:
+                        stats["errors"] += 1
+                        first_error = first_error or e
+                        continue
+                    stats["pages"] += 1
+                    metrics.cache_event(STORE_NS, False)
+                    state = states[part]
+                    is_probe = state["total"] is None
+                    state["total"] = total
+                    state["pages"][str(off)] = rows
+                    ids.update(r["track_id"] for r in rows)
+                    dirty.add(part)
+                    if is_probe:
+                        expand(part)
+    finally:
+        if dirty:
+            result_store.put_many(STORE_NS, {_key(p): states[p] for p in dirty})
+
+    out: dict = {}
+    for root in roots:
+        _assemble(root, states, out)
+    if not out and first_error is not None:
+        raise first_error
+    return pd.DataFrame(list(out.values())[:target], columns=ROW_COLS)
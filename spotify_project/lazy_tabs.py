@@ -0,0 +1,67 @@
+# lazy_tabs.py — 탭 단위 지연 계산 레이어
+# st.tabs는 기본적으로 모든 탭 내용을 매 rerun마다 실행한다.
+# 여기서는 (1) 선택된 탭만 실행되도록 lazy 탭을 만들고,
+# (2) 탭별 집계/차트를 (데이터셋 버전, 필터 상태) 키로 메모이즈한다.
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import streamlit as st
+
+import profiler
+import registry
+
+MAX_MEMO = 256  # 프로세스 전체에서 유지할 탭 결과 수 (LRU)
+
+_memo: "OrderedDict[tuple, Any]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def freeze_state(v):
+    """리스트/딕셔너리 등 필터 상태를 해시 가능한 튜플로 변환."""
+    if isinstance(v, dict):
+        return tuple(sorted((k, freeze_state(x)) for k, x in v.items()))
+    if isinstance(v, (list, tuple, set)):
+        return tuple(freeze_state(x) for x in (sorted(v, key=repr) if isinstance(v, set) else v))
+    return v
+
+
+def remember_load(key: str, clicked: bool, params: dict) -> Optional[dict]:
+    """'불러오기' 버튼으로 확정된 파라미터를 세션에 보관.
+
+    lazy 탭은 탭 전환 시 rerun이 일어나므로, 버튼 클릭 여부만으로 분기하면
+    화면이 비어 버린다. 클릭 시점의 파라미터를 기억해 두고 그대로 재사용한다.
+    """
+    if clicked:
+        st.session_state[key] = dict(params)
+    return st.session_state.get(key)
+
+
+def dataset_version(df, *parts) -> str:
+    """데이터셋 버전 토큰 — 로드된 프레임의 레지스트리 토큰 + 로더 입력.
+    캐시가 만료/초기화되어 로더가 다시 돌면 토큰이 바뀌므로, 이전 데이터로 만든 탭 결과는 쓰이지 않는다."""
+    return repr((registry.token_of(df), freeze_state(parts)))
+
+
+def lazy_tabs(labels: list[str], key: str):
+    """선택된 탭만 실행되는 st.tabs. 각 탭의 .open 으로 실행 여부를 판단한다. (프로파일 중이면 탭별 구간 기록)"""
+    return profiler.tabs(st.tabs(labels, key=key, on_change="rerun"), labels)
+
+
+def tab_memo(section: str, version: str, state: Any, fn: Callable[[], Any]) -> Any:
+    """(section, 데이터셋 버전, 필터 상태)로 탭 결과를 메모이즈. 처음 필요할 때만 fn() 실행."""
+    k = (section, version, freeze_state(state))
+    with _lock:
+        if k in _memo:
+            _memo.move_to_end(k)
+            return _memo[k]
+    with profiler.section(f"memo: {section}"):
+        out = fn()
+    with _lock:
+        _memo[k] = out
+        _memo.move_to_end(k)
+        while len(_memo) > MAX_MEMO:
+            _memo.popitem(last=False)
+    return out
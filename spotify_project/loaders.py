@@ -0,0 +1,166 @@
+# loaders.py — 페이지 01/02/05 데이터 로더 + 기본 파라미터
+# st.cache_* 캐시 키는 함수의 모듈/이름/소스와 인자로 정해지므로, 로더가 페이지 스크립트 안에 있으면
+# 백그라운드 워밍업(warmup.py)이 같은 캐시 항목을 채울 수 없다. 로더를 여기로 모으고,
+# 페이지와 워밍업 모두 run(name, params)로 같은 인자를 만들어 호출한다.
+# market 파라미터는 API에 넘기지 않는다: 시장 구분 없이 한 번 수집하고 곡별 available_markets 비트셋으로
+# 로컬에서 거른다 (markets.py) — 시장을 바꿔도 재수집/캐시 미스가 없다.
+from __future__ import annotations
+
+import json
+import os
+
+import pandas as pd
+import streamlit as st
+
+import markets
+import profiler
+import result_store
+from registry import shared_loader
+from utils import collect_artist_tracks, new_builder
+
+# ===================== 페이지 기본값 (위젯 기본값과 워밍업 대상) =====================
+P01_ARTISTS = ["BTS", "BLACKPINK", "NewJeans", "SEVENTEEN", "IU", "EXO", "TWICE"]
+P02_GROUPS = ["BTS", "BLACKPINK", "NewJeans", "SEVENTEEN",
+              "TWICE", "NCT", "EXO", "IVE", "LE SSERAFIM", "STRAY KIDS"]
+P05_TEXT = "BTS, BLACKPINK, NewJeans, 소녀시대"
+
+# remember_load에 넘기는 params와 같은 모양
+DEFAULTS = {
+    "p01": {"artists": ("BTS", "BLACKPINK"), "top_n": 25, "lite": True,
+            "min_pop": 0, "sort_key": "staying_index", "market": None},
+    "p02": {"groups": tuple(P02_GROUPS[:5]), "limit": 20},
+    "p05": {"groups": tuple(dict.fromkeys(g.strip() for g in P05_TEXT.split(",") if g.strip())),
+            "limit": 25, "market": None},
+}
+
+REQUEST_NS = "load_requests"   # result_store: 페이지별 요청 파라미터 → 요청 횟수
+
+# 캐시 수명 = 워밍업 주기 (warmup.py가 같은 값을 쓴다). 만료된 항목은 다음 워밍업 run()에서 새로 수집된다.
+# 0 이하이면 워밍업이 한 번만 돌므로 만료 없이 프로세스가 끝날 때까지 유지
+REFRESH_SEC = float(os.getenv("WARMUP_INTERVAL_SEC", "21600"))
+CACHE_TTL = REFRESH_SEC if REFRESH_SEC > 0 else None
+
+
+# ===================== 01: 오래 사랑받는 곡 =====================
+# 결과 프레임은 세션 간 공유 (unpickle 사본 없음, 레지스트리 토큰 O(1)) → 페이지에서는 제자리 수정 대신 assign 사용
+@shared_loader("p01_staying", show_spinner=False, ttl=CACHE_TTL)
+def load_staying(artist_list, limit, include_features, pop_floor, sort_key):
+    # 아티스트별 프레임을 concat하지 않고 열 버퍼 하나에 이어 붙인다 (columnar.py)
+    b = new_builder(include_features)
+    for a in artist_list:
+        # ⬇️ 핵심: 검색 기반 페이지네이션으로 limit까지 수집
+        collect_artist_tracks(
+            b, a,
+            limit=limit,
+            use_search=True,      # ★ 중요: top-tracks 10개 한계 우회
+            main_artist=a,        # 시장(KR 등) 필터는 run()에서 로컬로
+        )
+    data = b.build()
+    if data.empty:
+        return data
+    rel = pd.to_datetime(data["album_release_date"], errors="coerce")
+    today = pd.Timestamp.now(tz="UTC").tz_convert(None)
+    age_days = (today - rel).dt.days
+    data["age_years"] = (age_days / 365).round(2)
+    data["staying_index"] = (data["popularity"] / (1 + data["age_years"])).round(2)
+    if pop_floor and pop_floor > 0:
+        data = data[data["popularity"].fillna(0) >= pop_floor]
+
+    if sort_key in data.columns:
+        ascending = False if sort_key in ["staying_index","popularity"] else True
+        data = data.sort_values([sort_key,"popularity"], ascending=[ascending, False], na_position="last")
+    return data.reset_index(drop=True)
+
+
+# ===================== 02: 인기곡 메타 분석 =====================
+# 결과 프레임은 세션 간 공유 → 이후 단계에서는 제자리 수정 대신 assign 사용
+@shared_loader("p02_groups", show_spinner=False, ttl=CACHE_TTL)
+def load_meta_groups(groups, limit):
+    b = new_builder()
+    for g in groups:
+        try:
+            collect_artist_tracks(b, g, limit=limit)
+        except Exception as e:
+            st.warning(f"{g} 처리 중 오류 발생: {e}")
+    df = b.build()
+    if df.empty:
+        return df
+    df["group"] = df["artist"].str.split(",").str[0].str.strip()
+    df = df[["group", "artist", "track_name", "popularity", "album_release_date", "duration_min"]]
+    return df
+
+
+# ===================== 05: 그룹별 곡 특성 =====================
+# 세션마다 unpickle 사본을 만들지 않고 같은 프레임을 공유 (읽기 전용으로 사용)
+@shared_loader("p05_groups", show_spinner=True, ttl=CACHE_TTL)
+def load_group_features(artist_list, limit):
+    with profiler.section("p05.fetch"):
+        b = new_builder()
+        for g in artist_list:
+            # ← 검색 기반으로 limit까지 수집, main_artist: 비교용 고정 라벨
+            collect_artist_tracks(b, g, limit=limit, use_search=True, main_artist=g)
+    with profiler.section("p05.build"):
+        out = b.build()
+    if out.empty:
+        return out
+
+    with profiler.section("p05.derive"):
+        # 협업/단독 구분 (release_year, duration_min은 빌더가 채운다)
+        def _artists_count(s):
+            if pd.isna(s): return 0
+            return len([x.strip() for x in str(s).split(",") if x.strip()])
+        out["artists_count"] = out["artist"].apply(_artists_count)
+        out["collab_flag"] = out["artists_count"].apply(lambda n: "협업" if n > 1 else "단독")
+
+        # 발매 월/분기
+        rel = pd.to_datetime(out["album_release_date"], errors="coerce")
+        out["release_month"] = rel.dt.month
+        out["release_quarter"] = rel.dt.quarter
+
+    return out
+
+
+# ===================== params → 로더 호출 =====================
+def run(name: str, params: dict) -> pd.DataFrame:
+    """remember_load 파라미터로 로더 호출. 페이지와 워밍업이 같은 캐시 키를 쓰도록 인자 모양을 여기서 고정."""
+    with profiler.section(f"load: {name}"):
+        return _run(name, params)
+
+
+def _run(name: str, params: dict) -> pd.DataFrame:
+    if name == "p01":
+        df = load_staying(list(params["artists"]), params["top_n"], include_features=not params["lite"],
+                          pop_floor=params["min_pop"], sort_key=params["sort_key"])
+        return markets.filtered(df, params["market"])       # 공유 프레임 → (프레임, 시장)당 한 번
+    if name == "p02":
+        return load_meta_groups(list(params["groups"]), params["limit"])
+    if name == "p05":
+        df = load_group_features(tuple(params["groups"]), params["limit"])
+        return markets.filtered(df, params["market"])       # 공유 프레임 → (프레임, 시장)당 한 번
+    raise KeyError(name)
+
+
+def _request_key(name: str, params: dict) -> str:
+    return json.dumps([name, {k: list(v) if isinstance(v, tuple) else v for k, v in params.items()}],
+                      ensure_ascii=False, sort_keys=True)
+
+
+def record(name: str, params: dict) -> None:
+    """'불러오기' 클릭 시 요청 횟수 +1 (워밍업이 자주 요청된 조합을 고를 때 사용). 집계는 근사치면 충분."""
+    key = _request_key(name, params)
+    hit = result_store.get(REQUEST_NS, key)
+    result_store.put(REQUEST_NS, key, (hit[0] if hit else 0) + 1)
+
+
+def most_requested(top_k: int) -> list[tuple[str, dict, int]]:
+    """요청 횟수 상위 (name, params, count)."""
+    rows = []
+    for key in result_store.keys(REQUEST_NS):
+        hit = result_store.get(REQUEST_NS, key)
+        if hit is None:
+            continue
+        name, params = json.loads(key)
+        params = {k: tuple(v) if isinstance(v, list) else v for k, v in params.items()}
+        rows.append((name, params, hit[0]))
+    rows.sort(key=lambda r: -r[2])
+    return rows[:top_k]
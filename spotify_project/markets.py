@@ -0,0 +1,102 @@
+# markets.py — 곡별 서비스 국가(available_markets)를 비트셋으로 보관하고 로컬에서 거르기
+# 트랙 JSON의 available_markets(국가 코드 ~185개)를 고정 순서 MARKETS의 비트로 바꿔 곡마다 uint64 3개(24바이트)에 담는다.
+#   - 프레임에서는 markets_0 / markets_1 / markets_2 (uint64) 컬럼 — columnar.TrackColumns가 채운다
+#   - 저장소(result_store, JSON) 행에서는 24바이트의 hex 문자열 (utils.meta_row)
+# 시장 선택(KR, US, …)은 API를 시장마다 다시 검색하지 않고, 한 번 받은 프레임에 비트 AND로 거른다.
+#
+#   markets.mask(df, "KR")                  # KR에서 들을 수 있는 곡 (bool 배열)
+#   markets.mask(df, ["KR", "JP"], "all")   # 두 시장 모두
+#   markets.filtered(df, "KR")              # 공유 프레임용: (프레임, 시장)당 한 번만 계산 (registry.derive)
+#
+# ⚠️ MARKETS 순서가 곧 비트 위치다. 새 시장은 끝에만 추가한다 (192비트까지 여유 7개).
+from __future__ import annotations
+
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# Spotify GET /markets 기준 (ISO 3166-1 alpha-2, 알파벳순으로 시작 — 이후 추가분은 끝에)
+MARKETS = (
+    "AD", "AE", "AG", "AL", "AM", "AO", "AR", "AT", "AU", "AZ", "BA", "BB", "BD", "BE", "BF", "BG",
+    "BH", "BI", "BJ", "BN", "BO", "BR", "BS", "BT", "BW", "BY", "BZ", "CA", "CD", "CG", "CH", "CI",
+    "CL", "CM", "CO", "CR", "CV", "CW", "CY", "CZ", "DE", "DJ", "DK", "DM", "DO", "DZ", "EC", "EE",
+    "EG", "ES", "ET", "FI", "FJ", "FM", "FR", "GA", "GB", "GD", "GE", "GH", "GM", "GN", "GQ", "GR",
+    "GT", "GW", "GY", "HK", "HN", "HR", "HT", "HU", "ID", "IE", "IL", "IN", "IQ", "IS", "IT", "JM",
+    "JO", "JP", "KE", "KG", "KH", "KI", "KM", "KN", "KR", "KW", "KZ", "LA", "LB", "LC", "LI", "LK",
+    "LR", "LS", "LT", "LU", "LV", "LY", "MA", "MC", "MD", "ME", "MG", "MH", "MK", "ML", "MN", "MO",
+    "MR", "MT", "MU", "MV", "MW", "MX", "MY", "MZ", "NA", "NE", "NG", "NI", "NL", "NO", "NP", "NR",
+    "NZ", "OM", "PA", "PE", "PG", "PH", "PK", "PL", "PR", "PS", "PT", "PW", "PY", "QA", "RO", "RS",
+    "RW", "SA", "SB", "SC", "SE", "SG", "SI", "SK", "SL", "SM", "SN", "SR", "ST", "SV", "SZ", "TD",
+    "TG", "TH", "TJ", "TL", "TN", "TO", "TR", "TT", "TV", "TW", "TZ", "UA", "UG", "US", "UY", "UZ",
+    "VC", "VE", "VN", "VU", "WS", "XK", "ZA", "ZM", "ZW",
+)
+WORDS = 3                                   # uint64 워드 수 (192비트)
+COLS = tuple(f"markets_{i}" for i in range(WORDS))
+INDEX = {code: i for i, code in enumerate(MARKETS)}
+assert len(MARKETS) <= WORDS * 64
+
+Codes = Union[str, Iterable[str]]
+
+
+def words(codes: Optional[Iterable[str]]) -> tuple[int, ...]:
+    """국가 코드 목록 → WORDS개의 정수 (목록에 없는 코드는 무시)."""
+    out = [0] * WORDS
+    for code in (codes if codes is not None else ()):
+        i = INDEX.get(code)
+        if i is not None:
+            out[i >> 6] |= 1 << (i & 63)
+    return tuple(out)
+
+
+def to_hex(codes: Optional[Iterable[str]]) -> str:
+    """저장용: 24바이트(리틀 엔디언 uint64 × WORDS)의 hex 문자열."""
+    return np.array(words(codes), dtype="<u8").tobytes().hex()
+
+
+def from_hex(s: Optional[str]) -> tuple[int, ...]:
+    if not s:
+        return (0,) * WORDS
+    return tuple(int(w) for w in np.frombuffer(bytes.fromhex(s), dtype="<u8"))
+
+
+# ===================== 프레임 연산 =====================
+def matrix(df: pd.DataFrame) -> np.ndarray:
+    """비트셋 컬럼 → (행 수, WORDS) uint64 행렬."""
+    return np.column_stack([df[c].to_numpy(dtype=np.uint64) for c in COLS])
+
+
+def _query(codes: Codes) -> np.ndarray:
+    if isinstance(codes, str):
+        codes = [codes]
+    codes = list(codes)
+    unknown = [c for c in codes if c not in INDEX]
+    if unknown:
+        raise KeyError(f"알 수 없는 market: {', '.join(unknown)}")
+    return np.array(words(codes), dtype=np.uint64)
+
+
+def mask(df: pd.DataFrame, codes: Codes, how: str = "any") -> np.ndarray:
+    """codes 중 하나라도(any) / 모두(all) 서비스되는 행의 bool 배열."""
+    q = _query(codes)
+    hit = matrix(df) & q
+    if how == "all":
+        return (hit == q).all(axis=1)
+    return hit.any(axis=1)
+
+
+def filter_frame(df: pd.DataFrame, codes: Optional[Codes], how: str = "any") -> pd.DataFrame:
+    """codes가 없거나 비트셋 컬럼이 없으면 그대로, 아니면 해당 시장 행만 (인덱스는 0부터 다시)."""
+    if not codes or df.empty or COLS[0] not in df.columns:
+        return df
+    return df[mask(df, codes, how)].reset_index(drop=True)
+
+
+def filtered(df: pd.DataFrame, codes: Optional[Codes], how: str = "any") -> pd.DataFrame:
+    """filter_frame()을 (프레임 토큰, 시장) 당 한 번만 계산해 공유 — shared_loader 프레임용."""
+    if not codes or df.empty or COLS[0] not in df.columns:
+        return df
+    import registry
+
+    key = codes if isinstance(codes, str) else ",".join(codes)
+    return registry.derive(df, f"market:{how}:{key}", lambda d: filter_frame(d, codes, how))
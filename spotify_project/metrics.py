@@ -0,0 +1,196 @@
+# metrics.py — Spotify 호출 계측 + Prometheus 텍스트 포맷 내보내기
+# 모든 Spotify API 호출은 spotipy 클라이언트의 requests 세션을 거치므로, 세션의 request()를 감싸서
+#   엔드포인트(ID는 {id}로 정규화) · 메서드 · 상태코드 · 지연 시간 · 응답 바이트 · urllib3 재시도(429/5xx)
+# 를 기록한다. 토큰 발급(accounts.spotify.com) 호출도 auth manager 세션을 감싸 같은 방식으로 센다.
+# 캐시(search_store, audio_features, genre_crawler)는 cache_event()로 hit/miss를 더한다.
+#
+#   instrument(sp)  클라이언트 계측 (spotify_client.get_client가 호출)
+#   render()        Prometheus text exposition format 문자열
+#   start_server()  로컬 HTTP 엔드포인트 (GET /metrics), 프로세스당 한 번
+#
+# 환경변수: METRICS_PORT(기본 9108, 0이면 서버 끔), METRICS_HOST(기본 127.0.0.1)
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+PORT = int(os.getenv("METRICS_PORT", "9108"))
+HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)   # 지연 시간 히스토그램 경계(초)
+
+log = logging.getLogger(__name__)
+
+_ID_RE = re.compile(r"/[0-9A-Za-z]{22}(?=/|$)")   # Spotify base62 ID
+_lock = threading.Lock()
+_requests = defaultdict(int)        # (endpoint, method, status) → 횟수
+_retries = defaultdict(int)         # (endpoint, status) → 재시도 횟수
+_bytes = defaultdict(int)           # endpoint → 응답 바이트
+_latency = {}                       # (endpoint, method) → [버킷별 횟수..., 합, 개수]
+_cache = defaultdict(int)           # (cache, "hit"|"miss") → 횟수
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def endpoint_of(url: str) -> str:
+    """https://api.spotify.com/v1/artists/<id>/top-tracks?… → /artists/{id}/top-tracks"""
+    path = url.split("?", 1)[0]
+    if "accounts.spotify.com" in path:
+        return "token"
+    path = re.sub(r"^https?://[^/]+(/v1)?", "", path)
+    return _ID_RE.sub("/{id}", path) or "/"
+
+
+# ===================== 기록 =====================
+def observe(endpoint: str, method: str, status: str, seconds: float, nbytes: int = 0,
+            retried: tuple = ()) -> None:
+    with _lock:
+        _requests[(endpoint, method, status)] += 1
+        _bytes[endpoint] += nbytes
+        for s in retried:
+            _retries[(endpoint, str(s))] += 1
+        h = _latency.setdefault((endpoint, method), [0] * (len(BUCKETS) + 2))
+        for i, le in enumerate(BUCKETS):
+            if seconds <= le:
+                h[i] += 1
+        h[-2] += seconds
+        h[-1] += 1
+
+
+def cache_event(cache: str, hit: bool, n: int = 1) -> None:
+    if n:
+        with _lock:
+            _cache[(cache, "hit" if hit else "miss")] += n
+
+
+def _retry_history(response) -> tuple:
+    """urllib3가 세션 안에서 자동 재시도한 응답 상태 (spotipy의 Retry 설정)."""
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    return tuple(h.status or "error" for h in (getattr(retries, "history", None) or ()))
+
+
+def _wrap(session) -> None:
+    if getattr(session, "_metrics_wrapped", False):
+        return
+    request = session.request
+
+    def instrumented(method, url, *args, **kwargs):
+        endpoint = endpoint_of(url)
+        t0 = time.perf_counter()
+        try:
+            response = request(method, url, *args, **kwargs)
+        except Exception as e:
+            # RetryError(재시도 소진) / 연결 오류 — 마지막 시도의 상태를 알 수 없으므로 예외 이름으로
+            observe(endpoint, method, type(e).__name__, time.perf_counter() - t0)
+            raise
+        observe(endpoint, method, str(response.status_code), time.perf_counter() - t0,
+                len(response.content or b""), _retry_history(response))
+        return response
+
+    session.request = instrumented
+    session._metrics_wrapped = True
+
+
+def instrument(sp):
+    """spotipy 클라이언트(와 토큰 발급 세션)를 계측하고 그대로 돌려준다."""
+    session = getattr(sp, "_session", None)
+    if session is not None:
+        _wrap(session)
+    auth_session = getattr(getattr(sp, "auth_manager", None), "_session", None)
+    if auth_session is not None:
+        _wrap(auth_session)
+    return sp
+
+
+# ===================== 내보내기 =====================
+def _esc(v) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**kv) -> str:
+    return "{" + ",".join(f'{k}="{_esc(v)}"' for k, v in kv.items()) + "}"
+
+
+def snapshot() -> dict:
+    """현재 값 사본 (관리자 페이지 요약용)."""
+    with _lock:
+        return {
+            "requests": dict(_requests), "retries": dict(_retries), "bytes": dict(_bytes),
+            "latency": {k: list(v) for k, v in _latency.items()}, "cache": dict(_cache),
+        }
+
+
+def render() -> str:
+    import rate_limit
+
+    snap = snapshot()
+    out = [
+        "# HELP spotify_requests_total Spotify API HTTP requests by endpoint, method and final status.",
+        "# TYPE spotify_requests_total counter",
+    ]
+    for (ep, m, s), n in sorted(snap["requests"].items()):
+        out.append(f"spotify_requests_total{_labels(endpoint=ep, method=m, status=s)} {n}")
+    out += ["# HELP spotify_request_retries_total Automatic retries inside the HTTP session by status.",
+            "# TYPE spotify_request_retries_total counter"]
+    for (ep, s), n in sorted(snap["retries"].items()):
+        out.append(f"spotify_request_retries_total{_labels(endpoint=ep, status=s)} {n}")
+    out += ["# HELP spotify_response_bytes_total Response body bytes by endpoint.",
+            "# TYPE spotify_response_bytes_total counter"]
+    for ep, n in sorted(snap["bytes"].items()):
+        out.append(f"spotify_response_bytes_total{_labels(endpoint=ep)} {n}")
+    out += ["# HELP spotify_request_duration_seconds Spotify API request latency including session retries.",
+            "# TYPE spotify_request_duration_seconds histogram"]
+    for (ep, m), h in sorted(snap["latency"].items()):
+        for le, n in zip(BUCKETS, h):
+            out.append(f"spotify_request_duration_seconds_bucket{_labels(endpoint=ep, method=m, le=le)} {n}")
+        out.append(f"spotify_request_duration_seconds_bucket{_labels(endpoint=ep, method=m, le='+Inf')} {h[-1]}")
+        out.append(f"spotify_request_duration_seconds_sum{_labels(endpoint=ep, method=m)} {h[-2]:.6f}")
+        out.append(f"spotify_request_duration_seconds_count{_labels(endpoint=ep, method=m)} {h[-1]}")
+    out += ["# HELP spotify_cache_requests_total Local cache lookups by cache and result.",
+            "# TYPE spotify_cache_requests_total counter"]
+    for (c, r), n in sorted(snap["cache"].items()):
+        out.append(f"spotify_cache_requests_total{_labels(cache=c, result=r)} {n}")
+    st = rate_limit.shared.stats
+    out += ["# HELP spotify_rate_limit_wait_seconds_total Time spent waiting for the shared rate limiter.",
+            "# TYPE spotify_rate_limit_wait_seconds_total counter",
+            f"spotify_rate_limit_wait_seconds_total {st['waited_sec']:.6f}",
+            "# HELP spotify_rate_limit_throttled_total 429 responses that paused the shared rate limiter.",
+            "# TYPE spotify_rate_limit_throttled_total counter",
+            f"spotify_rate_limit_throttled_total {st['throttled']}"]
+    return "\n".join(out) + "\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):   # 스크레이프마다 stderr에 찍지 않는다
+        pass
+
+
+def start_server(port: int = PORT, host: str = HOST) -> Optional[int]:
+    """/metrics 서버를 데몬 스레드로 시작 (프로세스당 한 번). 포트가 사용 중이면 경고만 남긴다."""
+    global _server
+    if port <= 0:
+        return None
+    with _lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _Handler)
+            except OSError as e:
+                log.warning("metrics: %s:%s 바인드 실패: %s", host, port, e)
+                return None
+            threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+        return _server.server_address[1]
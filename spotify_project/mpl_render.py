@@ -0,0 +1,102 @@
+# mpl_render.py — matplotlib/seaborn 차트 렌더링 서비스
+# pyplot(plt.subplots)은 전역 상태(현재 figure/axes)를 공유해 동시 세션에서 꼬일 수 있으므로,
+# 여기서는 객체지향 Figure API로 워커 스레드에서 그리고 PNG 바이트만 돌려준다.
+# 결과는 (빌더, 데이터 지문, 차트 파라미터) 키로 캐시해 같은 차트를 다시 그리지 않는다.
+from __future__ import annotations
+
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+import pandas as pd
+
+from fingerprint import builder_id
+from lazy_tabs import freeze_state
+import registry
+
+MAX_IMAGES = 128   # 보관할 PNG 개수 (LRU)
+WORKERS = 2
+
+_images: "OrderedDict[tuple, bytes]" = OrderedDict()
+_pending: dict[tuple, Future] = {}
+_lock = threading.Lock()
+_pool = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="mpl-render")
+stats = {"hit": 0, "miss": 0}
+
+# matplotlib/seaborn은 import만 수백 ms라 첫 차트를 그릴 때 불러온다 (페이지 콜드 스타트 단축)
+THEME = {"style": "whitegrid", "rc": {"axes.unicode_minus": False}, "font": "Batang"}
+_sns = None
+_theme_lock = threading.Lock()
+
+
+def seaborn():
+    """seaborn 모듈 — 처음 호출 때 import하고 THEME을 프로세스에 한 번 적용."""
+    global _sns
+    with _theme_lock:
+        if _sns is None:
+            import seaborn as sns
+            from matplotlib import font_manager
+            rc = dict(THEME["rc"])
+            # 한글 폰트는 설치되어 있을 때만 지정 (없으면 matplotlib 기본 폰트)
+            if THEME["font"] in {f.name for f in font_manager.fontManager.ttflist}:
+                rc["font.family"] = THEME["font"]
+            sns.set_theme(style=THEME["style"], rc=rc)
+            _sns = sns
+    return _sns
+
+
+def _draw(builder, df, figsize, dpi, params) -> bytes:
+    seaborn()  # 테마 적용 후에 Figure를 만들어야 rcParams가 반영된다
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize, dpi=dpi)
+    ax = fig.add_subplot()
+    builder(ax, df, **params)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    return buf.getvalue()
+
+
+def _store(key, fut: Future):
+    with _lock:
+        _pending.pop(key, None)
+        if fut.exception() is None:
+            _images[key] = fut.result()
+            _images.move_to_end(key)
+            while len(_images) > MAX_IMAGES:
+                _images.popitem(last=False)
+
+
+def submit(builder: Callable, df: pd.DataFrame, figsize=(8, 4.2), dpi=150, **params) -> Future:
+    """builder(ax, df, **params)를 워커에서 그려 PNG 바이트 Future를 반환.
+
+    builder는 pyplot을 쓰지 말고 넘겨받은 ax(및 ax.figure)에만 그린다. seaborn이 필요하면 mpl_render.seaborn().
+    같은 키로 이미 그리는 중이면 그 Future를 공유한다.
+    """
+    key = (builder_id(builder), registry.token_of(df), figsize, dpi, freeze_state(params))
+    with _lock:
+        png = _images.get(key)
+        if png is not None:
+            _images.move_to_end(key)
+            stats["hit"] += 1
+            done: Future = Future()
+            done.set_result(png)
+            return done
+        fut = _pending.get(key)
+        if fut is not None:
+            return fut
+        stats["miss"] += 1
+        fut = _pool.submit(_draw, builder, df, figsize, dpi, params)
+        _pending[key] = fut
+    fut.add_done_callback(lambda f: _store(key, f))
+    return fut
+
+
+def render_png(builder: Callable, df: pd.DataFrame, figsize=(8, 4.2), dpi=150, **params) -> bytes:
+    return submit(builder, df, figsize, dpi, **params).result()
+
+
+def clear():
+    with _lock:
+        _images.clear()
@@ -0,0 +1,222 @@
+# profiler.py — 페이지 렌더 프로파일러 (rerun마다 구간별 wall/CPU/메모리)
+# 페이지가 느릴 때 로딩·파생 컬럼·groupby·차트 생성/직렬화 중 어디서 시간이 가는지 보기 위한 가벼운 계측.
+#
+#   profiler.page(__file__)              # set_page_config 다음에 한 번 — 이번 rerun 시작
+#   with profiler.section("데이터 로드"):  # 구간 계측 (중첩 가능)
+#   @profiler.timed("p05.derive")         # 함수 단위
+#   profiler.tabs(st.tabs(labels), labels)  # 탭마다 자동 구간 (lazy_tabs는 자동 적용)
+#
+# 켜는 방법: 환경변수 PROFILER=1, 또는 관리자가 URL에 ?profile=1&key=<METRICS_ADMIN_KEY> (views/99와 같은 키).
+# 꺼져 있으면 section()은 아무것도 기록하지 않는다.
+# 켜져 있으면
+#   - 사이드바 '⏱ 렌더 프로파일'에 구간별 wall/self/CPU/할당 메모리 표를 보여주고
+#   - data/traces/<페이지>-<시각>.json 에 Chrome trace(chrome://tracing, Perfetto) 형식으로 저장한다.
+# CPU는 스크립트 스레드 기준(time.thread_time), 메모리는 tracemalloc(프로세스 전체) 기준이다.
+# tracemalloc은 할당을 느리게 하므로 프로파일 중인 최상위 구간이 하나라도 열려 있는 동안만 켜고, 모두 닫히면 끈다.
+from __future__ import annotations
+
+import functools
+import json
+import os
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Optional
+
+import streamlit as st
+
+TRACE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "traces")
+MAX_TRACES = 50   # 보관할 trace 파일 수 (오래된 것부터 삭제)
+
+_local = threading.local()
+_pid = os.getpid()
+_trace_lock = threading.Lock()
+_trace_users = 0        # 열려 있는 최상위 구간 수 (모든 세션 합계)
+_trace_owned = False    # 우리가 켠 tracemalloc인지 (다른 코드가 켠 것은 끄지 않는다)
+
+
+def enabled() -> bool:
+    if os.getenv("PROFILER", "").lower() in ("1", "true", "yes"):
+        return True
+    admin_key = os.getenv("METRICS_ADMIN_KEY")
+    if not admin_key:
+        return False
+    try:
+        qp = st.query_params
+        return qp.get("profile") == "1" and qp.get("key") == admin_key
+    except Exception:   # 스크립트 컨텍스트 밖 (워밍업 스레드 등)
+        return False
+
+
+def _trace_begin() -> None:
+    global _trace_users, _trace_owned
+    with _trace_lock:
+        if _trace_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _trace_owned = True
+        _trace_users += 1
+
+
+def _trace_end() -> None:
+    global _trace_users, _trace_owned
+    with _trace_lock:
+        _trace_users -= 1
+        if _trace_users == 0 and _trace_owned:
+            tracemalloc.stop()
+            _trace_owned = False
+
+
+def _slug(path: str) -> str:
+    name = os.path.splitext(os.path.basename(path))[0]
+    return re.sub(r"[^\w.-]+", "_", name)[:60] or "page"
+
+
+# ===================== 한 번의 rerun =====================
+class Run:
+    def __init__(self, page: str):
+        self.page = page
+        self.t0 = time.perf_counter()
+        self.started = time.time()
+        self.tid = threading.get_ident()
+        self.events: list[dict] = []   # 끝난 구간 (Chrome trace 'X' 이벤트 재료)
+        self.stack: list[dict] = []
+        self.overlay = None
+
+    def rows(self) -> list[dict]:
+        return [{
+            "section": "  " * e["depth"] + e["name"],
+            "wall_ms": round(e["wall"] * 1000, 1),
+            "self_ms": round((e["wall"] - e["child_wall"]) * 1000, 1),
+            "cpu_ms": round(e["cpu"] * 1000, 1),
+            "alloc_kb": round(e["alloc"] / 1024, 1),
+            "peak_kb": round(e["peak"] / 1024, 1),
+        } for e in sorted(self.events, key=lambda e: e["start"])]
+
+    def trace(self) -> dict:
+        return {
+            "traceEvents": [{
+                "name": e["name"], "cat": self.page, "ph": "X", "pid": _pid, "tid": self.tid,
+                "ts": round(e["start"] * 1e6, 1), "dur": round(e["wall"] * 1e6, 1),
+                "args": {"cpu_ms": round(e["cpu"] * 1000, 3), "alloc_kb": round(e["alloc"] / 1024, 1),
+                         "peak_kb": round(e["peak"] / 1024, 1)},
+            } for e in self.events],
+            "displayTimeUnit": "ms",
+            "otherData": {"page": self.page, "started": self.started},
+        }
+
+    def flush(self) -> None:
+        """최상위 구간이 끝날 때마다: 오버레이 갱신 + trace 파일 덮어쓰기 (중간에 st.stop()이 나도 남도록)."""
+        if self.overlay is not None:
+            import pandas as pd
+            self.overlay.dataframe(pd.DataFrame(self.rows()), hide_index=True, use_container_width=True)
+        os.makedirs(TRACE_DIR, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+        path = os.path.join(TRACE_DIR, f"{_slug(self.page)}-{stamp}-{int(self.started * 1000) % 1000:03d}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f, ensure_ascii=False)
+        _prune()
+
+
+def _prune() -> None:
+    files = sorted((os.path.join(TRACE_DIR, n) for n in os.listdir(TRACE_DIR) if n.endswith(".json")),
+                   key=os.path.getmtime)
+    for p in files[:-MAX_TRACES]:
+        try:
+            os.remove(p)
+        except OSError:
+            pass
+
+
+def current() -> Optional[Run]:
+    return getattr(_local, "run", None)
+
+
+def page(name: str) -> Optional[Run]:
+    """rerun 시작. 프로파일이 켜져 있으면 Run을 만들고 사이드바 오버레이 자리를 잡는다."""
+    if not enabled():
+        _local.run = None
+        return None
+    run = _local.run = Run(name)
+    with st.sidebar.expander("⏱ 렌더 프로파일", expanded=True):
+        st.caption("구간별 wall / self(하위 구간 제외) / CPU / 할당 메모리")
+        run.overlay = st.empty()
+    return run
+
+
+# ===================== 구간 =====================
+@contextmanager
+def section(name: str):
+    run = current()
+    if run is None or run.tid != threading.get_ident():   # 꺼져 있거나, 다른 스레드(캐시 워커 등)
+        yield
+        return
+    if not run.stack:
+        _trace_begin()
+    mem0 = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    frame = {"name": name, "depth": len(run.stack), "start": time.perf_counter() - run.t0,
+             "cpu0": time.thread_time(), "mem0": mem0, "child_wall": 0.0, "child_peak": 0}
+    run.stack.append(frame)
+    try:
+        yield
+    finally:
+        run.stack.pop()
+        cur, peak = tracemalloc.get_traced_memory()
+        frame["wall"] = time.perf_counter() - run.t0 - frame["start"]
+        frame["cpu"] = time.thread_time() - frame["cpu0"]
+        frame["alloc"] = cur - mem0
+        # 하위 구간이 reset_peak()를 했으므로 이 구간의 최대치는 (마지막 reset 이후, 하위 구간 최대치) 중 큰 값
+        frame["peak"] = max(peak, frame["child_peak"]) - mem0
+        run.events.append(frame)
+        if run.stack:
+            parent = run.stack[-1]
+            parent["child_wall"] += frame["wall"]
+            parent["child_peak"] = max(parent["child_peak"], frame["peak"] + mem0)
+        else:
+            _trace_end()
+            run.flush()
+
+
+def timed(name: Optional[str] = None):
+    """함수 전체를 section(name or 함수 이름)으로 계측하는 데코레이터."""
+    def deco(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with section(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+class _Tab:
+    """탭 컨테이너 + section — `with tab:` 안의 실행 시간을 탭 이름으로 기록. .open 등은 원래 탭으로 위임."""
+
+    def __init__(self, tab, label: str):
+        self._tab = tab
+        self._label = label
+        self._section = None
+
+    def __enter__(self):
+        self._section = section(f"tab: {self._label}")
+        self._section.__enter__()
+        return self._tab.__enter__()
+
+    def __exit__(self, *exc):
+        try:
+            return self._tab.__exit__(*exc)
+        finally:
+            self._section.__exit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._tab, name)
+
+
+def tabs(containers, labels: list[str]) -> list:
+    """st.tabs 결과를 탭별 구간으로 감싼다 (꺼져 있으면 그대로 반환)."""
+    if current() is None:
+        return containers
+    return [_Tab(t, label) for t, label in zip(containers, labels)]
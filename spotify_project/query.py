@@ -0,0 +1,230 @@
+# query.py — 페이지 집계용 분석 쿼리 레이어 (DuckDB, 없으면 pandas)
+# 페이지마다 흩어진 groupby 집계를 aggregate() 한 가지 호출로 바꾼다.
+#   aggregate(data, by="release_year", metrics={"avg_pop": ("popularity", "mean")})
+# source는 DataFrame(복사 없이 스캔) 또는 CSV/Parquet 경로(필요한 컬럼만 읽음).
+#
+# duckdb가 설치되어 있으면 SQL로 실행한다 — 멀티스레드, memory_limit를 넘으면 temp_directory로 내려쓰는
+# out-of-core 집계. 설치되어 있지 않으면 같은 의미의 pandas groupby로 실행한다 (결과 컬럼/정렬 동일).
+#
+# 환경변수: QUERY_ENGINE(auto|duckdb|pandas), QUERY_THREADS, QUERY_MEMORY_LIMIT(예: "2GB")
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMP_DIR = os.path.join(BASE_DIR, "data", "duckdb_tmp")
+
+# 집계 함수 → DuckDB SQL 템플릿 ({c}: 컬럼)
+SQL_AGGS = {
+    "mean": "avg(CAST({c} AS DOUBLE))",
+    "sum": "sum({c})",
+    "count": "count({c})",
+    "size": "count(*)",
+    "median": "median({c})",
+    "min": "min({c})",
+    "max": "max({c})",
+    "nunique": "count(DISTINCT {c})",
+}
+
+Source = Union[pd.DataFrame, str]
+Metric = tuple  # (컬럼, 함수) 또는 (컬럼, "share", 값) — 값과 같은 행의 비율(0~1)
+
+_local = threading.local()
+_base = None
+_base_lock = threading.Lock()
+
+
+# ===================== 엔진 =====================
+def _duckdb():
+    """duckdb 모듈 또는 None (QUERY_ENGINE=pandas면 항상 None)."""
+    if os.getenv("QUERY_ENGINE", "auto") == "pandas":
+        return None
+    try:
+        import duckdb
+    except ImportError:
+        if os.getenv("QUERY_ENGINE") == "duckdb":
+            raise
+        return None
+    return duckdb
+
+
+def engine() -> str:
+    return "duckdb" if _duckdb() is not None else "pandas"
+
+
+def _cursor():
+    """스레드마다 커서 하나 (같은 인메모리 DB 공유 — DuckDB 연결은 스레드 간 공유하지 않는다)."""
+    global _base
+    cur = getattr(_local, "cur", None)
+    if cur is None:
+        duckdb = _duckdb()
+        with _base_lock:
+            if _base is None:
+                os.makedirs(TEMP_DIR, exist_ok=True)
+                config = {"temp_directory": TEMP_DIR}
+                if os.getenv("QUERY_THREADS"):
+                    config["threads"] = int(os.environ["QUERY_THREADS"])
+                if os.getenv("QUERY_MEMORY_LIMIT"):
+                    config["memory_limit"] = os.environ["QUERY_MEMORY_LIMIT"]
+                _base = duckdb.connect(database=":memory:", config=config)
+        cur = _local.cur = _base.cursor()
+    return cur
+
+
+# ===================== SQL 조립 =====================
+def _q(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _lit(v) -> str:
+    if v is None:
+        return "NULL"
+    if isinstance(v, (bool, np.bool_)):
+        return "TRUE" if v else "FALSE"
+    if isinstance(v, (int, float, np.integer, np.floating)):
+        return repr(float(v)) if isinstance(v, (float, np.floating)) else str(int(v))
+    return "'" + str(v).replace("'", "''") + "'"
+
+
+def _bucket_sql(col: str, edges: list, labels: list) -> str:
+    whens = " ".join(f"WHEN {_q(col)} < {_lit(e)} THEN {_lit(l)}" for e, l in zip(edges, labels))
+    return f"CASE WHEN {_q(col)} IS NULL THEN NULL {whens} ELSE {_lit(labels[len(edges)])} END"
+
+
+def _metric_sql(spec: Metric) -> str:
+    col, fn = spec[0], spec[1]
+    if fn == "share":
+        return f"avg(CASE WHEN {_q(col)} = {_lit(spec[2])} THEN 1.0 ELSE 0.0 END)"
+    return SQL_AGGS[fn].format(c=_q(col))
+
+
+def _from_sql(source: Source) -> str:
+    path = str(source)
+    reader = "read_parquet" if path.endswith(".parquet") else "read_csv_auto"
+    return f"{reader}({_lit(path)})"
+
+
+def to_sql(source_sql: str, by: list[str], metrics: dict, where: dict, buckets: dict,
+           fill: dict, needed: list[str], dropna: bool) -> tuple[str, list]:
+    """(SQL, 파라미터). 안쪽 SELECT는 필요한 컬럼만 — Parquet은 컬럼 단위로만 읽는다."""
+    inner = []
+    for c in needed:
+        inner.append(f"coalesce({_q(c)}, {_lit(fill[c])}) AS {_q(c)}" if c in fill else _q(c))
+    for name, (col, edges, labels) in buckets.items():
+        inner.append(f"{_bucket_sql(col, edges, labels)} AS {_q(name)}")
+    conds, params = [], []
+    for c, v in where.items():
+        if isinstance(v, (list, tuple, set)):
+            conds.append(f"{_q(c)} IN ({', '.join('?' * len(v))})")
+            params.extend(v)
+        else:
+            conds.append(f"{_q(c)} = ?")
+            params.append(v)
+    sql = f"SELECT {', '.join(inner)} FROM {source_sql}"
+    if conds:
+        sql += " WHERE " + " AND ".join(conds)
+
+    keys = ", ".join(_q(b) for b in by)
+    aggs = ", ".join(f"{_metric_sql(spec)} AS {_q(name)}" for name, spec in metrics.items())
+    out = f"SELECT {keys}, {aggs} FROM ({sql}) t"
+    if dropna:
+        out += " WHERE " + " AND ".join(f"{_q(b)} IS NOT NULL" for b in by)
+    out += f" GROUP BY {keys} ORDER BY {keys}"
+    return out, params
+
+
+# ===================== pandas 실행 =====================
+def _read(source: str, cols: list[str]) -> pd.DataFrame:
+    if str(source).endswith(".parquet"):
+        return pd.read_parquet(source, columns=cols)
+    return pd.read_csv(source, usecols=lambda c: c in set(cols), encoding="utf-8-sig")
+
+
+def _bucketize(s: pd.Series, edges: list, labels: list) -> pd.Series:
+    x = pd.to_numeric(s, errors="coerce").to_numpy(dtype=float)
+    idx = np.searchsorted(np.asarray(edges, dtype=float), x, side="right")
+    out = np.asarray(labels, dtype=object)[np.minimum(idx, len(labels) - 1)]
+    out[np.isnan(x)] = None
+    return pd.Series(out, index=s.index)
+
+
+def _run_pandas(df: pd.DataFrame, by, metrics, where, buckets, fill, needed, dropna) -> pd.DataFrame:
+    mask = np.ones(len(df), dtype=bool)
+    for c, v in where.items():
+        mask &= df[c].isin(list(v)).to_numpy() if isinstance(v, (list, tuple, set)) else (df[c] == v).to_numpy()
+    work = df.loc[mask, needed] if not mask.all() else df[needed]
+    extra = {c: work[c].fillna(v) for c, v in fill.items() if c in work}
+    extra.update({name: _bucketize(work[col], edges, labels) for name, (col, edges, labels) in buckets.items()})
+    named = {}
+    for name, spec in metrics.items():
+        col, fn = spec[0], spec[1]
+        if fn == "share":
+            extra[f"__{name}"] = (work[col] == spec[2]).astype(float)
+            named[name] = (f"__{name}", "mean")
+        elif fn == "mean":
+            extra[f"__{name}"] = pd.to_numeric(work[col], errors="coerce").astype(float)
+            named[name] = (f"__{name}", "mean")
+        elif fn == "size":
+            extra["__size"] = 1
+            named[name] = ("__size", "size")
+        else:
+            named[name] = (col, fn)
+    if extra:
+        work = work.assign(**extra)
+    g = work.groupby(by, sort=True, dropna=dropna, observed=True)
+    return g.agg(**named).reset_index()
+
+
+# ===================== API =====================
+def aggregate(
+    source: Source,
+    by: Union[str, list[str]],
+    metrics: dict,
+    where: Optional[dict] = None,
+    buckets: Optional[dict] = None,
+    fill: Optional[dict] = None,
+    dropna: bool = True,
+) -> pd.DataFrame:
+    """그룹 집계 — 결과: by 컬럼(오름차순) + metrics 이름 컬럼.
+
+    metrics: {이름: (컬럼, "mean"|"sum"|"count"|"size"|"median"|"min"|"max"|"nunique")}
+             또는 {이름: (컬럼, "share", 값)} — 그룹 안에서 컬럼 == 값인 행의 비율
+    where:   {컬럼: 값 또는 값 목록} — 같음/IN 필터 (그룹 전에 적용)
+    buckets: {새 컬럼: (숫자 컬럼, 경계 목록, 라벨 목록)} — x < 경계[i] 인 첫 구간의 라벨, 마지막 라벨은 나머지.
+             by에 새 컬럼 이름을 쓰면 구간별로 묶인다 (예: 연식 코호트)
+    fill:    {컬럼: 값} — 그룹 전에 빈 값 채우기
+    dropna:  by 값이 비어 있는 행 제외 (pandas groupby 기본과 같음)
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    where, buckets, fill = dict(where or {}), dict(buckets or {}), dict(fill or {})
+    needed = list(dict.fromkeys(
+        [b for b in by if b not in buckets]
+        + [spec[0] for spec in metrics.values()]
+        + [col for col, _, _ in buckets.values()]
+        + list(fill)
+    ))
+
+    if _duckdb() is not None:
+        cur = _cursor()
+        view = None
+        if isinstance(source, pd.DataFrame):
+            view = f"src_{uuid.uuid4().hex[:12]}"
+            cur.register(view, source)   # 복사 없이 pandas 프레임을 스캔
+            source_sql = _q(view)
+        else:
+            source_sql = _from_sql(source)
+        try:
+            sql, params = to_sql(source_sql, by, metrics, where, buckets, fill, needed, dropna)
+            return cur.execute(sql, params).df()
+        finally:
+            if view is not None:
+                cur.unregister(view)
+
+    df = source if isinstance(source, pd.DataFrame) else _read(source, needed + [c for c in where if c not in needed])
+    return _run_pandas(df, by, metrics, where, buckets, fill, needed, dropna)
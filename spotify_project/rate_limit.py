@@ -0,0 +1,88 @@
+# rate_limit.py — Spotify API 공유 속도 제한 (토큰 버킷)
+# 여러 스레드(크롤러 워커, 워밍업, 세션)가 같은 앱 자격 증명으로 호출하므로 제한도 프로세스에 하나만 둔다.
+#   - acquire(): 토큰이 생길 때까지 대기 (초당 rate개, 최대 burst개 적립), asyncio에서는 acquire_async()
+#   - 429 응답이면 Retry-After만큼 모든 호출자를 함께 멈춘 뒤 다시 시도 (call())
+#
+# 환경변수: SPOTIFY_RPS(초당 요청 수, 기본 8), SPOTIFY_BURST(기본 16)
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Callable
+
+MAX_RETRIES = 4
+DEFAULT_RETRY_AFTER = 2.0   # Retry-After 헤더가 없을 때 (초)
+
+
+class RateLimiter:
+    """스레드 안전 토큰 버킷. stats: 호출/대기 시간/429 횟수."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.burst = max(int(burst), 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "waited_sec": 0.0, "throttled": 0}
+
+    def reserve(self) -> float:
+        """토큰을 하나 가져오면 0, 아니면 다시 시도할 때까지의 대기 시간(초). 대기하지 않는다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if now >= self._paused_until and self._tokens >= 1:
+                self._tokens -= 1
+                self.stats["calls"] += 1
+                return 0.0
+            return max(self._paused_until - now, (1 - self._tokens) / self.rate)
+
+    def acquire(self) -> None:
+        waited = 0.0
+        while (delay := self.reserve()) > 0:
+            time.sleep(delay)
+            waited += delay
+        if waited:
+            with self._lock:
+                self.stats["waited_sec"] += waited
+
+    async def acquire_async(self) -> None:
+        """acquire()의 asyncio 버전 — 이벤트 루프를 막지 않고 같은 버킷을 스레드 호출자와 나눠 쓴다."""
+        import asyncio
+
+        waited = 0.0
+        while (delay := self.reserve()) > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        if waited:
+            with self._lock:
+                self.stats["waited_sec"] += waited
+
+    def pause(self, seconds: float) -> None:
+        """429 이후: 지금부터 seconds 동안 모든 acquire()를 멈추고 버킷을 비운다."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self.stats["throttled"] += 1
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """acquire() 후 fn 호출. 429면 Retry-After만큼 멈추고 MAX_RETRIES까지 재시도."""
+        for attempt in range(MAX_RETRIES + 1):
+            self.acquire()
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if getattr(e, "http_status", None) != 429 or attempt == MAX_RETRIES:
+                    raise
+                headers = getattr(e, "headers", None) or {}
+                try:
+                    retry_after = float(headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+                except (TypeError, ValueError):
+                    retry_after = DEFAULT_RETRY_AFTER
+                self.pause(retry_after)
+
+
+# 프로세스 공유 인스턴스
+shared = RateLimiter(float(os.getenv("SPOTIFY_RPS", "8")), int(os.getenv("SPOTIFY_BURST", "16")))
@@ -0,0 +1,110 @@
+# registry.py — 데이터셋 레지스트리 (버전 토큰 + 공유 프레임)
+# st.cache_data는 인자 DataFrame을 통째로 해시하고, 반환값을 매번 unpickle한 사본으로 돌려준다.
+# 여기서는 로드된 프레임마다 짧은 버전 토큰을 붙이고, 프레임 자체는 프로세스 안에서 공유한다.
+# 토큰은 df.attrs가 아니라 프레임 객체(id + weakref)에 붙는다 — attrs는 필터/슬라이스/head() 결과에도
+# 복사되므로, 거기에 두면 부분 프레임이 부모의 토큰(=부모의 캐시 항목)을 물려받는다.
+#
+# ⚠️ 공유 프레임은 읽기 전용으로 다룬다. 컬럼 추가가 필요하면 df.assign(...) 등으로 새 프레임을 만든다.
+from __future__ import annotations
+
+import functools
+import itertools
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import pandas as pd
+import streamlit as st
+
+from fingerprint import frame_fingerprint
+
+MAX_DATASETS = 64      # 공유하는 파생 프레임 수 (LRU)
+
+_tokens: dict[int, tuple[weakref.ref, str]] = {}   # id(df) → (프레임 weakref, 토큰). 프레임이 사라지면 지운다
+_derived: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_lock = threading.Lock()
+_loads = itertools.count(1)   # shared_loader 실행 순번 — 같은 인자라도 다시 로드하면 새 토큰
+
+
+def _put(store: OrderedDict, key, df):
+    with _lock:
+        store[key] = df
+        store.move_to_end(key)
+        while len(store) > MAX_DATASETS:
+            store.popitem(last=False)
+
+
+def file_token(path: str) -> str:
+    """파일 경로 + 수정시각(ns) + 크기 → 버전 토큰. 파일이 바뀌면 토큰도 바뀐다."""
+    stt = os.stat(path)
+    return f"file:{os.path.abspath(path)}:{stt.st_mtime_ns}:{stt.st_size}"
+
+
+def _set_token(df: pd.DataFrame, token: str) -> None:
+    key = id(df)
+    with _lock:
+        _tokens[key] = (weakref.ref(df, lambda _, k=key: _tokens.pop(k, None)), token)
+
+
+def register(name: str, df: pd.DataFrame, version: Optional[str] = None) -> str:
+    """프레임을 등록하고 토큰을 돌려준다. version이 없으면 내용 지문을 사용."""
+    token = f"{name}@{version or frame_fingerprint(df)}"
+    _set_token(df, token)
+    return token
+
+
+def token_of(df: pd.DataFrame) -> str:
+    """등록된 그 프레임 객체면 토큰, 아니면(사본·부분 프레임 포함) 내용 지문."""
+    entry = _tokens.get(id(df))
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+    return f"anon@{frame_fingerprint(df)}"
+
+
+# st.cache_data(hash_funcs=FRAME_HASH): DataFrame 인자를 전체 해시 대신 토큰으로 키잉
+# (등록된 프레임은 O(1) 조회, 등록되지 않은 사본/부분 프레임만 내용 지문)
+FRAME_HASH = {pd.DataFrame: token_of}
+
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_DATASETS)
+def _load_csv(path: str, token: str, read_kw: tuple) -> pd.DataFrame:
+    df = pd.read_csv(path, **dict(read_kw))
+    register(os.path.basename(path), df, version=token)
+    return df
+
+
+def load_csv(path: str, **read_kw) -> pd.DataFrame:
+    """CSV를 (경로, mtime, size) 토큰 기준으로 한 번만 읽어 모든 세션이 같은 프레임을 공유."""
+    return _load_csv(path, file_token(path), tuple(sorted(read_kw.items())))
+
+
+def derive(df: pd.DataFrame, name: str, fn: Callable[[pd.DataFrame], pd.DataFrame]) -> pd.DataFrame:
+    """등록된 프레임에서 파생 프레임을 (부모 토큰, name) 당 한 번만 계산해 공유."""
+    key = (token_of(df), name)
+    with _lock:
+        out = _derived.get(key)
+        if out is not None:
+            _derived.move_to_end(key)
+            return out
+    out = fn(df)
+    if out is not df:   # fn이 그대로 돌려준 경우 부모 토큰을 덮어쓰지 않는다
+        _set_token(out, f"{key[0]}/{name}")
+    _put(_derived, key, out)
+    return out
+
+
+def shared_loader(name: str, **cache_kw):
+    """로더 함수용 데코레이터 — st.cache_resource로 결과 프레임을 복사 없이 공유하고,
+    입력 인자 + 실행 순번을 ingest 버전으로 삼아 레지스트리에 등록한다 (캐시 만료 뒤 재로드는 새 버전)."""
+    def deco(fn):
+        @st.cache_resource(**cache_kw)
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            df = fn(*args, **kwargs)
+            if isinstance(df, pd.DataFrame):
+                register(name, df, version=f"{repr((args, sorted(kwargs.items())))}#{next(_loads)}")
+            return df
+        return wrapper
+    return deco
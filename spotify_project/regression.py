@@ -0,0 +1,95 @@
+# regression.py — 충분통계량 기반 (그룹별) 단순 선형회귀 엔진
+# y ≈ a + b·x 를 그룹마다 np.polyfit 으로 다시 푸는 대신,
+# (n, Σx, Σy, Σxy, Σx², Σy²)만 모아 두고 한 번에 기울기/절편/상관을 계산한다.
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+STAT_COLS = ["n", "sx", "sy", "sxy", "sxx", "syy"]
+FIT_COLS = ["intercept", "slope", "r", "r2", "n"]
+
+_ALL = "__all__"  # by=None 일 때 쓰는 단일 그룹 키
+
+
+def sufficient_stats(df: pd.DataFrame, x: str, y: str, by: Optional[str] = None) -> pd.DataFrame:
+    """x, y가 모두 유한한 행만 모아 그룹별 충분통계량을 한 번의 groupby로 계산."""
+    xv = pd.to_numeric(df[x], errors="coerce").to_numpy(dtype=float)
+    yv = pd.to_numeric(df[y], errors="coerce").to_numpy(dtype=float)
+    msk = np.isfinite(xv) & np.isfinite(yv)
+    xv, yv = xv[msk], yv[msk]
+
+    keys = df[by].to_numpy()[msk] if by else np.full(len(xv), _ALL, dtype=object)
+    parts = pd.DataFrame({
+        "key": keys,
+        "n": 1.0, "sx": xv, "sy": yv,
+        "sxy": xv * yv, "sxx": xv * xv, "syy": yv * yv,
+    })
+    return parts.groupby("key", sort=False)[STAT_COLS].sum()
+
+
+def fit_from_stats(stats: pd.DataFrame) -> pd.DataFrame:
+    """충분통계량 → (intercept, slope, r, r2, n). 점이 2개 미만이거나 x 분산이 0이면 NaN."""
+    n = stats["n"].to_numpy(dtype=float)
+    sx, sy = stats["sx"].to_numpy(), stats["sy"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cxx = stats["sxx"].to_numpy() - sx * sx / n
+        cxy = stats["sxy"].to_numpy() - sx * sy / n
+        cyy = stats["syy"].to_numpy() - sy * sy / n
+        ok = (n >= 2) & (cxx > 0)
+        slope = np.where(ok, cxy / cxx, np.nan)
+        intercept = np.where(ok, (sy - slope * sx) / n, np.nan)
+        r = np.where(ok & (cyy > 0), cxy / np.sqrt(cxx * cyy), np.nan)
+    return pd.DataFrame(
+        {"intercept": intercept, "slope": slope, "r": r, "r2": r * r, "n": n.astype(int)},
+        index=stats.index,
+    )
+
+
+class GroupedRegression:
+    """그룹별 충분통계량을 누적하는 회귀 엔진.
+
+    - update(): 새로 들어온 행만 더해 갱신 (전체 재적합 불필요)
+    - fit(): 그룹별 계수표, overall(): 전체(전역) 계수
+    - residuals(): 원본 프레임을 복사하지 않고 예측/잔차 Series만 반환
+    """
+
+    def __init__(self, x: str, y: str, by: Optional[str] = None):
+        self.x, self.y, self.by = x, y, by
+        self.stats = pd.DataFrame(columns=STAT_COLS, dtype=float)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, x: str, y: str, by: Optional[str] = None) -> "GroupedRegression":
+        return cls(x, y, by).update(df)
+
+    def update(self, df: pd.DataFrame) -> "GroupedRegression":
+        if df is None or df.empty:
+            return self
+        new = sufficient_stats(df, self.x, self.y, self.by)
+        self.stats = new if self.stats.empty else self.stats.add(new, fill_value=0.0)
+        return self
+
+    def fit(self) -> pd.DataFrame:
+        return fit_from_stats(self.stats)
+
+    def overall(self) -> tuple[float, float, float, float]:
+        """모든 그룹을 합친 전역 회귀 (a, b, r, r2) — 통계량 합산만으로 계산."""
+        if self.stats.empty:
+            return np.nan, np.nan, np.nan, np.nan
+        total = fit_from_stats(self.stats.sum().to_frame().T).iloc[0]
+        return float(total["intercept"]), float(total["slope"]), float(total["r"]), float(total["r2"])
+
+    def residuals(self, df: pd.DataFrame, per_group: bool = False) -> tuple[pd.Series, pd.Series]:
+        """(pred, resid). per_group=False면 전역 회귀선, True면 그룹별 회귀선 기준."""
+        xv = pd.to_numeric(df[self.x], errors="coerce")
+        yv = pd.to_numeric(df[self.y], errors="coerce")
+        if per_group and self.by:
+            coef = self.fit()
+            a = df[self.by].map(coef["intercept"])
+            b = df[self.by].map(coef["slope"])
+        else:
+            a, b, _, _ = self.overall()
+        pred = a + b * xv
+        return pred, yv - pred
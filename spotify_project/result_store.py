@@ -0,0 +1,121 @@
+# result_store.py — 세션/프로세스 간 공유되는 키-값 결과 저장소 (SQLite)
+# API로 만든 결과 테이블을 (namespace, key) 단위로 저장하고 fetched_at과 함께 읽어 온다.
+# WAL 모드 + 단일 UPSERT라 여러 세션이 같은 키를 동시에 써도 파일이 깨지거나 섞이지 않는다.
+from __future__ import annotations
+
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import pandas as pd
+
+DEFAULT_PATH = os.getenv(
+    "RESULT_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "results.sqlite"),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    ns          TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    payload     TEXT NOT NULL,
+    fetched_at  REAL NOT NULL,
+    PRIMARY KEY (ns, key)
+)
+"""
+
+_local = threading.local()
+
+
+def _conn(path: str = DEFAULT_PATH) -> sqlite3.Connection:
+    """스레드마다 연결 하나 (sqlite3 연결은 스레드 간 공유하지 않는다)."""
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    con = conns.get(path)
+    if con is None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        con = sqlite3.connect(path, timeout=30, isolation_level=None)
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        con.execute(_SCHEMA)
+        conns[path] = con
+    return con
+
+
+# ===================== JSON 값 =====================
+def put(ns: str, key: str, value, path: str = DEFAULT_PATH) -> float:
+    """값(JSON 직렬화 가능)을 저장하고 fetched_at(epoch 초)을 돌려준다. 같은 키는 덮어쓴다."""
+    now = time.time()
+    _conn(path).execute(
+        "INSERT INTO results (ns, key, payload, fetched_at) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(ns, key) DO UPDATE SET payload=excluded.payload, fetched_at=excluded.fetched_at",
+        (ns, key, json.dumps(value, ensure_ascii=False), now),
+    )
+    return now
+
+
+def get(ns: str, key: str, max_age: Optional[float] = None, path: str = DEFAULT_PATH):
+    """(value, fetched_at) 또는 None. max_age(초)보다 오래된 값은 없는 것으로 본다."""
+    row = _conn(path).execute(
+        "SELECT payload, fetched_at FROM results WHERE ns=? AND key=?", (ns, key)
+    ).fetchone()
+    if row is None or (max_age is not None and time.time() - row[1] > max_age):
+        return None
+    return json.loads(row[0]), row[1]
+
+
+def get_many(ns: str, keys: list[str], max_age: Optional[float] = None, path: str = DEFAULT_PATH) -> dict:
+    """{key: value} — 있는(그리고 max_age 안의) 키만. SQLite 변수 한도를 넘지 않게 나눠 조회."""
+    out, now = {}, time.time()
+    con = _conn(path)
+    for i in range(0, len(keys), 500):
+        chunk = keys[i:i+500]
+        marks = ",".join("?" * len(chunk))
+        for key, payload, fetched_at in con.execute(
+            f"SELECT key, payload, fetched_at FROM results WHERE ns=? AND key IN ({marks})", (ns, *chunk)
+        ):
+            if max_age is None or now - fetched_at <= max_age:
+                out[key] = json.loads(payload)
+    return out
+
+
+def put_many(ns: str, items: dict, path: str = DEFAULT_PATH) -> float:
+    """{key: value}를 한 트랜잭션으로 저장."""
+    now = time.time()
+    con = _conn(path)
+    with con:
+        con.execute("BEGIN")
+        con.executemany(
+            "INSERT INTO results (ns, key, payload, fetched_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(ns, key) DO UPDATE SET payload=excluded.payload, fetched_at=excluded.fetched_at",
+            [(ns, k, json.dumps(v, ensure_ascii=False), now) for k, v in items.items()],
+        )
+    return now
+
+
+def delete(ns: str, key: str, path: str = DEFAULT_PATH) -> None:
+    _conn(path).execute("DELETE FROM results WHERE ns=? AND key=?", (ns, key))
+
+
+def keys(ns: str, path: str = DEFAULT_PATH) -> list[str]:
+    return [r[0] for r in _conn(path).execute("SELECT key FROM results WHERE ns=? ORDER BY key", (ns,))]
+
+
+# ===================== DataFrame =====================
+def put_frame(ns: str, key: str, df: pd.DataFrame, path: str = DEFAULT_PATH) -> float:
+    return put(ns, key, json.loads(df.to_json(orient="split", index=False, force_ascii=False)), path)
+
+
+def get_frame(ns: str, key: str, max_age: Optional[float] = None, path: str = DEFAULT_PATH):
+    """(DataFrame, fetched_at) 또는 None."""
+    hit = get(ns, key, max_age, path)
+    if hit is None:
+        return None
+    value, fetched_at = hit
+    df = pd.read_json(io.StringIO(json.dumps(value)), orient="split", dtype=False)
+    return df, fetched_at
@@ -0,0 +1,91 @@
+# search_store.py — 아티스트 트랙 검색 결과의 증분 페이지네이션 저장소
+# sp.search(q='artist:"…"', type="track")로 모은 결과를 (아티스트, market) 단위로 result_store에 보관한다.
+#   - 저장 내용: 지금까지 받은 행(track_id 중복 제거, 검색 순서 유지) + 다음 offset + total
+#   - limit이 저장된 행 수 이하 → 앞부분(prefix)만 잘라서 반환 (API 호출 없음)
+#   - limit이 더 크면 → 다음 offset부터 모자란 페이지만 추가로 받아 이어 붙인다
+# 검색 순서/인기도는 시간이 지나면 바뀌므로 TTL이 지난 항목은 처음부터 다시 받는다.
+from __future__ import annotations
+
+import threading
+from typing import Callable, Optional
+
+import metrics
+import result_store
+from artist_index import normalize
+
+STORE_NS = "track_search_v2"   # v2: 행에 available_markets_bits 추가 (이전 행은 재사용하지 않음)
+STORE_TTL = 24 * 3600     # 1일
+PAGE_SIZE = 50            # search API 최대 limit
+MAX_OFFSET = 1000         # search API는 offset + limit <= 1000까지만 허용
+MAX_EMPTY_PAGES = 3       # 빈 페이지가 연속으로 이만큼 나오면 더 받지 않는다
+
+_locks: dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+stats = {"pages": 0, "prefix_hits": 0}
+
+
+def _key(artist_name: str, market: Optional[str]) -> str:
+    return f"{normalize(artist_name)}|{market or '-'}"
+
+
+def _lock_for(key: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(key, threading.Lock())
+
+
+def _empty_state() -> dict:
+    return {"rows": [], "next_offset": 0, "total": None, "empty_pages": 0}
+
+
+def _exhausted(state: dict) -> bool:
+    total = state["total"]
+    return (
+        (total is not None and state["next_offset"] >= total)
+        or state["next_offset"] >= MAX_OFFSET
+        or state["empty_pages"] >= MAX_EMPTY_PAGES
+    )
+
+
+def tracks(sp, artist_name: str, market: Optional[str], limit: int,
+           row_fn: Callable[[dict], dict]) -> list[dict]:
+    """(artist_name, market)의 검색 결과 앞 limit개 행. row_fn(track) → 저장할 행(dict, track_id 포함)."""
+    key = _key(artist_name, market)
+    with _lock_for(key):   # 같은 키를 동시에 늘리면 같은 offset을 두 번 받게 되므로 직렬화
+        hit = result_store.get(STORE_NS, key, max_age=STORE_TTL)
+        state = hit[0] if hit else _empty_state()
+        rows = state["rows"]
+        if len(rows) >= limit or _exhausted(state):
+            stats["prefix_hits"] += 1
+            metrics.cache_event(STORE_NS, True)
+            return rows[:limit]
+        metrics.cache_event(STORE_NS, False)
+
+        seen = {r.get("track_id") for r in rows}
+        while len(rows) < limit and not _exhausted(state):
+            offset = state["next_offset"]
+            res = sp.search(q=f'artist:"{artist_name}"', type="track", market=market,
+                            limit=min(PAGE_SIZE, MAX_OFFSET - offset), offset=offset)
+            stats["pages"] += 1
+            page = res.get("tracks", {}) or {}
+            state["total"] = page.get("total", 0) or 0
+            batch = page.get("items", []) or []
+            if not batch:
+                state["next_offset"] = offset + PAGE_SIZE
+                state["empty_pages"] += 1
+                continue
+            state["empty_pages"] = 0
+            state["next_offset"] = offset + len(batch)
+            for t in batch:
+                if not t:
+                    continue
+                row = row_fn(t)
+                if row.get("track_id") not in seen:
+                    seen.add(row.get("track_id"))
+                    rows.append(row)
+
+        result_store.put(STORE_NS, key, state)
+        return rows[:limit]
+
+
+def invalidate(artist_name: str, market: Optional[str] = None) -> None:
+    result_store.delete(STORE_NS, _key(artist_name, market))
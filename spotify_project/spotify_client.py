@@ -0,0 +1,48 @@
+# spotify_client.py — Spotify 클라이언트 지연 생성
+# spotipy import(~100ms)와 클라이언트 생성을 페이지 로드 시점이 아니라 첫 API 호출 시점으로 미룬다.
+# 같은 자격 증명의 클라이언트는 프로세스에서 하나만 만들어 세션/rerun 간 공유한다 (토큰 캐시도 공유).
+from __future__ import annotations
+
+import os
+import threading
+from typing import Callable, Optional
+
+_clients: dict[tuple, object] = {}
+_lock = threading.Lock()
+
+
+def get_client(client_id: Optional[str], client_secret: Optional[str], requests_timeout: int = 10):
+    key = (client_id, client_secret, requests_timeout)
+    with _lock:
+        sp = _clients.get(key)
+        if sp is None:
+            import spotipy
+            import metrics
+            from spotipy.oauth2 import SpotifyClientCredentials
+            sp = spotipy.Spotify(
+                auth_manager=SpotifyClientCredentials(client_id=client_id, client_secret=client_secret),
+                requests_timeout=requests_timeout,
+            )
+            metrics.instrument(sp)   # 엔드포인트별 호출 수/지연/재시도 계측 (metrics.py)
+            _clients[key] = sp
+    return sp
+
+
+def from_env(id_var: str = "SPOTIPY_CLIENT_ID", secret_var: str = "SPOTIPY_CLIENT_SECRET"):
+    """.env / 환경변수의 자격 증명으로 만든 공유 클라이언트."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    cid, csc = os.getenv(id_var), os.getenv(secret_var)
+    if not cid or not csc:
+        raise RuntimeError(f"환경변수 누락: {id_var} / {secret_var}")
+    return get_client(cid, csc)
+
+
+class LazyClient:
+    """sp.search(...) 같은 기존 호출부를 그대로 두고, 첫 속성 접근 때 factory()로 클라이언트를 만든다."""
+
+    def __init__(self, factory: Callable[[], object]):
+        self._factory = factory
+
+    def __getattr__(self, name):
+        return getattr(self._factory(), name)
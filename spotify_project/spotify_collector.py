@@ -1,24 +1,22 @@
 # utils_no_audio.py
-import os, time
+# 실행: python spotify_collector.py [--async]
+# 기본은 기존처럼 spotipy로 순차 수집한다. --async(또는 SPOTIFY_ASYNC=1)이고 httpx가 설치되어 있으면
+# async_spotify로 모든 아티스트/앨범/트랙 배치를 동시에 요청한다 (공유 속도 제한 안에서).
+# 두 경로의 결과(행/순서)는 같도록 작성했지만 async 경로는 가짜 httpx 전송으로만 확인했다 (async_spotify.py 참고).
+import os, sys, time, asyncio
+from contextlib import aclosing
 from datetime import date
 import pandas as pd
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
 from dotenv import load_dotenv
 
+import markets
+import metrics
+
 # 1) 환경변수 로드 (.env 파일에서 Client ID/Secret 읽기)
 load_dotenv()
 CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
 CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
 
-# Spotify API 인증
-sp = spotipy.Spotify(
-    auth_manager=SpotifyClientCredentials(
-        client_id=CLIENT_ID,
-        client_secret=CLIENT_SECRET
-    )
-)
-
 # 2) 설정
 ARTISTS = {
     "BTS":"3Nrfpe0tUJi4K4DXYWgMUX",
@@ -27,7 +25,8 @@ ARTISTS = {
     "Bigbang":"4Kxlr1PRlDKEB0ekOCyHgX",
 }
 YEAR_START, YEAR_END = 2010, 2025
-SLEEP = 0.15   # 요청 간 대기 (API rate limit 방지)
+SLEEP = 0.15   # 요청 간 대기 (API rate limit 방지, 동기 경로만 — async 경로는 rate_limit.shared)
+OUT_PATH = "kpop_2010_2025_curated.csv"
 
 # 리스트를 50개 단위로 끊는 유틸 (Spotify API 제한 때문)
 def batched(xs, n=50):
@@ -42,8 +41,46 @@ def in_year_range(release_date: str) -> bool:
     except Exception:
         return False
 
+# 트랙 full 객체 → 한 행 (범위 밖이면 None)
+def track_row(t: dict, artist: str, aid: str, today: date):
+    alb = t["album"]
+    if not in_year_range(alb["release_date"]): return None
+    release_year = int(alb["release_date"].split("-")[0])
+    song_age = today.year - release_year
+    credit_ids = [a["id"] for a in t.get("artists") or []]
+    # 역할: 첫 크레딧이면 primary, 크레딧에 있으면 featuring, 없으면 other (curated.py와 동일)
+    role = "primary" if credit_ids[:1] == [aid] else ("featuring" if aid in credit_ids else "other")
+    return {
+        "artist": artist,
+        "artist_id": aid,
+        "album_id": alb["id"],
+        "album_name": alb.get("name"),
+        "album_type": alb.get("album_type"),
+        "track_id": t["id"],
+        "track_name": t["name"],
+        "artists_all": ", ".join(a["name"] for a in t.get("artists") or []),
+        "role": role,
+        "isrc": (t.get("external_ids") or {}).get("isrc"),
+        # 서비스 국가: 코드 목록 대신 24바이트 비트셋 hex (markets.py) — 시장별 재수집 없이 로컬 필터
+        "available_markets_bits": markets.to_hex(t.get("available_markets")),
+        "release_date": alb["release_date"],
+        "release_year": release_year,
+        "popularity": t.get("popularity"),
+        "duration_ms": t.get("duration_ms"),
+        "duration_min": (t.get("duration_ms") or 0) / 60000,
+        "duration_sec": (t.get("duration_ms") or 0) / 1000,
+        "explicit": t.get("explicit"),
+        "disc_number": t.get("disc_number"),
+        "track_number": t.get("track_number"),
+        "song_age_years": song_age,
+        "staying_index": (t.get("popularity") or 0) / (1 + song_age)
+    }
+
+# =========================
+# 동기 경로 (spotipy)
+# =========================
 # 특정 아티스트의 앨범 불러오기 (album, single만)
-def fetch_albums_in_range(artist_id: str):
+def fetch_albums_in_range(sp, artist_id: str):
     seen, albums, offset = set(), [], 0
     while True:
         res = sp.artist_albums(
@@ -64,7 +101,7 @@ def fetch_albums_in_range(artist_id: str):
     return albums
 
 # 앨범 ID로 해당 앨범의 모든 트랙 ID 가져오기
-def fetch_track_ids(album_id: str):
+def fetch_track_ids(sp, album_id: str):
     ids, offset = [], 0
     while True:
         res = sp.album_tracks(album_id, limit=50, offset=offset)
@@ -75,48 +112,77 @@ def fetch_track_ids(album_id: str):
         time.sleep(SLEEP)
     return ids
 
+def collect_sync(today: date):
+    from spotify_client import get_client
+
+    # Spotify API 인증 — 공유 클라이언트라 호출마다 metrics.instrument 계측이 붙는다
+    sp = get_client(CLIENT_ID, CLIENT_SECRET)
+    rows = []
+    for artist, aid in ARTISTS.items():
+        albums = fetch_albums_in_range(sp, aid)         # 아티스트의 앨범 가져오기
+        track_ids = []
+        for alb in albums:
+            track_ids += fetch_track_ids(sp, alb["id"]) # 각 앨범에서 트랙 수집
+        track_ids = list(dict.fromkeys(track_ids))      # track_id 중복 제거
+
+        # 트랙 정보를 50개 단위로 가져오기
+        for chunk in batched(track_ids, 50):
+            for t in sp.tracks(chunk)["tracks"]:
+                row = track_row(t, artist, aid, today)
+                if row: rows.append(row)
+            time.sleep(SLEEP)
+    return rows
+
+# =========================
+# 비동기 경로 (async_spotify)
+# =========================
+async def artist_rows_async(api, artist: str, aid: str, today: date):
+    # 앨범 목록 스트림 (첫 페이지 이후 페이지는 동시에)
+    seen, albums = set(), []
+    async with aclosing(api.artist_albums(aid, include_groups="album,single", market="KR")) as stream:
+        async for a in stream:
+            if a["id"] not in seen and in_year_range(a["release_date"]):
+                albums.append(a)
+                seen.add(a["id"])
+
+    # 앨범별 트랙 목록을 모두 동시에 — 결과는 앨범 순서대로 이어 붙인다
+    async def track_ids(album_id):
+        return [t["id"] async for t in api.album_tracks(album_id) if t.get("id")]
+    per_album = await asyncio.gather(*(track_ids(a["id"]) for a in albums))
+    ids = list(dict.fromkeys(i for chunk in per_album for i in chunk))   # track_id 중복 제거
+
+    # 트랙 full 객체는 배치가 도착하는 순서대로 오므로 id 기준으로 모았다가 원래 순서로 정렬
+    rows_by_id = {}
+    async for t in api.tracks(ids):
+        row = track_row(t, artist, aid, today)
+        if row: rows_by_id[t["id"]] = row
+    return [rows_by_id[i] for i in ids if i in rows_by_id]
+
+async def collect_async(today: date):
+    import async_spotify
+    async with async_spotify.AsyncSpotify(CLIENT_ID, CLIENT_SECRET) as api:
+        per_artist = await asyncio.gather(*(artist_rows_async(api, artist, aid, today)
+                                            for artist, aid in ARTISTS.items()))
+    return [row for rows in per_artist for row in rows]
+
 # 3) 실행
-rows = []
-today = date.today()
-
-for artist, aid in ARTISTS.items():
-    albums = fetch_albums_in_range(aid)         # 아티스트의 앨범 가져오기
-    track_ids = []
-    for alb in albums:
-        track_ids += fetch_track_ids(alb["id"]) # 각 앨범에서 트랙 수집
-    track_ids = list(dict.fromkeys(track_ids))  # track_id 중복 제거
-
-    # 트랙 정보를 50개 단위로 가져오기
-    for chunk in batched(track_ids, 50):
-        tracks = sp.tracks(chunk)["tracks"]
-        for t in tracks:
-            alb = t["album"]
-            if not in_year_range(alb["release_date"]): continue
-            release_year = int(alb["release_date"].split("-")[0])
-            song_age = today.year - release_year
-            rows.append({
-                "artist": artist,
-                "artist_id": aid,
-                "album_id": alb["id"],
-                "album_name": alb.get("name"),
-                "album_type": alb.get("album_type"),
-                "track_id": t["id"],
-                "track_name": t["name"],
-                "isrc": (t.get("external_ids") or {}).get("isrc"),
-                "release_date": alb["release_date"],
-                "release_year": release_year,
-                "popularity": t.get("popularity"),
-                "duration_ms": t.get("duration_ms"),
-                "duration_min": (t.get("duration_ms") or 0) / 60000,
-                "explicit": t.get("explicit"),
-                "disc_number": t.get("disc_number"),
-                "track_number": t.get("track_number"),
-                "song_age_years": song_age,
-                "staying_index": (t.get("popularity") or 0) / (1 + song_age)
-            })
-        time.sleep(SLEEP)
+if __name__ == "__main__":
+    import async_spotify
+
+    metrics.start_server()   # 수집 중에도 /metrics로 호출 지표를 볼 수 있게 (포트가 사용 중이면 경고만)
+    today = date.today()
+    t0 = time.perf_counter()
+    if async_spotify.enabled() or ("--async" in sys.argv and async_spotify.available()):
+        rows = asyncio.run(collect_async(today))
+    else:
+        rows = collect_sync(today)
 
-# 4) DataFrame 변환 및 저장
-df = pd.DataFrame(rows).drop_duplicates(subset=["track_id"])
-df.to_csv("kpop_2010_2025_curated.csv", index=False, encoding="utf-8-sig")
-print("✅ saved:", df.shape, "rows -> kpop_2010_2025_curated.csv")
+    # 4) DataFrame 변환 및 저장
+    df = pd.DataFrame(rows).drop_duplicates(subset=["track_id"])
+    df.to_csv(OUT_PATH, index=False, encoding="utf-8-sig")
+    print("✅ saved:", df.shape, f"rows -> {OUT_PATH} ({time.perf_counter() - t0:.1f}s)")
+    calls = {}
+    for (endpoint, _, status), n in metrics.snapshot()["requests"].items():
+        calls[f"{endpoint} {status}"] = calls.get(f"{endpoint} {status}", 0) + n
+    for k, n in sorted(calls.items()):
+        print(f"   {k}: {n}")
@@ -0,0 +1,106 @@
+# static_assets.py — 홈(home.py) 이미지용 정적 자산 파이프라인
+# assets/*.png를 페이지마다 base64로 인라인하지 않고, 한 번만
+#   리사이즈 → AVIF / WebP / PNG 변환 → 내용 해시 파일명으로 static/에 기록
+# 해 두고 <picture> 태그로 /app/static/ 경로를 참조한다 (.streamlit/config.toml: enableStaticServing).
+#
+# 파일명에 내용 해시가 들어가므로 내용이 바뀌면 URL도 바뀐다 → 브라우저/프록시가 오래 캐시해도 안전.
+# Streamlit 정적 라우트는 ETag/Last-Modified(조건부 요청 304)까지만 보내므로,
+# 장기 캐시 헤더는 앞단 프록시에서 붙인다. 예 (nginx):
+#   location ~ ^/app/static/.+\.[0-9a-f]{10}\.(avif|webp|png)$ {
+#       add_header Cache-Control "public, max-age=31536000, immutable";
+#       proxy_pass http://streamlit;
+#   }
+#
+# 빌드 단계에서 미리 생성: python static_assets.py
+from __future__ import annotations
+
+import hashlib
+import html
+import os
+from pathlib import Path
+
+from PIL import Image, features
+
+BASE_DIR = Path(__file__).resolve().parent
+STATIC_DIR = BASE_DIR / "static"
+URL_PREFIX = "app/static"
+PIPELINE_VERSION = "1"   # 변환 옵션을 바꾸면 올려서 해시를 갱신
+
+# 이름 → (원본, 최대 가로 px)
+ASSETS = {
+    "spotify": ("assets/spotify.png", 160),    # 헤더 로고 (표시 높이 40px, 고해상도 대응)
+    "concert": ("assets/concert.png", 1600),   # 히어로 이미지 (max-height 460px)
+}
+
+# (포맷, 확장자, MIME, 저장 옵션) — 앞에 있는 것부터 브라우저가 고른다
+FORMATS = [
+    ("AVIF", "avif", "image/avif", {"quality": 55}),
+    ("WEBP", "webp", "image/webp", {"quality": 80, "method": 6}),
+    ("PNG", "png", "image/png", {"optimize": True}),
+]
+
+
+def _available(fmt: str) -> bool:
+    return fmt == "PNG" or features.check(fmt.lower())
+
+
+def build_asset(name: str, src: str, max_width: int) -> dict[str, str]:
+    """원본 → 포맷별 static 파일. {MIME: URL} 반환. 같은 해시 파일이 있으면 다시 만들지 않는다."""
+    src_path = BASE_DIR / src
+    if not src_path.exists():
+        return {}
+    data = src_path.read_bytes()
+    digest = hashlib.blake2b(data + f"{max_width}:{PIPELINE_VERSION}".encode(), digest_size=5).hexdigest()
+
+    STATIC_DIR.mkdir(exist_ok=True)
+    img = None
+    urls, keep = {}, set()
+    for fmt, ext, mime, opts in FORMATS:
+        if not _available(fmt):
+            continue
+        fname = f"{name}.{digest}.{ext}"
+        out = STATIC_DIR / fname
+        if not out.exists():
+            if img is None:
+                img = Image.open(src_path)
+                img.load()
+                if img.width > max_width:
+                    img = img.resize((max_width, round(img.height * max_width / img.width)), Image.LANCZOS)
+            tmp = out.with_suffix(out.suffix + ".tmp")
+            im = img if fmt != "AVIF" or img.mode in ("RGB", "RGBA") else img.convert("RGBA")
+            im.save(tmp, format=fmt, **opts)
+            os.replace(tmp, out)   # 동시 실행 시에도 반쯤 쓴 파일이 노출되지 않도록
+        urls[mime] = f"{URL_PREFIX}/{fname}"
+        keep.add(fname)
+
+    # 이전 해시의 같은 이름 파일 정리
+    for old in STATIC_DIR.glob(f"{name}.*"):
+        if old.name not in keep and not old.name.endswith(".tmp"):
+            old.unlink(missing_ok=True)
+    return urls
+
+
+def build_all() -> dict[str, dict[str, str]]:
+    return {name: build_asset(name, src, w) for name, (src, w) in ASSETS.items()}
+
+
+def picture_html(urls: dict[str, str], alt: str, cls: str = "", eager: bool = False) -> str:
+    """<picture> — AVIF/WebP를 먼저 제안하고 PNG로 폴백."""
+    if not urls:
+        return ""
+    sources = "".join(
+        f'<source type="{mime}" srcset="{url}">' for mime, url in urls.items() if mime != "image/png"
+    )
+    fallback = urls.get("image/png") or next(iter(urls.values()))
+    loading = "eager" if eager else "lazy"
+    return (
+        f'<picture>{sources}<img src="{fallback}" class="{cls}" alt="{html.escape(alt)}" '
+        f'loading="{loading}" decoding="async" /></picture>'
+    )
+
+
+if __name__ == "__main__":
+    for name, urls in build_all().items():
+        for mime, url in urls.items():
+            size = (STATIC_DIR / Path(url).name).stat().st_size
+            print(f"{name:8s} {mime:11s} {size/1024:8.1f} KB  {url}")
@@ -0,0 +1,125 @@
+# text_index.py — 트랙/앨범/아티스트 이름용 인메모리 n-gram 역색인
+# 키 입력마다 컬럼별 str.contains로 전체를 훑는 대신,
+# 데이터셋 버전마다 한 번 1~3-gram → 행 위치 posting 리스트를 만들어 두고
+# 질의 시 posting 교집합 + 후보 검증만 수행한다.
+from __future__ import annotations
+
+import re
+import threading
+import unicodedata
+from collections import OrderedDict, defaultdict
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+import registry
+
+MAX_GRAM = 3
+MAX_INDEXES = 8   # (데이터셋 토큰, 컬럼) 당 하나, LRU
+SEP = "\x00"      # 필드 구분자 — 필드 경계를 넘는 매치 방지
+
+_indexes: "OrderedDict[tuple, TextIndex]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def normalize_text(s) -> str:
+    """NFKC(한글 자모 조합·전각 문자 통일) + casefold + 공백 정리."""
+    if s is None or (isinstance(s, float) and np.isnan(s)):
+        return ""
+    s = unicodedata.normalize("NFKC", str(s)).casefold()
+    return re.sub(r"\s+", " ", s).strip()
+
+
+def _grams(text: str) -> set[str]:
+    out = set()
+    for n in range(1, MAX_GRAM + 1):
+        for i in range(len(text) - n + 1):
+            g = text[i:i+n]
+            if SEP not in g:
+                out.add(g)
+    return out
+
+
+class TextIndex:
+    """행 위치(0..n-1) 기준 역색인. search()는 정렬된 위치 배열을 돌려준다."""
+
+    def __init__(self, docs: Sequence[str]):
+        self.docs = list(docs)
+        post: dict[str, list[int]] = defaultdict(list)
+        for pos, doc in enumerate(self.docs):
+            for g in _grams(doc):
+                post[g].append(pos)
+        self.postings = {g: np.asarray(v, dtype=np.int32) for g, v in post.items()}
+        self._empty = np.empty(0, dtype=np.int32)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, cols: Sequence[str]) -> "TextIndex":
+        parts = [df[c].map(normalize_text) for c in cols if c in df.columns]
+        if not parts:
+            return cls([""] * len(df))
+        docs = parts[0]
+        for p in parts[1:]:
+            docs = docs + SEP + p
+        return cls(docs.tolist())
+
+    def _candidates(self, q: str) -> np.ndarray:
+        if len(q) <= MAX_GRAM:
+            return self.postings.get(q, self._empty)
+        lists = []
+        for i in range(len(q) - MAX_GRAM + 1):
+            p = self.postings.get(q[i:i+MAX_GRAM])
+            if p is None:
+                return self._empty
+            lists.append(p)
+        lists.sort(key=len)
+        cand = lists[0]
+        for p in lists[1:]:
+            cand = np.intersect1d(cand, p, assume_unique=True)
+            if not len(cand):
+                break
+        return cand
+
+    def search(self, query: str, prefix: bool = False) -> np.ndarray:
+        """부분 문자열(기본) 또는 단어 접두(prefix=True) 일치 행 위치."""
+        q = normalize_text(query)
+        if not q:
+            return np.arange(len(self.docs), dtype=np.int32)
+        cand = self._candidates(q)
+        if len(q) > MAX_GRAM or prefix:
+            if prefix:
+                keep = [p for p in cand if _has_prefix(self.docs[p], q)]
+            else:
+                keep = [p for p in cand if q in self.docs[p]]
+            cand = np.asarray(keep, dtype=np.int32)
+        return cand
+
+
+def _has_prefix(doc: str, q: str) -> bool:
+    i = doc.find(q)
+    while i >= 0:
+        if i == 0 or doc[i - 1] in (" ", SEP):
+            return True
+        i = doc.find(q, i + 1)
+    return False
+
+
+def index_for(df: pd.DataFrame, cols: Sequence[str]) -> TextIndex:
+    """데이터셋 토큰(registry) 기준으로 색인을 한 번만 만들고 공유."""
+    key = (registry.token_of(df), tuple(cols))
+    with _lock:
+        idx = _indexes.get(key)
+        if idx is not None:
+            _indexes.move_to_end(key)
+            return idx
+    idx = TextIndex.from_frame(df, cols)
+    with _lock:
+        _indexes[key] = idx
+        while len(_indexes) > MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return idx
+
+
+def search_frame(df: pd.DataFrame, cols: Sequence[str], query: str, prefix: bool = False) -> pd.Index:
+    """질의와 일치하는 df의 인덱스 라벨."""
+    return df.index[index_for(df, cols).search(query, prefix=prefix)]
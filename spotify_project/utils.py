@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+import artist_index
+import audio_features
+import columnar
+import markets
+import search_store
+import spotify_client
+
+
+def _get_sp():
+    # spotipy import/클라이언트 생성은 첫 호출 때, 프로세스에서 하나만 (spotify_client.py)
+    return spotify_client.from_env("SPOTIPY_CLIENT_ID", "SPOTIPY_CLIENT_SECRET")
+
+
+def search_artist(name: str) -> Optional[dict]:
+    """아티스트 이름 → {"id", "name", ...}. 로컬 인덱스에서 먼저 찾고, 없을 때만 검색 API 호출."""
+    return artist_index.resolve(name, spotify_client.LazyClient(_get_sp))
+
+
+def artist_top_track_ids(artist_id: str, limit: int = 10) -> List[str]:
+    sp = _get_sp()
+    tracks = sp.artist_top_tracks(artist_id).get("tracks", [])[:limit]
+    return [t["id"] for t in tracks if t.get("id")]
+
+
+def fetch_tracks_meta(track_ids: List[str]) -> List[dict]:
+    if not track_ids:
+        return []
+    sp = _get_sp()
+    out = []
+    for i in range(0, len(track_ids), 50):
+        batch = track_ids[i:i+50]
+        out.extend(sp.tracks(batch)["tracks"])
+    return out
+
+
+FEATURE_COLS = [
+    "danceability", "energy", "valence", "tempo", "acousticness",
+    "instrumentalness", "liveness", "speechiness", "key", "mode", "time_signature",
+]
+
+
+def fetch_audio_features_safe(track_ids: List[str], mode: str = "batch_then_fallback") -> Dict[str, dict]:
+    """
+    track_id -> 오디오 특성 dict (audio_features.py)
+    - 저장된 특성은 재요청하지 않고, 실패 배치는 이분 탐색으로 나쁜 ID만 격리
+    - mode="single": 한 곡씩 요청 (배치 크기 1)
+    """
+    batch_size = 1 if mode == "single" else audio_features.BATCH
+    return audio_features.fetch(spotify_client.LazyClient(_get_sp), track_ids, batch_size=batch_size)
+
+
+BASIC_COLS = [
+    "artist", "track_name", "popularity", "duration_ms", "explicit", "preview_url",
+    "album_name", "album_id", "album_release_date", "album_release_date_precision",
+    "album_total_tracks", "album_type", "available_markets_len",
+]
+
+
+def meta_row(t: dict) -> dict:
+    album = t.get("album", {}) or {}
+    return {
+        "track_id": t.get("id"),
+        "artist": ", ".join(a["name"] for a in (t.get("artists") or [])),
+        "track_name": t.get("name"),
+        "popularity": t.get("popularity"),
+        "duration_ms": t.get("duration_ms"),
+        "explicit": t.get("explicit"),
+        "preview_url": t.get("preview_url"),
+        "album_name": album.get("name"),
+        "album_id": album.get("id"),
+        "album_release_date": album.get("release_date"),
+        "album_release_date_precision": album.get("release_date_precision"),
+        "album_total_tracks": album.get("total_tracks"),
+        "album_type": album.get("album_type"),
+        "available_markets_len": len(t.get("available_markets") or []),
+        "available_markets_bits": markets.to_hex(t.get("available_markets")),
+    }
+
+
+def new_builder(include_features: bool = False) -> columnar.TrackColumns:
+    """트랙 프레임 빌더 (columnar.py). 오디오 특성 컬럼은 include_features일 때만."""
+    return columnar.TrackColumns(FEATURE_COLS if include_features else None)
+
+
+def build_meta_df(meta_items: List[dict]) -> pd.DataFrame:
+    b = new_builder()
+    b.add_items(meta_items)
+    return b.build()
+
+
+def search_tracks_by_artist_paged(artist_name: str, market: Optional[str] = None, limit: int = 100) -> pd.DataFrame:
+    """
+    검색 API로 아티스트 트랙을 페이지네이션하며 수집.
+    - Spotify search: limit<=50, offset로 페이지 이동
+    - 이미 받은 페이지는 (아티스트, market) 단위로 저장 → limit을 늘리면 모자란 offset만 추가 요청 (search_store.py)
+    - 반환: 메타 DF (track_id 중복 제거, 최대 limit행)
+    """
+    rows = search_store.tracks(spotify_client.LazyClient(_get_sp), artist_name, market, limit, meta_row)
+    b = new_builder()
+    b.add_rows(rows)
+    return b.build()
+
+
+def search_tracks_by_artist(artist_name: str, market: Optional[str] = None, limit: int = 20) -> pd.DataFrame:
+    sp = _get_sp()
+    res = sp.search(q=f'artist:"{artist_name}"', type="track", market=market, limit=limit)
+    items = res.get("tracks", {}).get("items", [])
+    return build_meta_df(items)
+
+
+def collect_artist_tracks(
+    builder: columnar.TrackColumns,
+    artist_name: str,
+    limit: int = 10,
+    feature_mode: str = "batch_then_fallback",
+    use_search: bool = False,
+    market: Optional[str] = None,
+    **const,
+) -> int:
+    """
+    아티스트 트랙을 builder에 바로 추가 (추가된 행 수 반환)
+    - 기본: top tracks (Spotify가 최대 10곡 제공)
+    - use_search=True: search + pagination 으로 limit까지 수집
+    - builder가 특성 컬럼을 가지면 오디오 특성도 같은 행에 채운다 (merge 없음)
+    - const: 모든 행에 붙일 상수 컬럼 (예: main_artist="BTS")
+    """
+    if use_search:
+        rows = search_store.tracks(spotify_client.LazyClient(_get_sp), artist_name, market, limit, meta_row)
+        ids = [r["track_id"] for r in rows]
+    else:
+        artist = search_artist(artist_name)
+        if not artist:
+            return 0
+        items = [t for t in fetch_tracks_meta(artist_top_track_ids(artist["id"], limit=limit)) if t]
+        ids = [t.get("id") for t in items]
+
+    feats = fetch_audio_features_safe(ids, mode=feature_mode) if builder.feature_cols and ids else None
+    if use_search:
+        return builder.add_rows(rows, feats, **const)
+    return builder.add_items(items, feats, **const)
+
+
+def fetch_artist_top_df(
+    artist_name: str,
+    limit: int = 10,
+    include_features: bool = False,
+    feature_mode: str = "batch_then_fallback",
+    use_search: bool = False,
+    market: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    아티스트 이름 -> 트랙 메타 DF
+    - 컬럼 순서: track_id, BASIC_COLS, release_year, duration_min, (FEATURE_COLS), markets.COLS
+    - 여러 아티스트를 한 프레임으로 모을 때는 new_builder() + collect_artist_tracks()
+    """
+    b = new_builder(include_features)
+    collect_artist_tracks(b, artist_name, limit=limit, feature_mode=feature_mode,
+                          use_search=use_search, market=market)
+    return b.build()
@@ -0,0 +1,320 @@
+# kpop_duration_analysis_big.py
+import os
+import re
+import math
+import asyncio
+from contextlib import aclosing
+import pandas as pd
+import streamlit as st
+from urllib.parse import urlparse
+
+import artist_index
+import async_spotify
+import genre_crawler
+import profiler
+import spotify_client
+from figure_cache import cached_figure
+from downsample import POINT_BUDGET, kde_violin, lttb_frame
+from registry import shared_loader
+
+# =========================
+# 설정: Spotify API 인증
+# =========================
+CLIENT_ID = "7cb475144edb4b40b2f687052c79c378"
+CLIENT_SECRET = "bce6af21bbe04caaaaa5ec7740e70cea"
+
+if not CLIENT_ID or not CLIENT_SECRET:
+    st.error("Spotify CLIENT_ID / CLIENT_SECRET가 설정되지 않았습니다.")
+    st.stop()
+
+# spotipy import와 클라이언트 생성은 첫 API 호출 때 (spotify_client.py)
+sp = spotify_client.LazyClient(lambda: spotify_client.get_client(CLIENT_ID, CLIENT_SECRET))
+
+# =========================
+# 유틸: 날짜 파싱 & 연도 필터
+# =========================
+def parse_release_date(s):
+    try:
+        return pd.to_datetime(s, errors="coerce")
+    except Exception:
+        return pd.NaT
+
+def filter_2020_2025(df):
+    df = df.copy()
+    df["release_date"] = pd.to_datetime(df["release_date"], errors="coerce")
+    df["release_year"] = df["release_date"].dt.year
+    return df[(df["release_year"] >= 2020) & (df["release_year"] <= 2025)]
+
+# =========================
+# 수집 모드 1: 장르 검색(빠름)
+# =========================
+# 쿼리 하나는 offset 1,000에서 막히므로 market × year × tag 파티션으로 나눠 동시에 수집 (genre_crawler.py)
+# 결과 프레임은 세션 간 공유 → 아래에서는 제자리 수정 대신 새 프레임을 만든다
+# ttl = 페이지 저장 수명 — 프로세스 안의 공유 프레임이 result_store의 1일 만료보다 오래 남지 않도록
+@shared_loader("p00_genre", show_spinner=False, ttl=genre_crawler.STORE_TTL)
+def fetch_kpop_by_genre(total=200, market="KR", extra_markets=()):
+    df = genre_crawler.crawl(sp, total, markets=(market, *extra_markets), years=(2020, 2025))
+    if df.empty:
+        return df
+    df = filter_2020_2025(df)
+    return df
+
+# =========================
+# 수집 모드 2: 아티스트 기반(정확)
+# =========================
+DEFAULT_KPOP_ARTISTS = [
+    "BTS", "BLACKPINK", "NewJeans", "SEVENTEEN", "TWICE", "NCT", "EXO",
+    "IVE", "LE SSERAFIM", "Stray Kids", "ATEEZ", "TXT", "ENHYPEN", "ITZY",
+    "aespa", "Red Velvet", "(G)I-DLE", "TREASURE", "fromis_9",
+    "STAYC", "ILLIT", "I.N", "BOYNEXTDOOR", "ZEROBASEONE", "KISS OF LIFE",
+    "RIIZE", "SHINee", "SNSD", "Super Junior", "MONSTA X", "MAMAMOO", "BIGBANG",
+    "Sunmi", "TAEYANG", "TAEMIN", "JENNIE", "JISOO", "ROSÉ", "LISA", "Jung Kook",
+    "Jimin", "SUGA", "J-Hope", "V", "Agust D"
+]
+
+def search_artist_id(name: str):
+    artist = artist_index.resolve(name, sp)
+    return artist["id"] if artist else None
+
+ALBUM_TYPES = ["single", "album", "compilation", "appears_on"]
+ARTIST_WINDOW = 8   # async 경로: 동시에 수집하는 아티스트 수
+
+def in_years(alb) -> bool:
+    dt = parse_release_date(alb.get("release_date"))
+    return not pd.isna(dt) and 2020 <= dt.year <= 2025
+
+def album_rows(alb, items):
+    return [{
+        "track_id": t["id"],
+        "track_name": t["name"],
+        "artist": ", ".join([a["name"] for a in t["artists"]]),
+        "album": alb["name"],
+        "release_date": alb.get("release_date"),
+        "duration_min": (t.get("duration_ms") or 0) / 60000.0
+    } for t in items]
+
+def fetch_artist_tracks_in_years(artist_id: str, country="KR", max_albums=30):
+    rows = []
+    seen_album_ids = set()
+    for album_type in ALBUM_TYPES:
+        offset = 0
+        while True:
+            albums = sp.artist_albums(artist_id, album_type=album_type, country=country, limit=50, offset=offset)
+            items = albums.get("items", [])
+            for alb in items:
+                if alb["id"] in seen_album_ids:
+                    continue
+                seen_album_ids.add(alb["id"])
+                if in_years(alb):
+                    tracks = sp.album_tracks(alb["id"], limit=50)
+                    rows += album_rows(alb, tracks.get("items", []))
+            if len(items) < 50 or len(seen_album_ids) >= max_albums:
+                break
+            offset += 50
+    df = pd.DataFrame(rows).drop_duplicates(subset=["track_id"])
+    df = filter_2020_2025(df)
+    return df
+
+# SPOTIFY_ASYNC=1이고 httpx가 있으면 async_spotify로 (기본은 아래 spotipy 경로): 아티스트 ARTIST_WINDOW명씩, 앨범 목록 페이지와 앨범별 트랙 요청을 모두 동시에 띄운다.
+# 앨범을 고르는 규칙(타입 순서, 50개 페이지 단위의 max_albums 판정)과 결과는 위 동기 버전과 같다.
+# ⚠️ 이 경로는 가짜 httpx 전송으로만 동기 버전과 결과를 비교했고, 실제 API로는 검증하지 않았다.
+async def fetch_artist_tracks_async(api, artist_id: str, country="KR", max_albums=30):
+    picked = []
+    seen_album_ids = set()
+    for album_type in ALBUM_TYPES:
+        n = 0
+        async with aclosing(api.artist_albums(artist_id, include_groups=album_type, market=country)) as stream:
+            async for alb in stream:
+                n += 1
+                if alb["id"] not in seen_album_ids:
+                    seen_album_ids.add(alb["id"])
+                    if in_years(alb):
+                        picked.append(alb)
+                if n % 50 == 0 and len(seen_album_ids) >= max_albums:   # 동기 버전의 페이지 끝 판정
+                    break
+
+    # 동기 버전처럼 앨범당 첫 50곡 (한 페이지)
+    pages = await asyncio.gather(*(api.get(f"/albums/{alb['id']}/tracks", {"limit": 50}) for alb in picked))
+    rows = [r for alb, page in zip(picked, pages) for r in album_rows(alb, page.get("items", []))]
+    df = pd.DataFrame(rows).drop_duplicates(subset=["track_id"])
+    return filter_2020_2025(df)
+
+async def _artist_frames_async(artists, country, max_albums, target_total):
+    all_df = []
+    async with async_spotify.AsyncSpotify(CLIENT_ID, CLIENT_SECRET) as api:
+        for i in range(0, len(artists), ARTIST_WINDOW):
+            # 이름 → ID: 캐시에 없으면 spotipy 검색(블로킹)이라 스레드로 넘겨 루프를 막지 않는다
+            # (목표에 닿으면 다음 창은 조회하지 않는다)
+            ids = await asyncio.gather(*(asyncio.to_thread(search_artist_id, name)
+                                         for name in artists[i:i+ARTIST_WINDOW]))
+            window = [aid for aid in ids if aid]
+            frames = await asyncio.gather(*(fetch_artist_tracks_async(api, aid, country, max_albums) for aid in window))
+            for df_a in frames:   # 아티스트 순서대로 — 목표에 닿은 뒤의 아티스트는 버린다
+                if not df_a.empty:
+                    all_df.append(df_a)
+                if sum(len(x) for x in all_df) >= target_total:
+                    return all_df
+    return all_df
+
+@st.cache_data(show_spinner=False)
+def fetch_kpop_by_artists(artists: list, max_albums_per_artist=20, country="KR", target_total=300):
+    all_df = []
+    if async_spotify.enabled():
+        all_df = async_spotify.run_sync(_artist_frames_async(artists, country, max_albums_per_artist, target_total))
+    else:
+        for name in artists:
+            aid = search_artist_id(name)
+            if not aid:
+                continue
+            df_a = fetch_artist_tracks_in_years(aid, country=country, max_albums=max_albums_per_artist)
+            if not df_a.empty:
+                all_df.append(df_a)
+            if sum(len(x) for x in all_df) >= target_total:
+                break
+    if all_df:
+        big = pd.concat(all_df, ignore_index=True).drop_duplicates(subset=["track_id"])
+        return big
+    return pd.DataFrame(columns=["track_id","track_name","artist","album","release_date","duration_min","release_year"])
+
+# =========================
+# 차트 빌더 (figure_cache로 데이터 지문 기준 캐시, plotly는 첫 차트 때 import)
+# =========================
+def year_avg_line(df, budget=POINT_BUDGET):
+    import plotly.express as px
+    year_avg = lttb_frame(df.groupby("release_year", as_index=False)["duration_min"].mean(),
+                          "release_year", "duration_min", budget)
+    return px.line(
+        year_avg, x="release_year", y="duration_min",
+        markers=True, line_shape="spline",
+        labels={"release_year": "연도", "duration_min": "평균 재생시간(분)"},
+        title="연도별 평균 재생시간 (2020–2025)"
+    )
+
+def artist_violin(df, budget=POINT_BUDGET):
+    import plotly.express as px
+    top_artists = (
+        df.groupby("artist")["track_id"].nunique()
+          .sort_values(ascending=False)
+          .head(12).index.tolist()
+    )
+    df_violin = df[["artist", "track_name", "duration_min"]].copy()
+    df_violin["artist_top12"] = df_violin["artist"].where(df_violin["artist"].isin(top_artists), "기타")
+    labels = {"artist_top12":"아티스트(상위 12 + 기타)", "duration_min":"재생시간(분)"}
+    if len(df_violin) > budget:
+        # 점이 많으면 KDE를 서버에서 계산하고 점은 예산 안에서만 전송
+        fig = kde_violin(df_violin, "artist_top12", "duration_min", top_artists + ["기타"], budget,
+                         title="아티스트별 재생시간 분포 (상위 12 + 기타)", labels=labels)
+        fig.update_layout(height=800, width=1200)
+        return fig
+    fig = px.violin(
+        df_violin, y="duration_min", x="artist_top12",
+        box=True, points="all",
+        category_orders={"artist_top12": top_artists + ["기타"]},
+        labels=labels,
+        title="아티스트별 재생시간 분포 (상위 12 + 기타)"
+    )
+    fig.update_layout(height=800, width=1200)
+    return fig
+
+# =========================
+# Streamlit UI
+# =========================
+st.set_page_config(page_title="K-pop 재생시간 분석(2020–2025)", page_icon="⏱️", layout="wide")
+profiler.page(__file__)
+st.title("⏱️ K-pop 재생시간 추세 분석 (2020–2025)")
+
+st.markdown("""
+- 더 많은 곡을 안정적으로 수집하기 위해 **2가지 수집 모드**를 제공합니다.  
+  1) **장르 검색(빠름)**: `genre:"k-pop"` 검색을 연도/market/tag 파티션으로 나눠 동시 수집 (연도·market당 최대 약 3,000곡, 누락 가능)  
+  2) **아티스트 기반(정확)**: K-pop 아티스트들의 앨범/싱글에서 2020–2025 트랙만 수집 (권장)  
+""")
+
+# 중앙 상단 가로 UI
+c1, c2, c3, c4 = st.columns([2,2,2,1])
+with c1:
+    mode = st.selectbox("수집 모드", ["아티스트 기반(권장)", "장르 검색(빠름)"])
+with c2:
+    market = st.selectbox("Market(국가)", ["KR", "US", "JP", "GB", "DE", "None"], index=0)
+    market_val = None if market == "None" else market
+with c3:
+    if mode == "장르 검색(빠름)":
+        total = st.slider("수집할 목표 곡 수", 50, 20000, 300, step=50)
+        extra_markets = st.multiselect("추가 Market 파티션", ["US", "JP", "GB", "DE"], default=[])
+        cap = genre_crawler.capacity(1 + len(extra_markets), (2020, 2025))
+        st.caption(f"검색 API 한도: 연도·market당 최대 {genre_crawler.YEAR_CAP:,}곡 → 현재 설정 상한 약 {cap:,}곡(겹침 포함). "
+                   "더 필요하면 Market 파티션을 추가하세요.")
+        max_albums = None
+        artists = []
+    else:
+        total = st.slider("목표 총곡(대략)", 100, 600, 300, step=50)
+        max_albums = st.slider("아티스트당 최대 앨범 수집", 5, 50, 20, step=5)
+        artist_text = st.text_area(
+            "아티스트 목록(줄바꿈으로 구분)",
+            "\n".join(DEFAULT_KPOP_ARTISTS),
+            height=180
+        )
+        artists = [a.strip() for a in artist_text.splitlines() if a.strip()]
+with c4:
+    load_btn = st.button("데이터 불러오기")
+
+point_budget = st.sidebar.number_input("차트 최대 점 수(초과 시 다운샘플링)", 500, 50000, POINT_BUDGET, step=500)
+
+# =========================
+# 데이터 로딩
+# =========================
+if load_btn:
+    with st.spinner("Spotify에서 데이터 수집 중..."), profiler.section("데이터 수집"):
+        if mode == "장르 검색(빠름)":
+            df = fetch_kpop_by_genre(total=total, market=market_val or "KR",
+                                     extra_markets=tuple(m for m in extra_markets if m != market_val))
+        else:
+            df = fetch_kpop_by_artists(artists, max_albums_per_artist=max_albums, country=market_val or "KR", target_total=total)
+
+    if df.empty:
+        st.warning("조건에 맞는 2020–2025 데이터가 없습니다. (Market/아티스트 목록을 확인하세요)")
+        st.stop()
+    if mode == "장르 검색(빠름)" and len(df) < total:
+        st.info(f"목표 {total:,}곡 중 {len(df):,}곡만 수집했습니다 — 곡이 많은 연도는 검색 API 한도"
+                f"(연도·market당 {genre_crawler.YEAR_CAP:,}곡)에 걸립니다. Market 파티션을 추가해 보세요.")
+
+    df = df.dropna(subset=["release_date"])
+    df["release_year"] = pd.to_datetime(df["release_date"], errors="coerce").dt.year
+    df = df.dropna(subset=["release_year"])
+    df["duration_min"] = pd.to_numeric(df["duration_min"], errors="coerce")
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.metric("수집 곡 수", f"{len(df):,}")
+    with c2:
+        st.metric("고유 아티스트 수", f"{df['artist'].nunique():,}")
+    with c3:
+        st.metric("분석 기간", "2020–2025")
+
+    tab_labels = ["연도별 평균 재생시간", "재생시간 분포(바이올린)", "조사된 곡 목록", "원본 데이터"]
+    tab1, tab2, tab3, tab4 = profiler.tabs(st.tabs(tab_labels), tab_labels)
+
+    with tab1:
+        fig = cached_figure(year_avg_line, df[["release_year", "duration_min"]], budget=int(point_budget))
+        st.plotly_chart(fig, use_container_width=True)
+
+    with tab2:
+        fig = cached_figure(artist_violin, df[["artist", "track_id", "track_name", "duration_min"]],
+                            budget=int(point_budget))
+        st.plotly_chart(fig, use_container_width=True)
+
+    with tab3:
+        st.subheader("🎵 조사된 K-pop 곡 목록 (2020–2025)")
+        q = st.text_input("곡명/아티스트/앨범 검색")
+        view = df[["track_name", "artist", "album", "release_year", "duration_min"]].copy()
+        if q:
+            q_low = q.lower()
+            mask = (
+                view["track_name"].str.lower().str.contains(q_low, na=False) |
+                view["artist"].str.lower().str.contains(q_low, na=False) |
+                view["album"].str.lower().str.contains(q_low, na=False)
+            )
+            view = view[mask]
+        st.dataframe(view.sort_values(["release_year", "artist", "track_name"]), use_container_width=True)
+
+    with tab4:
+        st.dataframe(df, use_container_width=True)
@@ -0,0 +1,384 @@
+# app_staying_pro_light.py
+# ⏱️ 히트곡의 체류시간 (간이 지표) — Expert+ 라이트 테마
+
+import io
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from datetime import datetime, timezone
+
+import loaders  # 데이터 로더는 loaders.py (워밍업과 캐시 공유)
+from regression import GroupedRegression
+from lazy_tabs import remember_load, dataset_version, lazy_tabs, tab_memo
+from figure_cache import cached_figure
+from downsample import POINT_BUDGET, density_sample, render_mode
+from feature_space import AudioSpace
+import exports
+import profiler
+import query
+
+st.set_page_config(page_title="K-POP 데이터로 본 ‘오래 사랑받는 곡’의 조건", page_icon="⏱️", layout="wide")
+profiler.page(__file__)
+PRETTY_LEVEL = 8
+
+def theme(level:int=8):
+    import numpy as _np
+    level = int(_np.clip(level, 1, 10))
+    radius = 6 + level; shadow = 4 + 2*level
+    return dict(
+        radius=radius, shadow=shadow,
+        primary="#6D28D9", accent="#0891B2",
+        bg_from="#ffffff", bg_to="#ffffff",
+        border="#E5E7EB", text="#111827"
+    )
+T = theme(PRETTY_LEVEL)
+
+st.markdown(f"""
+<style>
+:root {{
+  --card-radius: {T['radius']}px;
+  --card-shadow: 0 {int(T['shadow']/2)}px {T['shadow']}px rgba(17,24,39,0.08);
+  --primary: {T['primary']}; --accent: {T['accent']};
+  --border: {T['border']}; --text: {T['text']};
+}}
+.stApp {{ background: linear-gradient(135deg, {T['bg_from']} 0%, {T['bg_to']} 100%); }}
+.block-container {{ padding-top: 0.6rem; }}
+h1, h2, h3, h4, h5, h6, .stMarkdown p {{ color: var(--text); }}
+div[data-testid="stMetric"] {{
+  background:#fff;border:1px solid var(--border);border-radius:var(--card-radius);
+  box-shadow:var(--card-shadow);padding:8px 12px;
+}}
+.stDataFrame, .stPlotlyChart {{
+  background:#fff;border:1px solid var(--border);border-radius:var(--card-radius);
+  box-shadow:var(--card-shadow);padding:6px;
+}}
+.stButton>button, [data-baseweb="select"]>div, .stSlider>div {{ border-radius:var(--card-radius)!important; }}
+hr.custom {{ border:0;height:1px;background:linear-gradient(90deg,transparent,rgba(0,0,0,.15),transparent);margin:.8rem 0 1rem; }}
+.badge {{
+  display:inline-block;padding:3px 10px;font-size:12px;border-radius:999px;
+  background:rgba(109,40,217,.10);color:var(--text);border:1px solid rgba(109,40,217,.25)
+}}
+.small-dim {{ color:#6B7280;font-size:12px; }}
+</style>
+""", unsafe_allow_html=True)
+
+PX_TEMPLATE = "plotly"
+
+TOP_SPACER = 56
+st.markdown(f"<div style='height:{TOP_SPACER}px;background:transparent;'></div>", unsafe_allow_html=True)
+
+st.title("⏱️ K-POP 데이터로 본 ‘오래 사랑받는 곡’의 조건")
+st.caption("**staying_index = popularity / (1 + age_years)** — 실제 '차트 체류 주'가 아니라 **발매 연식 대비 현재 인기도**를 간단히 본 값입니다.")
+
+# ── 필터 ──
+st.markdown('<span class="badge">필터</span>', unsafe_allow_html=True)
+colA, colB, colC, colD, colE, colF = st.columns([2.4, 1.2, 1.1, 1.0, 1.2, 1.2])
+with colA:
+    artists = st.multiselect("아티스트 선택", loaders.P01_ARTISTS,
+        default=list(loaders.DEFAULTS["p01"]["artists"]))
+with colB:
+    # ⬇️ 상한을 늘려 더 많이 가져오기
+    top_n = st.slider("아티스트당 곡 수", 5, 200, 25, step=5)
+with colC:
+    lite = st.toggle("라이트 모드(오디오 특성 미로딩)", value=True)
+with colD:
+    min_pop = st.slider("최소 인기도", 0, 100, 0, step=1)
+with colE:
+    sort_key = st.selectbox("정렬 기준", ["staying_index","popularity","age_years"], index=0)
+with colF:
+    market_opt = st.selectbox("시장(market)", ["전체","KR","US","JP","GB","DE","FR","BR"], index=0,
+                              help="곡별 available_markets로 로컬에서 거릅니다 (시장마다 다시 수집하지 않음)")
+market = None if market_opt == "전체" else market_opt
+
+st.markdown("<hr class='custom'/>", unsafe_allow_html=True)
+
+# ── 사이드바 ──
+with st.sidebar:
+    st.header("🔬 전문가 분석 옵션")
+    adv = st.toggle("고급 분석 활성화", value=True)
+    show_trend = st.checkbox("산점도에 전역 추세선(선형) 표시", value=True)
+    label_top = st.checkbox("상위 과성과(잔차) 라벨 표시", value=True)
+    top_k_label = st.number_input("라벨 개수(상위)", 3, 30, 8, step=1)
+    point_budget = st.number_input("산점도 최대 점 수(초과 시 다운샘플링)", 500, 50000, POINT_BUDGET, step=500)
+    cohort_on = st.checkbox("코호트(연식 버킷) 히트맵", value=True)
+    pca_on = st.checkbox("오디오 PCA 2D(오디오 특성 로딩 필요)", value=False)
+    st.caption("※ 라이트 모드 해제 시 danceability/energy/valence/PCA 사용 가능")
+    st.divider()
+    st.subheader("내보내기")
+    want_download = st.checkbox("다운로드 버튼 표시", value=True)
+
+go_btn = st.button("불러오기", use_container_width=True)
+
+# ── 유틸 함수들(회귀/잔차 등) ──
+def add_residuals(df, xcol="age_years", ycol="popularity", by="main_artist"):
+    # 전역/그룹별 회귀를 충분통계량 한 번으로 계산 (regression.py)
+    # df는 load_staying의 공유 프레임(shared_loader)이므로 pred/resid 컬럼은 assign으로 새 프레임에
+    reg = GroupedRegression.from_frame(df, xcol, ycol, by=by)
+    pred, resid = reg.residuals(df)
+    return df.assign(pred_pop=pred.round(2), resid=resid.round(2)), reg
+
+def age_pop_scatter(scat, trend_on, a, b, label_k=0, budget=POINT_BUDGET):
+    # 잔차 상위 라벨 대상은 다운샘플링 후에도 반드시 남긴다
+    top = scat.nlargest(label_k, "resid") if label_k else scat.iloc[:0]
+    shown = density_sample(scat, "age_years", "popularity", budget, keep=top.index)
+    fig = px.scatter(shown, x="age_years", y="popularity", color="main_artist",
+                     hover_data=["track_name","resid"], template=PX_TEMPLATE, opacity=0.9,
+                     render_mode=render_mode(len(shown)))
+    title = None if len(shown) == len(scat) else f"표시 {len(shown):,} / 전체 {len(scat):,}점 (밀도 샘플링)"
+    fig.update_layout(height=460, xaxis_title="연식(년)", yaxis_title="인기도", title=title)
+    if not top.empty:
+        fig.add_trace(go.Scatter(x=top["age_years"], y=top["popularity"], mode="text",
+                                 text=top["track_name"], textposition="top center",
+                                 name="과성과 라벨", showlegend=False))
+    if trend_on:
+        xs = np.linspace(scat["age_years"].min(), scat["age_years"].max(), 100)
+        ys = a + b*xs
+        fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", name=f"추세선 y≈{a:.1f}+{b:.2f}x",
+                                 line=dict(dash="dash")))
+    return fig
+
+def audio_pca_scatter(pca_df, evr, budget=POINT_BUDGET):
+    shown = density_sample(pca_df, "PC1", "PC2", budget)
+    fig = px.scatter(shown, x="PC1", y="PC2", color="main_artist", hover_data=["track_name","staying_index"],
+                     template=PX_TEMPLATE, opacity=0.85, render_mode=render_mode(len(shown)),
+                     title=f"오디오 특성 PCA 2D (설명 분산 {evr[0]:.0%} + {evr[1]:.0%})")
+    fig.update_layout(height=480, xaxis_title=f"PC1 ({evr[0]:.0%})", yaxis_title=f"PC2 ({evr[1]:.0%})")
+    return fig
+
+# 연식 코호트: x < 1 → "0-1y", x < 3 → "1-3y", ... 나머지 "9y+" (query.aggregate buckets)
+COHORT_EDGES = [1, 3, 6, 9]
+COHORT_LABELS = ["0-1y", "1-3y", "3-6y", "6-9y", "9y+"]
+
+# ── 실행 ──
+params = remember_load("p01_params", go_btn, {
+    "artists": tuple(artists), "top_n": top_n, "lite": lite,
+    "min_pop": min_pop, "sort_key": sort_key, "market": market,
+})
+if go_btn and params["artists"]:
+    loaders.record("p01", params)
+if params:
+    if not params["artists"]:
+        st.warning("아티스트를 1개 이상 선택하세요."); st.stop()
+
+    lite, sort_key = params["lite"], params["sort_key"]
+
+    loaded = loaders.run("p01", params)
+    version = dataset_version(loaded, "p01", params)   # 공유 프레임의 레지스트리 토큰 (재수집되면 바뀜)
+    # 같은 데이터셋이면 회귀 계산은 한 번만 (메모 결과는 공유 객체이므로 이후엔 읽기 전용으로 사용)
+    data, reg = tab_memo("p01.base", version, None,
+                         lambda: add_residuals(loaded, "age_years", "popularity") if not loaded.empty else (loaded, None))
+    if data.empty:
+        st.warning("데이터가 없습니다. 조건을 바꿔보세요."); st.stop()
+
+    data_r = data
+    a, b, r, r2 = reg.overall()
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("총 곡 수", f"{len(data)}")
+    c2.metric("평균 연식(년)", f"{data['age_years'].dropna().mean():.1f}")
+    c3.metric("평균 체류지표", f"{data['staying_index'].dropna().mean():.1f}")
+    c4.metric("전역 상관계수 r", f"{r:.2f}" if pd.notna(r) else "-")
+
+    tabs = ["요약","산점도","TOP 10","그룹 비교","연도 추세","오디오 특성","진단","잔차 분석","데이터"]
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = lazy_tabs(tabs, key="p01_tabs")
+
+    with tab1:
+        if tab1.open:
+            st.subheader("📌 상위 곡 요약")
+            show_cols = [c for c in [
+                "main_artist","track_name","album_name","album_release_date",
+                "popularity","pred_pop","resid","age_years","staying_index","duration_min","tempo"
+            ] if c in data_r.columns]
+            head_df = data_r.sort_values(["staying_index","popularity"], ascending=[False, False]).head(20)
+            st.dataframe(head_df[show_cols], use_container_width=True, height=420)
+            if want_download:
+                exports.download_button("⬇️ 요약 다운로드", data_r, "staying_summary", key="p01_dl_summary",
+                                        columns=show_cols)
+
+    with tab2:
+        if tab2.open:
+            st.subheader("🟣 연식 vs 인기도 (체류력 감각)")
+            st.caption("→ 오른쪽(오래됨)인데도 상단(인기도↑)에 위치한 점은 '체류력'이 좋습니다.")
+            trend_on = adv and st.session_state.get("show_trend", True) if 'show_trend' in st.session_state else True
+            scat = data_r[["main_artist","track_name","age_years","popularity","resid"]].dropna()
+            if not scat.empty:
+                fig = cached_figure(age_pop_scatter, scat, trend_on=bool(trend_on), a=a, b=b,
+                                    label_k=int(top_k_label) if (adv and label_top) else 0,
+                                    budget=int(point_budget))
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("산점도를 그릴 데이터가 부족합니다.")
+
+    with tab3:
+        if tab3.open:
+            st.subheader("🏆 체류지표 상위 TOP 10")
+            def _top_stay():
+                top_stay = (data_r.loc[data_r["staying_index"].notna(),
+                            ["main_artist","track_name","staying_index"]]
+                            .sort_values("staying_index", ascending=False).head(10))
+                if top_stay.empty:
+                    return top_stay, None
+                fig = px.bar(top_stay, x="staying_index", y="track_name", color="main_artist",
+                             orientation="h", template=PX_TEMPLATE,
+                             title="체류지표 (높을수록 연식 대비 인기 유지)")
+                fig.update_layout(height=520, yaxis={'categoryorder':'total ascending'},
+                                  xaxis_title="staying_index", yaxis_title=None)
+                return top_stay, fig
+            top_stay, fig = tab_memo("p01.top_stay", version, None, _top_stay)
+            if not top_stay.empty:
+                st.plotly_chart(fig, use_container_width=True)
+                st.dataframe(top_stay, use_container_width=True)
+
+    with tab4:
+        if tab4.open:
+            st.subheader("👥 그룹별 평균 비교")
+            def _group_compare():
+                grp = query.aggregate(data_r, "main_artist", {
+                    "avg_staying": ("staying_index", "mean"),
+                    "avg_pop": ("popularity", "mean"),
+                    "avg_age": ("age_years", "mean"),
+                    "n": ("track_name", "count"),
+                })
+                if grp.empty:
+                    return None
+                figg = px.bar(grp.sort_values("avg_staying", ascending=False),
+                              x="main_artist", y="avg_staying", text=grp["n"],
+                              template=PX_TEMPLATE, title="그룹별 평균 체류지표")
+                figg.update_traces(texttemplate="%{text}곡", textposition="outside")
+                figg.update_layout(height=420, xaxis_title="그룹", yaxis_title="평균 staying_index")
+                figp = px.bar(grp.sort_values("avg_pop", ascending=False),
+                              x="main_artist", y="avg_pop", template=PX_TEMPLATE,
+                              title="그룹별 평균 인기도")
+                figp.update_layout(height=420, xaxis_title="그룹", yaxis_title="평균 popularity")
+                return figg, figp
+            figs = tab_memo("p01.group_compare", version, None, _group_compare)
+            if figs is not None:
+                colX, colY = st.columns(2)
+                with colX:
+                    st.plotly_chart(figs[0], use_container_width=True)
+                with colY:
+                    st.plotly_chart(figs[1], use_container_width=True)
+
+    with tab5:
+        if tab5.open:
+            st.subheader("📈 연도별 평균 인기도 / 체류지표 추이")
+            def _yearly_trend():
+                yearly = query.aggregate(data_r, ["main_artist","release_year"], {
+                    "popularity": ("popularity", "mean"),
+                    "staying_index": ("staying_index", "mean"),
+                })
+                if yearly.empty:
+                    return None
+                return (px.line(yearly, x="release_year", y="popularity",
+                                color="main_artist", markers=True,
+                                template=PX_TEMPLATE, title="연도별 평균 인기도"),
+                        px.line(yearly, x="release_year", y="staying_index",
+                                color="main_artist", markers=True,
+                                template=PX_TEMPLATE, title="연도별 평균 체류지표"))
+            figs = tab_memo("p01.yearly_trend", version, None, _yearly_trend)
+            if figs is not None:
+                st.plotly_chart(figs[0], use_container_width=True)
+                st.plotly_chart(figs[1], use_container_width=True)
+
+            if adv and cohort_on:
+                st.subheader("🧊 코호트(연식 버킷) × 그룹 평균 체류지표")
+                def _cohort():
+                    coh = query.aggregate(data_r, ["main_artist","cohort"], {"staying_index": ("staying_index", "mean")},
+                                          buckets={"cohort": ("age_years", COHORT_EDGES, COHORT_LABELS)})
+                    if coh.empty:
+                        return None
+                    heat = coh.pivot(index="main_artist", columns="cohort", values="staying_index")
+                    heat = heat.reindex(columns=[c for c in COHORT_LABELS if c in heat.columns])
+                    fig = px.imshow(heat.round(1), text_auto=True, aspect="auto", template=PX_TEMPLATE,
+                                    color_continuous_scale="Blues", labels={"color": "평균 staying_index"})
+                    fig.update_layout(height=380, xaxis_title="연식 버킷", yaxis_title=None)
+                    return fig
+                fig = tab_memo("p01.cohort", version, None, _cohort)
+                if fig is None:
+                    st.info("연식 정보가 부족합니다.")
+                else:
+                    st.plotly_chart(fig, use_container_width=True)
+
+    with tab6:
+        if tab6.open:
+            st.subheader("🎚️ 오디오 특성 비교")
+            if lite:
+                st.info("라이트 모드입니다. 오디오 특성을 로드하려면 라이트 모드를 끄고 다시 불러오세요.")
+            else:
+                # 표준화/주성분/이웃 인덱스는 데이터셋 버전마다 한 번만 (feature_space.py)
+                aspace = tab_memo("p01.audio_space", version, None, lambda: AudioSpace(data_r))
+                if not aspace.ok:
+                    st.info("오디오 특성은 환경에 따라 제공되지 않을 수 있습니다.")
+                else:
+                    st.caption(f"특성 {len(aspace.cols)}개 · {len(aspace.index):,}곡 기준 (표준화 공간)")
+                    def _audio_avg():
+                        cols = [c for c in aspace.cols if c != "tempo"]   # 0~1 척도 특성만
+                        feats = data_r.loc[aspace.index, cols].apply(pd.to_numeric, errors="coerce")
+                        avg = (feats.groupby(data_r.loc[aspace.index, "main_artist"]).mean()
+                               .reset_index().melt(id_vars="main_artist", var_name="feature", value_name="mean"))
+                        fig = px.bar(avg, x="feature", y="mean", color="main_artist", barmode="group",
+                                     template=PX_TEMPLATE, title="그룹별 평균 오디오 특성")
+                        fig.update_layout(height=420, xaxis_title=None, yaxis_title="평균")
+                        return fig
+                    st.plotly_chart(tab_memo("p01.audio_avg", version, None, _audio_avg), use_container_width=True)
+
+                    if pca_on:
+                        pca_df = data_r.loc[aspace.index, ["main_artist","track_name","staying_index"]].assign(
+                            PC1=aspace.coords[:, 0], PC2=aspace.coords[:, 1])
+                        fig = cached_figure(audio_pca_scatter, pca_df,
+                                            evr=tuple(aspace.space.explained_variance_ratio_.round(4)),
+                                            budget=int(point_budget))
+                        st.plotly_chart(fig, use_container_width=True)
+
+                    st.markdown("**🔎 비슷한 장수곡 찾기** — 같은 특성 공간에서 가까운 곡")
+                    base = data_r.loc[aspace.index].sort_values("staying_index", ascending=False)
+                    pick = st.selectbox("기준 곡", base.index.tolist(), key="p01_similar_pick",
+                                        format_func=lambda i: f"{data_r.at[i, 'track_name']} — {data_r.at[i, 'main_artist']}")
+                    def _similar():
+                        near = aspace.similar(pick, k=10)
+                        cols = ["main_artist","track_name","age_years","popularity","staying_index"]
+                        return data_r.loc[near.index, cols].join(near)
+                    st.dataframe(tab_memo("p01.similar", version, pick, _similar), use_container_width=True)
+
+    with tab7:
+        if tab7.open:
+            st.subheader("🩺 그룹별 연식→인기도 기울기/상관 진단")
+            def _diag():
+                coef = reg.fit()
+                diag = pd.DataFrame({
+                    "group": coef.index, "slope(b)": coef["slope"].values, "intercept(a)": coef["intercept"].values,
+                    "corr(r)": coef["r"].values, "r2": coef["r2"].values,
+                    "n": data_r["main_artist"].value_counts().reindex(coef.index).values,
+                })
+                return diag.round(3).sort_values("corr(r)", ascending=True)
+            st.dataframe(tab_memo("p01.diag", version, None, _diag), use_container_width=True)
+
+    with tab8:
+        if tab8.open:
+            st.subheader("📈 잔차(과성과/저성과) 분석 — 전역 회귀 기준")
+            if "resid" in data_r.columns and data_r["resid"].notna().any():
+                resid_cols = ["main_artist","track_name","age_years","popularity","pred_pop","resid"]
+                over, under = tab_memo("p01.resid", version, None, lambda: (
+                    data_r.nlargest(15, "resid")[resid_cols],
+                    data_r.nsmallest(15, "resid")[resid_cols],
+                ))
+                cL, cR = st.columns(2)
+                cL.markdown("**👍 과성과(카탈로그 강세) TOP 15**"); cL.dataframe(over, use_container_width=True, height=360)
+                cR.markdown("**🛠️ 저성과(재활성 대상) TOP 15**"); cR.dataframe(under, use_container_width=True, height=360)
+
+    with tab9:
+        if tab9.open:
+            st.subheader("📄 원본 데이터")
+            show_cols = [c for c in [
+                "main_artist","track_name","album_name","album_release_date","release_year",
+                "popularity","pred_pop","resid","age_years","staying_index","duration_min"
+            ] if c in data_r.columns]
+            st.dataframe(
+                data_r[show_cols].sort_values(["main_artist", sort_key], ascending=[True, False]),
+                use_container_width=True, height=520
+            )
+            if want_download:
+                exports.download_button("⬇️ 전체 다운로드", data_r, "staying_full", key="p01_dl_full",
+                                        columns=show_cols)
\ No newline at end of file
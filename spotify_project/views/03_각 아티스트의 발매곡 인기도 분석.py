@@ -0,0 +1,155 @@
+import os, logging
+import pandas as pd
+import streamlit as st
+from dotenv import load_dotenv
+
+import artist_index
+import mpl_render
+import profiler
+import result_store
+import spotify_client
+from album_popularity import album_popularity
+
+# 1. Spotipy 환경 설정
+# spotipy import와 클라이언트 생성은 첫 API 호출 때 (spotify_client.py) — 검색 전에는 비용 없음
+
+def make_client():
+    load_dotenv()
+    client_id = os.getenv("SPOTIFY_CLIENT_ID")
+    client_secret = os.getenv("SPOTIPY_CLIENT_SECRET")
+    return spotify_client.get_client(client_id, client_secret)
+
+sp = spotify_client.LazyClient(make_client)
+
+ACCENT = "#5b8def"
+MUTED  = "#8fa3bf"
+
+# 2-1. 아티스트 이름 기반 ID 검색 함수 정의
+
+# 정확 일치/별칭은 로컬 인덱스(artist_index.py)에서 먼저 해석하고, 미스일 때만 검색 API 호출
+def get_artist(artist_name: str) -> dict:
+    artist = artist_index.resolve(artist_name, sp)
+    if artist:
+        return artist
+    else:
+        raise ValueError(f"아티스트 '{artist_name}'를 찾을 수 없습니다.")
+
+# 2-2. 아티스트 ID 기반 각 앨범별 인기도 계산 함수 정의
+# 앨범 목록/트랙/인기도를 배치 호출로 한 번에 모으고 (album_popularity.py),
+# 결과는 아티스트 ID 단위로 공유 결과 저장소(result_store.py)에 보관한다.
+# 저장된 결과가 STORE_TTL보다 새것이면 API를 부르지 않고 그대로 사용.
+# 같은 검색어의 rerun(입력/탭 전환)은 st.cache_data가 받아 이름 해석·SQLite 읽기·복원을 다시 하지 않는다.
+
+STORE_NS = "album_popularity"
+STORE_TTL = 7 * 24 * 3600  # 7일
+
+@profiler.timed("앨범 인기도 로드")
+@st.cache_data(ttl=STORE_TTL, show_spinner=False)
+def get_album_popularity(artist_name: str) -> pd.DataFrame:
+    artist = get_artist(artist_name)
+    artist_id = artist["id"]
+
+    hit = result_store.get_frame(STORE_NS, artist_id, max_age=STORE_TTL)
+    if hit is not None:
+        df, fetched_at = hit
+        # 예전에 저장된 행은 처음 검색한 사람의 표기를 갖고 있을 수 있다 → 정식 이름으로 통일
+        df = df.assign(**{"Artist Name": artist["name"]})
+    else:
+        with st.spinner("앨범 정보를 불러오는 중..."):
+            df = album_popularity(sp, artist_id, artist["name"])   # 검색어 대신 인덱스의 정식 이름
+        fetched_at = result_store.put_frame(STORE_NS, artist_id, df)
+
+    df.attrs["fetched_at"] = fetched_at
+    return df
+
+# 2-3. 차트 빌더 (mpl_render.py 워커에서 실행 — pyplot 없이 넘겨받은 ax에만 그림, seaborn은 첫 차트 때 import)
+
+def popularity_hist(ax, df):
+    sns = mpl_render.seaborn()
+    sns.histplot(df["Album Popularity"], bins=20, kde=True, color=ACCENT, ax=ax)
+    ax.set_xlabel("인기도")
+    ax.set_ylabel("앨범 수")
+
+def popularity_timeline(ax, df):
+    sns = mpl_render.seaborn()
+    sns.lineplot(
+        data=df,
+        x="Release Date",
+        y="Album Popularity",
+        estimator="mean",
+        color=ACCENT,
+        ax=ax
+    )
+    ax.set_xlabel("발매일")
+    ax.set_ylabel("인기도")
+
+# ===================== UI =====================
+profiler.page(__file__)
+st.markdown(
+    """
+    <style>
+      .big-title {font-size: 28px; font-weight: 800; margin-bottom: 0.2rem;}
+      .subtle   {color: #6b7a90; font-size: 13px;}
+      .card {background: #f8fafc; border: 1px solid #eef2f7; padding: 14px 16px; border-radius: 12px;}
+      .section-title {font-size: 20px; font-weight: 700; margin: 12px 0 4px 0;}
+    </style>
+    """,
+    unsafe_allow_html=True
+)
+st.markdown('<div class="big-title">📈 각 아티스트의 발매곡 인기도 분석</div>', unsafe_allow_html=True)
+st.markdown('<div class="subtle">검색한 아티스트의 앨범 인기도를 분석합니다.</div>', unsafe_allow_html=True)
+st.markdown('<div class="subtle">앨범 검색에는 다소 시간이 걸릴 수 있습니다.</div>', unsafe_allow_html=True)
+
+# ===================== 사이드바 필터 =====================
+with st.sidebar:
+    st.header("🔎 Search Query")
+
+    query = st.text_input("아티스트 검색", value="")
+
+# ===================== 필터 적용 =====================
+if query:
+    df = get_album_popularity(query)
+    st.caption(f"수집 시각: {pd.Timestamp(df.attrs['fetched_at'], unit='s'):%Y-%m-%d %H:%M} (UTC)")
+
+# ===================== 탭 =====================
+
+tab_labels = ["📋 개요", "📈 인기도 분석"]
+tab_overview, tab_popularity = profiler.tabs(st.tabs(tab_labels), tab_labels)
+
+# ===================== 개요 탭 =====================
+
+with tab_overview:
+    st.markdown("### 앨범 개요")
+    if query:
+        st.dataframe(df.head(30), use_container_width=True)
+
+    else:
+        st.warning("검색된 앨범이 없습니다. 검색 아티스트를 입력해 주세요.")
+
+# ===================== 인기도 분석 탭 =====================
+
+with tab_popularity:
+    st.markdown("### 인기도 분석")
+    if query:
+        # 두 차트를 워커에서 동시에 그림 (mpl_render.py, 같은 데이터면 캐시된 PNG 재사용)
+        hist_png = mpl_render.submit(popularity_hist, df[["Album Popularity"]], figsize=(12, 6))
+        line_png = mpl_render.submit(popularity_timeline, df[["Release Date", "Album Popularity"]], figsize=(12, 6))
+        c1, c2 = st.columns([1,1])
+        with c1:
+            st.markdown("**앨범 인기도 분포**")
+            st.image(hist_png.result(), width="stretch")
+
+        with c2:
+            st.markdown("**시계열 인기도 분포**")
+            st.image(line_png.result(), width="stretch")
+
+        st.markdown("#### 최고 인기 앨범 TOP 5")
+        top_albums = df.nlargest(5, "Album Popularity")
+
+        if top_albums.empty:
+            st.warning("인기도가 높은 앨범이 없습니다.")
+
+        st.dataframe(top_albums, use_container_width=True)
+
+    else:
+        st.warning("검색된 앨범이 없습니다. 검색 아티스트를 입력해 주세요.")
\ No newline at end of file
@@ -0,0 +1,339 @@
+# 아티스트별 트랙 분석 (큐레이션 데이터셋 기반)
+# 필요: pip install streamlit pandas matplotlib seaborn
+
+import os
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+import curated
+import mpl_render
+import profiler
+import registry
+import query
+import text_index
+from lazy_tabs import lazy_tabs, tab_memo
+
+# ===================== 기본 설정 =====================
+st.set_page_config(page_title="아티스트별 트랙 분석 대시보드", layout="wide")
+profiler.page(__file__)
+
+# 차트 테마(whitegrid, 한글 폰트)는 mpl_render.seaborn()이 첫 차트를 그릴 때 적용
+
+ACCENT = "#5b8def"
+MUTED  = "#8fa3bf"
+
+def annotate_bar(ax):
+    for p in ax.patches:
+        h = p.get_height()
+        if pd.isna(h): continue
+        ax.annotate(f"{int(h):,}", (p.get_x()+p.get_width()/2, h),
+                    ha="center", va="bottom", fontsize=9, color="#333", xytext=(0,3), textcoords="offset points")
+
+def percent_axis(ax):
+    from matplotlib.ticker import PercentFormatter
+    ax.yaxis.set_major_formatter(PercentFormatter(1.0))
+def to_mmss(x):
+    if pd.isna(x): return ""
+    x=float(x); m=int(x//60); s=int(round(x%60)); return f"{m:02d}:{s:02d}"
+def top_tracks(d, cols, ascending):
+    # 메모된 결과는 세션 간 공유되므로 mm:ss 컬럼까지 여기서 만들어 둔다 (받은 쪽에서 수정 금지)
+    out = d.sort_values("duration_sec", ascending=ascending).head(10)[cols].copy()
+    if "duration_sec" in out: out["mm:ss"] = out["duration_sec"].map(to_mmss)
+    return out
+
+# ===================== 차트 빌더 =====================
+# mpl_render.py 워커 스레드에서 실행된다. pyplot 대신 넘겨받은 ax에만 그리고,
+# 결과 PNG는 (데이터 지문, 파라미터) 키로 캐시된다. seaborn은 첫 차트 때 import.
+def yearly_chart(ax, yearly):
+    sns = mpl_render.seaborn()
+    sns.lineplot(x="release_year", y="avg_duration", data=yearly, marker="o", label="평균", ax=ax)
+    sns.lineplot(x="release_year", y="track_count", data=yearly, marker="o", label="곡 수", ax=ax)
+    ax.set_xlabel("연도"); ax.set_ylabel("")
+    ax.legend(loc="upper left")
+
+def duration_hist(ax, d):
+    sns = mpl_render.seaborn()
+    sns.histplot(d["duration_sec"].dropna(), bins=30, kde=True, color=ACCENT, ax=ax)
+    ax.set_xlabel("길이(초)"); ax.set_ylabel("곡 수")
+
+def length_by_year_chart(ax, yr):
+    sns = mpl_render.seaborn()
+    sns.lineplot(x="release_year", y="mean", data=yr, marker="o", label="평균", color=ACCENT, ax=ax)
+    sns.lineplot(x="release_year", y="median", data=yr, marker="o", label="중앙", color=MUTED, ax=ax)
+    ax.set_xlabel("연도"); ax.set_ylabel("초"); ax.legend()
+
+def explicit_pie(ax, counts):
+    labels = ["Explicit" if b else "Clean" for b in counts["explicit"]]
+    ax.pie(counts["count"], labels=labels, autopct="%1.1f%%", startangle=90)
+    ax.axis("equal")
+
+def explicit_by_year_chart(ax, exp_year):
+    sns = mpl_render.seaborn()
+    sns.lineplot(x="release_year", y="explicit", data=exp_year, marker="o", color=ACCENT, ax=ax)
+    ax.set_xlabel("연도"); ax.set_ylabel("Explicit 비율")
+    percent_axis(ax)
+
+def pair_bar(ax, pair_counts):
+    sns = mpl_render.seaborn()
+    sns.barplot(x=pair_counts["pair_role"], y=pair_counts["count"], color="#c9d7f2", ax=ax)
+    ax.set_xlabel("역할"); ax.set_ylabel("곡 수")
+    annotate_bar(ax)
+
+def role_bar(ax, role_summary):
+    sns = mpl_render.seaborn()
+    sns.barplot(x="role", y="track_count", data=role_summary, hue="role",
+                dodge=False, legend=False, palette="Set2", ax=ax)
+    ax.set_xlabel("역할"); ax.set_ylabel("곡 수")
+    annotate_bar(ax)
+
+def album_bar(ax, top_albums):
+    sns = mpl_render.seaborn()
+    sns.barplot(y="album_name", x="track_count", data=top_albums, color="#d9e6ff", ax=ax)
+    ax.set_xlabel("곡 수"); ax.set_ylabel("앨범")
+    for p in ax.patches:
+        w = p.get_width()
+        ax.annotate(f"{int(w)}", (w, p.get_y()+p.get_height()/2),
+                    va="center", ha="left", fontsize=9, xytext=(3,0), textcoords="offset points")
+
+# ===================== UI =====================
+st.markdown(
+    """
+    <style>
+      .big-title {font-size: 28px; font-weight: 800; margin-bottom: 0.2rem;}
+      .subtle   {color: #6b7a90; font-size: 13px;}
+      .card {background: #f8fafc; border: 1px solid #eef2f7; padding: 14px 16px; border-radius: 12px;}
+      .section-title {font-size: 20px; font-weight: 700; margin: 12px 0 4px 0;}
+    </style>
+    """,
+    unsafe_allow_html=True
+)
+
+# --- 큐레이션 데이터셋 로드 (파생 컬럼은 적재 시 한 번만 계산, curated.py) ---
+if not os.path.exists(curated.CURATED_PATH):
+    st.error(f"'{curated.CURATED_PATH}' 파일을 찾을 수 없습니다. spotify_collector.py로 데이터를 먼저 수집하세요.")
+    st.stop()
+
+with profiler.section("데이터 로드"):
+    base = curated.load()
+with st.sidebar:
+    artist = st.selectbox("아티스트", curated.artists(base))
+
+df = curated.for_artist(base, artist)
+version = registry.token_of(df)
+
+st.markdown(f'<div class="big-title">🎶 {artist} 트랙 분석 대시보드</div>', unsafe_allow_html=True)
+st.markdown('<div class="subtle">큐레이션 데이터셋(`data/kpop_2010_2025_curated.csv`)에서 선택한 아티스트의 트랙을 분석합니다.</div>', unsafe_allow_html=True)
+
+
+# ===================== 사이드바 필터 =====================
+with st.sidebar:
+    st.header("🔎 필터")
+    if "release_year" in df.columns and df["release_year"].notna().any():
+        y_min, y_max = int(np.nanmin(df["release_year"])), int(np.nanmax(df["release_year"]))
+        year_range = st.slider("연도 범위", y_min, y_max, (y_min, y_max))
+    else:
+        year_range = (None, None)
+
+    # 역할이 하나뿐이면(크레딧 없는 CSV → 전부 unknown) 필터를 보이지 않는다 — curated.has_roles
+    show_roles = curated.has_roles(df)
+    roles = sorted(df.get("role", pd.Series(["unknown"])).fillna("unknown").unique().tolist())
+    role_sel = st.multiselect("역할 선택", roles, default=roles) if show_roles else roles
+
+    exp_map = {"모두": "all", "Explicit만": "exp", "Clean만": "clean"}
+    exp_choice = st.radio("Explicit 필터", list(exp_map.keys()), index=0, horizontal=True)
+    exp_mode = exp_map[exp_choice]
+
+    kw = st.text_input("제목/앨범/아티스트 검색", value="")
+
+# ---- 필터 적용 ----
+filt = {"years": year_range, "roles": role_sel, "exp": exp_mode, "kw": kw}
+def memo(name, fn):
+    # 탭별 집계는 (데이터 버전, 필터 상태)가 같으면 재사용
+    return tab_memo(f"p04.{name}", version, filt, fn)
+
+with profiler.section("필터 적용"):
+    df_f = df  # 아래 필터는 모두 새 프레임을 만들므로 공유 프레임을 복사할 필요 없음
+    if year_range != (None, None) and "release_year" in df_f.columns:
+        df_f = df_f[df_f["release_year"].between(year_range[0], year_range[1], inclusive="both")]
+    if "role" in df_f.columns:
+        df_f = df_f[df_f["role"].fillna("unknown").isin(role_sel)]
+    if exp_mode != "all" and "explicit" in df_f.columns:
+        df_f = df_f[df_f["explicit"] == (exp_mode == "exp")]
+    if kw:
+        # 전체 데이터셋에 한 번 만든 n-gram 색인으로 찾고(text_index.py), 현재 필터 결과와 교집합
+        cols = [c for c in ["track_name","album_name","artists_primary","name_normalized"] if c in df.columns]
+        if cols:
+            hits = text_index.search_frame(df, cols, kw)
+            df_f = df_f[df_f.index.isin(hits)]
+
+# ===================== KPI =====================
+st.markdown('<div class="section-title">요약 KPI</div>', unsafe_allow_html=True)
+k1, k2, k3, k4 = st.columns(4)
+with k1:
+    st.markdown('<div class="card">', unsafe_allow_html=True)
+    st.metric("총 곡 수", f"{len(df_f):,}")
+    st.markdown('</div>', unsafe_allow_html=True)
+if "duration_sec" in df_f.columns and len(df_f):
+    with k2:
+        st.markdown('<div class="card">', unsafe_allow_html=True)
+        st.metric("평균 길이(초)", f"{df_f['duration_sec'].mean():.1f}")
+        st.caption(f"≈ {to_mmss(df_f['duration_sec'].mean())}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    with k3:
+        st.markdown('<div class="card">', unsafe_allow_html=True)
+        st.metric("중앙 길이(초)", f"{df_f['duration_sec'].median():.1f}")
+        st.caption(f"≈ {to_mmss(df_f['duration_sec'].median())}")
+        st.markdown('</div>', unsafe_allow_html=True)
+if "explicit" in df_f.columns and len(df_f):
+    with k4:
+        st.markdown('<div class="card">', unsafe_allow_html=True)
+        st.metric("Explicit 비율", f"{df_f['explicit'].mean()*100:.1f}%")
+        st.caption("필터 조건 반영")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+# ===================== 탭 =====================
+tab_overview, tab_length, tab_explicit, tab_roles, tab_albums = lazy_tabs(
+    ["📋 개요", "⏱ 길이 분석", "🔞 Explicit", "🎤 역할", "💿 앨범"], key="p04_tabs"
+)
+
+# ---------- 개요 ----------
+with tab_overview:
+    if tab_overview.open:
+        st.markdown("#### 데이터 미리보기")
+        st.dataframe(df_f.head(50), use_container_width=True)
+        st.caption(f"행: {len(df_f):,}  |  컬럼: {len(df_f.columns)}")
+
+        if {"release_year","duration_sec"}.issubset(df_f.columns) and len(df_f):
+            yearly = memo("yearly", lambda: query.aggregate(df_f, "release_year", {
+                "track_count": ("track_name", "count"),
+                "avg_duration": ("duration_sec", "mean"),
+            }))
+
+            c1, c2 = st.columns([1.2, 1])
+            with c1:
+                st.image(mpl_render.render_png(yearly_chart, yearly, figsize=(9, 4.6)), width="stretch")
+
+            with c2:
+                st.markdown("**연도별 핵심 수치**")
+                st.dataframe(yearly.style.format({"avg_duration":"{:.1f}"}), use_container_width=True)
+        else:
+            st.info("연도/길이 정보가 부족해 개요 그래프를 만들 수 없습니다.")
+
+# ---------- 길이 분석 ----------
+with tab_length:
+    if tab_length.open:
+        if "duration_sec" in df_f.columns and len(df_f):
+            st.markdown("#### 길이 분포")
+            c1, c2 = st.columns([1,1])
+            # 두 차트를 먼저 워커에 넘겨 동시에 그리고, 결과는 순서대로 표시
+            hist_png = mpl_render.submit(duration_hist, df_f[["duration_sec"]])
+            if "release_year" in df_f.columns:
+                yr = memo("length_by_year", lambda: query.aggregate(df_f, "release_year", {
+                    "mean": ("duration_sec", "mean"), "median": ("duration_sec", "median")}))
+                yr_png = mpl_render.submit(length_by_year_chart, yr)
+            with c1:
+                st.image(hist_png.result(), width="stretch")
+
+            if "release_year" in df_f.columns:
+                with c2:
+                    st.markdown("**연도별 평균/중앙 길이**")
+                    st.image(yr_png.result(), width="stretch")
+
+            st.markdown("#### 최장/최단 트랙 Top 10")
+            cols = [c for c in ["track_name","duration_sec","explicit","release_year","role","album_name","external_url"]
+                    if c in df_f.columns and (c != "role" or show_roles)]
+            if cols:
+                left, right = st.columns(2)
+                with left:
+                    st.markdown("**최장 Top 10**")
+                    top_long = memo("top_long", lambda: top_tracks(df_f, cols, ascending=False))
+                    st.dataframe(top_long, use_container_width=True)
+                with right:
+                    st.markdown("**최단 Top 10**")
+                    top_short = memo("top_short", lambda: top_tracks(df_f, cols, ascending=True))
+                    st.dataframe(top_short, use_container_width=True)
+            else:
+                st.info("표시 가능한 컬럼이 부족합니다.")
+        else:
+            st.info("duration_sec 컬럼이 없어 길이 분석을 표시할 수 없습니다.")
+
+# ---------- Explicit ----------
+with tab_explicit:
+    if tab_explicit.open:
+        if "explicit" in df_f.columns and len(df_f):
+            st.markdown("#### Explicit vs Clean")
+            c1, c2 = st.columns([1,1])
+            counts = memo("explicit_counts", lambda: df_f["explicit"].value_counts(dropna=False).reset_index())
+            pie_png = mpl_render.submit(explicit_pie, counts, figsize=(5.6, 5.6))
+            if "release_year" in df_f.columns:
+                exp_year = memo("explicit_by_year", lambda: query.aggregate(df_f, "release_year", {"explicit": ("explicit", "mean")}))
+                exp_png = mpl_render.submit(explicit_by_year_chart, exp_year)
+            with c1:
+                st.image(pie_png.result(), width="stretch")
+            if "release_year" in df_f.columns:
+                with c2:
+                    st.markdown("**연도별 Explicit 비율**")
+                    st.image(exp_png.result(), width="stretch")
+
+            if {"has_clean_explicit_pair","pair_role","clean_pair_group"}.issubset(df_f.columns):
+                st.markdown("#### 클린·익스플리싯 페어링")
+                pairs = df_f[df_f["has_clean_explicit_pair"] == True].copy()
+                if len(pairs):
+                    pair_counts = pairs["pair_role"].value_counts().reindex(["clean","explicit"]).fillna(0)
+                    pair_counts = pair_counts.rename_axis("pair_role").reset_index(name="count")
+                    st.image(mpl_render.render_png(pair_bar, pair_counts, figsize=(6.5, 3.6)), width="stretch")
+                else:
+                    st.info("감지된 클린·익스플리싯 페어가 없습니다.")
+        else:
+            st.info("explicit 컬럼이 없어 분석을 표시할 수 없습니다.")
+
+# ---------- 역할 ----------
+with tab_roles:
+    if tab_roles.open:
+        if not show_roles:
+            if "artists_all" in df.columns:
+                st.info(f"{artist}의 트랙은 모두 같은 역할이라 역할별로 나눌 수 없습니다.")
+            else:
+                st.info("이 데이터셋에는 트랙 크레딧(artists_all)이 없어 primary/featuring/other를 구분할 수 없습니다. "
+                        "`spotify_collector.py`로 다시 수집하면 역할 분석이 표시됩니다.")
+        elif len(df_f):
+            st.markdown("#### 역할별 요약")
+            role_metrics = {"track_count": ("track_name", "count")}
+            if "explicit" in df_f.columns: role_metrics["explicit_ratio"] = ("explicit", "mean")
+            if "duration_sec" in df_f.columns: role_metrics["avg_duration"] = ("duration_sec", "mean")
+            role_summary = memo("roles", lambda: query.aggregate(df_f, "role", role_metrics)
+                                .sort_values("track_count", ascending=False))
+
+
+            c1, c2 = st.columns([1,1])
+            with c1:
+                st.dataframe(role_summary.style.format({"explicit_ratio":"{:.1%}", "avg_duration":"{:.1f}"}), use_container_width=True)
+            with c2:
+                st.image(mpl_render.render_png(role_bar, role_summary, figsize=(7.5, 4)), width="stretch")
+        else:
+            st.info("필터 조건에 맞는 트랙이 없습니다.")
+
+# ---------- 앨범 ----------
+with tab_albums:
+    if tab_albums.open:
+        if "album_name" in df_f.columns and len(df_f):
+            st.markdown("#### 앨범별 요약")
+            group_cols = ["album_name"]
+            if "release_year" in df_f.columns: group_cols.append("release_year")
+            album_metrics = {"track_count": ("track_name", "count")}
+            if "duration_sec" in df_f.columns: album_metrics["avg_duration"] = ("duration_sec", "mean")
+            if "explicit" in df_f.columns: album_metrics["explicit_ratio"] = ("explicit", "mean")
+            sort_cols = [c for c in ["track_count", "avg_duration"] if c in album_metrics]
+            album_sum = memo("albums", lambda: query.aggregate(df_f, group_cols, album_metrics)
+                             .sort_values(sort_cols, ascending=[False, True][:len(sort_cols)]))
+
+
+            st.dataframe(album_sum.head(30).style.format({"avg_duration":"{:.1f}","explicit_ratio":"{:.2%}"}),
+                         use_container_width=True)
+
+            topN = st.slider("상위 앨범 N", 5, 20, 10, key="album_slider")
+            top_albums = album_sum.head(topN)
+            st.image(mpl_render.render_png(album_bar, top_albums, figsize=(9, 4.5)), width="stretch")
+        else:
+            st.info("album_name 컬럼이 없어 앨범 분석을 표시할 수 없습니다.")
\ No newline at end of file
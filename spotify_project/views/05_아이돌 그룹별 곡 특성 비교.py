@@ -0,0 +1,223 @@
+# views/05_아이돌 그룹별 곡 특성 비교.py
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import loaders  # 데이터 로더는 loaders.py (워밍업과 캐시 공유)
+import exports
+import markets
+import profiler
+import query
+from lazy_tabs import remember_load, dataset_version, lazy_tabs, tab_memo
+
+st.set_page_config(page_title="아이돌 그룹별 곡 특성 비교", page_icon="✨", layout="wide")
+profiler.page(__file__)
+st.title("✨ 아이돌 그룹별 곡 특성 비교")
+
+# ---------------- UI ----------------
+artists_text = st.text_input(
+    "아티스트(그룹) 이름을 콤마(,)로 구분해 입력하세요",
+    value=loaders.P05_TEXT,
+    placeholder="예: IU, TWICE, IVE"
+)
+limit = st.slider("아티스트당 가져올 곡 수", 5, 200, 25, step=5)
+market_opt = st.selectbox(
+    "시장(market) 필터(선택)", 
+    options=["전체(미지정)", "KR", "US", "JP", "GB", "DE", "FR", "BR"],
+    index=0,
+    help="곡별 available_markets로 로컬에서 거릅니다 (시장마다 다시 수집하지 않음)"
+)
+market = None if market_opt == "전체(미지정)" else market_opt
+
+# ---------------- Run ----------------
+clicked = st.button("불러오기", use_container_width=True)
+# 입력 파싱
+groups = [g.strip() for g in artists_text.split(",") if g.strip()]
+groups = list(dict.fromkeys(groups))  # 중복 제거, 순서 유지
+params = remember_load("p05_params", clicked, {"groups": tuple(groups), "limit": limit, "market": market})
+if clicked and params["groups"]:
+    loaders.record("p05", params)
+
+if params:
+    if not params["groups"]:
+        st.warning("아티스트 이름을 1개 이상 입력하세요.")
+        st.stop()
+
+    data = loaders.run("p05", params)
+    version = dataset_version(data, "p05", params)
+
+    if data.empty:
+        st.warning("데이터를 가져오지 못했습니다. 아티스트 이름/네트워크 상태/market 옵션을 확인하세요.")
+        st.stop()
+
+    # ── 상단 KPI ──
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("총 곡 수", f"{len(data)}")
+    c2.metric("그룹 수", f"{data['main_artist'].nunique()}")
+    c3.metric("평균 인기도", f"{data['popularity'].dropna().mean():.1f}")
+    c4.metric("평균 곡 길이(분)", f"{data['duration_min'].dropna().mean():.2f}")
+
+    st.divider()
+
+    # ── 탭 구성 (선택된 탭만 계산, 결과는 버전별 메모) ──
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = lazy_tabs([
+        "① 그룹별 평균 지표",
+        "② 연도별 발매 추세",
+        "③ 곡 길이 분포",
+        "④ 앨범 유형/수록곡",
+        "⑤ 인기도 TOP 10",
+        "⑥ 원본/다운로드",
+        "⑦ Explicit 비율 & 인기",
+        "⑧ 발매 월/분기 패턴",
+        "⑨ 협업곡 비중",
+    ], key="p05_tabs")
+
+    # ① 그룹별 평균 지표
+    with tab1:
+        if tab1.open:
+            def _meta_avg():
+                meta_avg = query.aggregate(data, "main_artist", {
+                    "평균인기도": ("popularity", "mean"),
+                    "평균길이_분": ("duration_min", "mean"),
+                }).round(2)
+                return (px.bar(meta_avg, x="main_artist", y="평균인기도", title="그룹별 평균 인기도"),
+                        px.bar(meta_avg, x="main_artist", y="평균길이_분", title="그룹별 평균 곡 길이(분)"))
+            fig_pop, fig_len = tab_memo("p05.meta_avg", version, None, _meta_avg)
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.plotly_chart(fig_pop, use_container_width=True)
+            with col_b:
+                st.plotly_chart(fig_len, use_container_width=True)
+
+    # ② 연도별 발매 추세
+    with tab2:
+        if tab2.open:
+            def _yearly():
+                yearly = query.aggregate(data, ["release_year","main_artist"], {"count": ("track_name", "count")})
+                if yearly.empty:
+                    return None
+                return px.line(yearly, x="release_year", y="count", color="main_artist",
+                               markers=True, title="연도별 곡 수(그룹별)")
+            fig = tab_memo("p05.yearly", version, None, _yearly)
+            if fig is None:
+                st.info("연도 정보가 부족합니다.")
+            else:
+                st.plotly_chart(fig, use_container_width=True)
+
+    # ③ 곡 길이 분포
+    with tab3:
+        if tab3.open:
+            def _length_box():
+                len_df = data.dropna(subset=["duration_min"])
+                if len_df.empty:
+                    return None
+                return px.box(len_df, x="main_artist", y="duration_min",
+                              points="suspectedoutliers",
+                              title="그룹별 곡 길이 분포(분)")
+            fig = tab_memo("p05.length", version, None, _length_box)
+            if fig is None:
+                st.info("곡 길이 정보가 부족합니다.")
+            else:
+                st.plotly_chart(fig, use_container_width=True)
+
+    # ④ 앨범 유형/수록곡
+    with tab4:
+        if tab4.open:
+            def _album_types():
+                atype = query.aggregate(data, ["main_artist","album_type"], {"count": ("track_name", "count")},
+                                        fill={"album_type": "unknown"})
+                fig_type = px.bar(atype, x="main_artist", y="count", color="album_type",
+                                  title="그룹별 앨범 유형 분포", barmode="stack")
+
+                album_unique = data.drop_duplicates("album_id").copy()
+                album_unique["album_total_tracks"] = album_unique["album_total_tracks"].fillna(0)
+                fig_tracks = px.box(album_unique, x="main_artist", y="album_total_tracks",
+                                    points="suspectedoutliers", title="그룹별 앨범 수록곡 수 분포")
+                return fig_type, fig_tracks
+            fig_type, fig_tracks = tab_memo("p05.album_types", version, None, _album_types)
+            st.plotly_chart(fig_type, use_container_width=True)
+            st.plotly_chart(fig_tracks, use_container_width=True)
+
+    # ⑤ 인기도 TOP 10
+    with tab5:
+        if tab5.open:
+            top10 = tab_memo("p05.top10", version, None, lambda: (
+                data[["main_artist","track_name","album_name","album_release_date","popularity"]]
+                    .dropna(subset=["popularity"])
+                    .sort_values("popularity", ascending=False)
+                    .head(10)))
+            st.dataframe(top10, use_container_width=True)
+
+    # ⑥ 원본/다운로드
+    with tab6:
+        if tab6.open:
+            exports.download_button("📥 전체 데이터 다운로드", data, "idol_groups_comparison",
+                                    key="p05_dl_full", use_container_width=True,
+                                    columns=[c for c in data.columns if c not in markets.COLS])
+            with st.expander("원본 데이터 미리보기"):
+                st.dataframe(
+                    data[[
+                        "main_artist","track_name","album_name","album_release_date",
+                        "popularity","duration_min","album_type","album_total_tracks"
+                    ]].sort_values(["main_artist","popularity"], ascending=[True, False]),
+                    use_container_width=True
+                )
+
+    # ⑦ Explicit 비율 & 인기
+    with tab7:
+        if tab7.open:
+            if "explicit" in data.columns:
+                def _explicit():
+                    rate = query.aggregate(data, "main_artist", {"explicit_rate_%": ("explicit", "mean")})
+                    rate["explicit_rate_%"] = rate["explicit_rate_%"].mul(100).round(1)
+                    comp = query.aggregate(data, ["main_artist","explicit"], {"popularity": ("popularity", "mean")}).round(1)
+                    comp["explicit"] = comp["explicit"].map({True:"Explicit", False:"Clean"})
+                    fig = px.bar(comp, x="main_artist", y="popularity", color="explicit",
+                                 barmode="group", title="Explicit 여부별 평균 인기")
+                    return rate, fig
+                rate, fig = tab_memo("p05.explicit", version, None, _explicit)
+                st.subheader("Explicit(비속어) 비율")
+                st.bar_chart(rate.set_index("main_artist")["explicit_rate_%"])
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("explicit 컬럼이 없습니다.")
+
+    # ⑧ 발매 월/분기 패턴
+    with tab8:
+        if tab8.open:
+            def _release_counts(col, title):
+                counts = query.aggregate(data, [col,"main_artist"], {"count": ("track_name", "count")})
+                if counts.empty:
+                    return None
+                return px.bar(counts, x=col, y="count", color="main_artist",
+                              barmode="group", title=title)
+
+            st.subheader("월별 발매 곡 수")
+            fig = tab_memo("p05.month", version, None, lambda: _release_counts("release_month", "월별 발매 곡 수"))
+            if fig is None:
+                st.info("발매 월 정보가 부족합니다.")
+            else:
+                st.plotly_chart(fig, use_container_width=True)
+
+            st.subheader("분기별 발매 곡 수")
+            fig = tab_memo("p05.quarter", version, None, lambda: _release_counts("release_quarter", "분기별 발매 곡 수"))
+            if fig is None:
+                st.info("발매 분기 정보가 부족합니다.")
+            else:
+                st.plotly_chart(fig, use_container_width=True)
+
+    # ⑨ 협업곡 비중
+    with tab9:
+        if tab9.open:
+            def _collab():
+                collab_rate = query.aggregate(data, "main_artist", {"collab_rate_%": ("collab_flag", "share", "협업")})
+                collab_rate["collab_rate_%"] = collab_rate["collab_rate_%"].mul(100).round(1)
+                pop_comp = query.aggregate(data, ["main_artist","collab_flag"], {"popularity": ("popularity", "mean")}).round(1)
+                fig = px.bar(pop_comp, x="main_artist", y="popularity", color="collab_flag",
+                             barmode="group", title="단독/협업 평균 인기 비교")
+                return collab_rate, fig
+            collab_rate, fig = tab_memo("p05.collab", version, None, _collab)
+            st.subheader("협업(피처링 포함) 비중")
+            st.bar_chart(collab_rate.set_index("main_artist")["collab_rate_%"])
+
+            st.subheader("단독 vs 협업 평균 인기도")
+            st.plotly_chart(fig, use_container_width=True)
@@ -1,7 +1,10 @@
-# pages/06_project_reflection.py
+# views/06_project_reflection.py
 import streamlit as st
 
+import profiler
+
 st.set_page_config(page_title="프로젝트 후기", layout="wide")
+profiler.page(__file__)
 
 st.markdown("""
 <h2 style="margin-bottom:16px;">프로젝트 회고: Spotify 메타데이터 수집·대시보드 구축</h2>
@@ -0,0 +1,85 @@
+# views/99_admin_metrics.py — Spotify 호출/캐시 지표 요약 (관리자 전용)
+# METRICS_ADMIN_KEY 환경변수가 설정되어 있고, URL의 ?key= 값이 같을 때만 내용을 보여준다.
+import os
+
+import pandas as pd
+import streamlit as st
+
+import metrics
+import profiler
+import rate_limit
+import warmup
+
+st.set_page_config(page_title="관리자 지표", layout="wide")
+profiler.page(__file__)
+
+admin_key = os.getenv("METRICS_ADMIN_KEY")
+if not admin_key or st.query_params.get("key") != admin_key:
+    st.info("관리자 전용 페이지입니다.")
+    st.stop()
+
+st.title("🔧 Spotify 호출 지표")
+st.caption(f"Prometheus 엔드포인트: http://{metrics.HOST}:{metrics.PORT}/metrics (METRICS_PORT)")
+snap = metrics.snapshot()
+
+# =========================
+# 엔드포인트별 요약
+# =========================
+def quantile_from_buckets(h, q):
+    """히스토그램 버킷에서 분위수가 속한 구간의 상한(초). 마지막 버킷을 넘으면 None(>10s)."""
+    total = h[-1]
+    if not total:
+        return None
+    for le, n in zip(metrics.BUCKETS, h):
+        if n >= q * total:
+            return le
+    return None
+
+rows = []
+for (ep, m), h in snap["latency"].items():
+    by_status = {s: n for (e, mm, s), n in snap["requests"].items() if e == ep and mm == m}
+    rows.append({
+        "endpoint": ep, "method": m, "calls": h[-1],
+        "errors": sum(n for s, n in by_status.items() if not s.startswith("2")),
+        "429": by_status.get("429", 0) + sum(n for (e, s), n in snap["retries"].items() if e == ep and s == "429"),
+        "retries": sum(n for (e, s), n in snap["retries"].items() if e == ep),
+        "mean_ms": round(h[-2] / h[-1] * 1000, 1) if h[-1] else None,
+        "p50≤s": quantile_from_buckets(h, .5), "p95≤s": quantile_from_buckets(h, .95),
+        "total_s": round(h[-2], 2),
+        "KB": round(snap["bytes"].get(ep, 0) / 1024, 1),
+    })
+calls = pd.DataFrame(rows)
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("API 호출", f"{int(calls['calls'].sum()) if not calls.empty else 0:,}")
+c2.metric("429 응답", f"{int(calls['429'].sum()) if not calls.empty else 0:,}")
+c3.metric("속도 제한 대기(초)", f"{rate_limit.shared.stats['waited_sec']:.1f}")
+c4.metric("API 누적 시간(초)", f"{calls['total_s'].sum() if not calls.empty else 0:.1f}")
+
+st.subheader("엔드포인트별 호출")
+if calls.empty:
+    st.info("아직 기록된 호출이 없습니다.")
+else:
+    st.dataframe(calls.sort_values("total_s", ascending=False), use_container_width=True, hide_index=True)
+
+# =========================
+# 캐시 적중률
+# =========================
+st.subheader("캐시 적중률")
+caches = {}
+for (c, r), n in snap["cache"].items():
+    caches.setdefault(c, {"hit": 0, "miss": 0})[r] += n
+if caches:
+    cache_df = pd.DataFrame([{"cache": c, **v, "hit_rate": round(v["hit"] / max(v["hit"] + v["miss"], 1), 3)}
+                             for c, v in caches.items()])
+    st.dataframe(cache_df, use_container_width=True, hide_index=True)
+else:
+    st.info("아직 기록된 캐시 조회가 없습니다.")
+
+# =========================
+# 워밍업 / 원본
+# =========================
+st.subheader("워밍업 상태")
+st.json(warmup.status)
+
+with st.expander("Prometheus 원본 텍스트"):
+    st.code(metrics.render(), language="text")
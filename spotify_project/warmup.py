@@ -0,0 +1,78 @@
+# warmup.py — 기본/자주 요청된 아티스트 조합 미리 불러오기
+# 서버 재시작 직후 첫 사용자가 '불러오기'에서 전체 수집 시간을 떠안지 않도록,
+# 프로세스 시작 시와 일정 주기마다 loaders.run()으로 공유 캐시(shared_loader)를 채운다.
+# 로더 캐시의 ttl이 이 주기와 같으므로(loaders.CACHE_TTL), 주기마다 돌 때 지난 회차에 채운 항목은 이미 만료되어
+# 새로 수집된다 — 사용자는 최대 한 주기 지난 데이터를 보고, 갱신 비용은 워밍업 스레드가 낸다.
+#
+# 환경변수:
+#   WARMUP_INTERVAL_SEC  재실행 주기(초, 기본 21600 = 6시간). 0이면 시작 시 한 번만, 음수면 끔
+#   WARMUP_TOP_K         기본값 외에 추가로 데울 '자주 요청된' 조합 수 (기본 3)
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+
+import loaders
+
+INTERVAL_SEC = loaders.REFRESH_SEC
+TOP_K = int(os.getenv("WARMUP_TOP_K", "3"))
+
+log = logging.getLogger(__name__)
+
+_thread: threading.Thread | None = None
+_lock = threading.Lock()
+status = {"runs": 0, "last_started": None, "last_seconds": None, "ok": [], "failed": []}
+
+
+def jobs(top_k: int = TOP_K) -> list[tuple[str, dict]]:
+    """(페이지, params) 목록 — 페이지 기본값 먼저, 그 다음 요청 횟수 상위 조합 (중복 제거)."""
+    out = list(loaders.DEFAULTS.items())
+    try:
+        out += [(name, params) for name, params, _ in loaders.most_requested(top_k)]
+    except Exception as e:  # 요청 기록이 없거나 저장소를 못 열어도 기본값은 데운다
+        log.warning("warmup: 요청 기록 조회 실패: %s", e)
+    seen, uniq = set(), []
+    for name, params in out:
+        k = loaders._request_key(name, params)
+        if k not in seen:
+            seen.add(k)
+            uniq.append((name, params))
+    return uniq
+
+
+def run_once() -> dict:
+    t0 = time.time()
+    ok, failed = [], []
+    for name, params in jobs():
+        try:
+            df = loaders.run(name, params)
+            ok.append((name, len(df)))
+        except Exception as e:  # 한 조합이 실패해도 나머지는 계속
+            log.warning("warmup: %s %s 실패: %s", name, params, e)
+            failed.append((name, str(e)))
+    status.update(runs=status["runs"] + 1, last_started=t0, last_seconds=round(time.time() - t0, 2),
+                  ok=ok, failed=failed)
+    return status
+
+
+def _loop(interval: float):
+    while True:
+        run_once()
+        if interval <= 0:
+            return
+        time.sleep(interval)
+
+
+def start(interval: float = INTERVAL_SEC) -> threading.Thread | None:
+    """백그라운드 워밍업 스레드 시작 (프로세스당 한 번). 이미 돌고 있으면 그 스레드를 돌려준다."""
+    global _thread
+    if interval < 0:
+        return None
+    with _lock:
+        if _thread is None:
+            # 세션 컨텍스트를 붙이지 않는다 → 로더 안의 st.spinner/st.warning은 화면에 나오지 않는다
+            _thread = threading.Thread(target=_loop, args=(interval,), name="warmup", daemon=True)
+            _thread.start()
+    return _thread